@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
-import uuid
-from datetime import datetime
+import secrets
+import time
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from omniclaw.core.circle_client import CircleClient
 from omniclaw.core.config import Config
-from omniclaw.core.exceptions import InsufficientBalanceError, PaymentError, ValidationError
+from omniclaw.core.exceptions import (
+    IdempotencyError,
+    InsufficientBalanceError,
+    PaymentError,
+    ValidationError,
+)
 from omniclaw.core.types import (
     AccountType,
     AmountType,
@@ -28,26 +39,144 @@ from omniclaw.core.types import (
     TransactionInfo,
     WalletInfo,
     WalletSetInfo,
+    as_decimal,
+    uuid4_str,
 )
 from omniclaw.guards.base import PaymentContext
+from omniclaw.guards.budget import BudgetGuard
+from omniclaw.guards.confirm import ConfirmGuard
 from omniclaw.guards.manager import GuardManager
+from omniclaw.guards.rate_limit import RateLimitGuard
+from omniclaw.guards.recipient import RecipientGuard
+from omniclaw.guards.single_tx import SingleTxGuard
+from omniclaw.intents.idempotency import IdempotencyRecord, IdempotencyService, IdempotencyStatus
 from omniclaw.intents.intent_facade import PaymentIntentFacade
 from omniclaw.intents.reservation import ReservationService
-from omniclaw.intents.service import PaymentIntentService
 from omniclaw.ledger import Ledger, LedgerEntry, LedgerEntryStatus
 from omniclaw.ledger.lock import FundLockService
-from omniclaw.payment.batch import BatchProcessor
-from omniclaw.payment.router import PaymentRouter
-from omniclaw.protocols.gateway import GatewayAdapter
-from omniclaw.protocols.transfer import TransferAdapter
-from omniclaw.protocols.x402 import X402Adapter
 from omniclaw.resilience.circuit import CircuitBreaker, CircuitOpenError
 from omniclaw.resilience.retry import execute_with_retry
 from omniclaw.storage import get_storage
 from omniclaw.trust.gate import TrustGate
 from omniclaw.identity.types import TrustCheckResult, TrustPolicy, TrustVerdict
 from omniclaw.wallet.service import WalletService
-from omniclaw.webhooks import WebhookParser
+
+if TYPE_CHECKING:
+    from omniclaw.intents.service import PaymentIntentService
+    from omniclaw.payment.batch import BatchProcessor
+    from omniclaw.payment.router import PaymentRouter
+    from omniclaw.protocols.base import ProtocolAdapter
+    from omniclaw.webhooks import WebhookParser
+
+# How long an approved simulate() trust verdict may be reused by pay()
+_SIM_CACHE_TTL = 5.0
+
+# Background payment queue (PaymentStrategy.QUEUE_BACKGROUND) sizing
+_BG_QUEUE_SIZE = 1000
+_BG_WORKERS = 5
+
+# Queued payment awaiting bookkeeping: (ledger entry, guard chain, guard tokens, intent ID)
+_QueuedPayment = tuple[LedgerEntry, Any, list[tuple[str, str | None]], str]
+
+# Optimistic-concurrency retries for create_payment_intent reservations
+_INTENT_CAS_ATTEMPTS = 3
+_INTENT_CAS_BACKOFF = 0.05
+
+# Enum values resolved once instead of via the `.value` descriptor per payment
+_STRATEGY_VALUE: dict[PaymentStrategy, str] = {s: s.value for s in PaymentStrategy}
+
+# Terminal provider transaction states and the ledger status they map to
+_STATE_MAP: dict[str, LedgerEntryStatus] = {
+    "COMPLETE": LedgerEntryStatus.COMPLETED,
+    "FAILED": LedgerEntryStatus.FAILED,
+    "CANCELLED": LedgerEntryStatus.CANCELLED,
+}
+
+# Intent metadata keys that are not forwarded to pay() as routing kwargs
+_INTERNAL_META_KEYS = frozenset({"purpose", "idempotency_key", "simulated_route"})
+
+
+def _request_hash(
+    wallet_id: str,
+    recipient: str,
+    amount: Decimal,
+    purpose: str | None,
+    expires_in: int | None,
+    extra: dict[str, Any],
+) -> str:
+    """Fingerprint request parameters for idempotency conflict detection."""
+    # Fixed fields are joined directly; only caller-supplied extras need a
+    # canonical JSON encoding. Hashed as one buffer in a single sha256 call.
+    payload = "\x1f".join(
+        (
+            wallet_id,
+            recipient,
+            str(amount),
+            purpose or "",
+            "" if expires_in is None else str(expires_in),
+        )
+    )
+    if extra:
+        payload += "\x1f" + json.dumps(extra, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# Wall-clock second last formatted by _now_iso() and its "YYYY-MM-DDTHH:MM:SS"
+# prefix, swapped as one tuple so concurrent callers never pair mismatched halves
+_LAST_TS: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as naive datetime.utcnow().isoformat() text (no offset).
+
+    The date-time prefix is formatted once per wall-clock second and reused,
+    so bursts of calls only format the microsecond suffix.
+    """
+    global _LAST_TS
+    sec, micros = divmod(time.time_ns() // 1_000, 1_000_000)
+    last = _LAST_TS
+    if last[0] != sec:
+        last = _LAST_TS = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+    if micros:
+        return f"{last[1]}.{micros:06d}"
+    # isoformat() omits a zero fraction
+    return last[1]
+
+
+def _as_network(value: Network | str | None) -> Network | None:
+    """Coerce a network argument to Network once, at the SDK boundary."""
+    if value is None or isinstance(value, Network):
+        return value
+    try:
+        return Network.from_string(value)
+    except ValueError as e:
+        raise ValidationError(str(e)) from e
+
+
+def _as_fee_level(value: FeeLevel | str) -> FeeLevel:
+    """Coerce a fee level argument to FeeLevel once, at the SDK boundary."""
+    if isinstance(value, FeeLevel):
+        return value
+    try:
+        return FeeLevel(value.upper())
+    except ValueError as e:
+        raise ValidationError(f"Unknown fee level: {value}") from e
+
+
+def _simulated_method(route: str | None) -> PaymentMethod | None:
+    """Map an intent's stored simulated_route back to a PaymentMethod, if valid."""
+    try:
+        return PaymentMethod(route) if route else None
+    except ValueError:
+        return None
+
+
+def _enum_value(value: Any) -> str | None:
+    """Return an enum member's value, str() of a plain value, or None."""
+    if value is None:
+        return None
+    return getattr(value, "value", None) or str(value)
 
 
 class OmniClaw:
@@ -92,7 +221,7 @@ class OmniClaw:
 
         configure_logging(level=log_level)
         self._logger = get_logger("client")
-        self._logger.info(f"Initializing OmniClaw SDK (Network: {network.value})")
+        self._logger.info("Initializing OmniClaw SDK (Network: %s)", network.value)
 
         if not circle_api_key:
             circle_api_key = os.environ.get("CIRCLE_API_KEY")
@@ -132,16 +261,13 @@ class OmniClaw:
             self._circle_client,
         )
 
-        self._router = PaymentRouter(self._config, self._wallet_service)
-        self._router.register_adapter(TransferAdapter(self._config, self._wallet_service))
-        self._router.register_adapter(X402Adapter(self._config, self._wallet_service))
-        self._router.register_adapter(GatewayAdapter(self._config, self._wallet_service))
+        # Router/adapters, batch processor, intent service and webhook parser
+        # are built on first use (see the cached properties below)
+        self._closables: list[ProtocolAdapter] = []
 
-        self._intent_service = PaymentIntentService(self._storage)
         self._reservation = ReservationService(self._storage)
+        self._idempotency = IdempotencyService(self._storage)
         self._intent_facade = PaymentIntentFacade(self)
-        self._batch_processor = BatchProcessor(self._router)
-        self._webhook_parser = WebhookParser()
 
         # Initialize Trust Gate (ERC-8004)
         if isinstance(trust_policy, str):
@@ -155,12 +281,65 @@ class OmniClaw:
             rpc_url=rpc_url,
         )
 
+        # Trust verdicts from recent simulate() calls, reused by a follow-up pay()
+        self._sim_cache: dict[tuple[str, str, Decimal], tuple[float, TrustCheckResult]] = {}
+
+        # Provider transaction lookups in flight, shared by concurrent syncs
+        self._sync_inflight: dict[str, asyncio.Task[TransactionInfo]] = {}
+
+        # Background payment queue, started lazily on first QUEUE_BACKGROUND use
+        self._bg_queue: asyncio.Queue[_QueuedPayment] | None = None
+        self._bg_loop: asyncio.AbstractEventLoop | None = None
+        self._bg_workers: list[asyncio.Task[None]] = []
+
         # Initialize Resilience
         self._circuit_breakers = {
             "default": CircuitBreaker("default", self._storage),
             "circle_api": CircuitBreaker("circle_api", self._storage),
         }
 
+    @functools.cached_property
+    def _router(self) -> PaymentRouter:
+        """Payment router with the built-in adapters, built on first use."""
+        # Deferred: the protocol adapters pull in httpx and the x402/gateway stacks
+        from omniclaw.payment.router import PaymentRouter
+        from omniclaw.protocols.gateway import GatewayAdapter
+        from omniclaw.protocols.transfer import TransferAdapter
+        from omniclaw.protocols.x402 import X402Adapter
+
+        router = PaymentRouter(self._config, self._wallet_service)
+        for adapter_cls in (TransferAdapter, X402Adapter, GatewayAdapter):
+            self._register_adapter(adapter_cls(self._config, self._wallet_service), router)
+        return router
+
+    @functools.cached_property
+    def _batch_processor(self) -> BatchProcessor:
+        from omniclaw.payment.batch import BatchProcessor
+
+        return BatchProcessor(self._router)
+
+    @functools.cached_property
+    def _intent_service(self) -> PaymentIntentService:
+        from omniclaw.intents.service import PaymentIntentService
+
+        return PaymentIntentService(self._storage)
+
+    @functools.cached_property
+    def _webhook_parser(self) -> WebhookParser:
+        from omniclaw.webhooks import WebhookParser
+
+        return WebhookParser()
+
+    def _register_adapter(
+        self, adapter: ProtocolAdapter, router: PaymentRouter | None = None
+    ) -> None:
+        """Register an adapter with the router, tracking it if it holds resources."""
+        from omniclaw.protocols.base import ProtocolAdapter
+
+        (router or self._router).register_adapter(adapter)
+        if type(adapter).close is not ProtocolAdapter.close:
+            self._closables.append(adapter)
+
     @property
     def config(self) -> Config:
         """Get SDK configuration."""
@@ -204,13 +383,31 @@ class OmniClaw:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit — clean up resources."""
-        # Close Trust Gate (HTTP clients for metadata fetching)
-        await self._trust_gate.close()
-        # Close any HTTP clients held by protocol adapters
-        for adapter in self._router.get_adapters():
-            client = getattr(adapter, "_http_client", None)
-            if client and hasattr(client, "aclose"):
-                await client.aclose()
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Shut the client down and release its resources.
+
+        Waits for queued background payments to be persisted, then closes the
+        Trust Gate, protocol adapter HTTP clients and this client's share of
+        the Circle SDK connection pool. Safe to call more than once.
+        """
+        # Let queued background payments finish persisting, then stop workers
+        if self._bg_queue is not None and self._bg_loop is asyncio.get_running_loop():
+            await self._bg_queue.join()
+        for worker in self._bg_workers:
+            worker.cancel()
+        self._bg_workers = []
+        self._bg_queue = None
+
+        # Close Trust Gate, protocol adapter and Circle HTTP clients together
+        await asyncio.gather(
+            self._trust_gate.close(),
+            *(adapter.close() for adapter in self._closables),
+            self._circle_client.aclose(),
+            return_exceptions=True,
+        )
 
     async def get_balance(self, wallet_id: str) -> Decimal:
         """Get USDC balance for a wallet."""
@@ -237,7 +434,7 @@ class OmniClaw:
         """
         if not wallet_set_id:
             # Create a new set automatically
-            set_name = name or f"set-{uuid.uuid4().hex[:8]}"
+            set_name = name or f"set-{secrets.token_hex(4)}"
             wallet_set = self._wallet_service.create_wallet_set(name=set_name)
             wallet_set_id = wallet_set.id
 
@@ -316,15 +513,16 @@ class OmniClaw:
         if not wallet_id:
             raise ValidationError("wallet_id is required")
 
-        amount_decimal = Decimal(str(amount))
+        amount_decimal = as_decimal(amount)
         if amount_decimal <= 0:
             raise ValidationError(f"Payment amount must be positive. Got: {amount_decimal}")
 
-        idempotency_key = idempotency_key or str(uuid.uuid4())
+        # Adapters compare and read these as enums, so normalize them up front
+        destination_chain = _as_network(destination_chain)
+        fee_level = _as_fee_level(fee_level)
 
-        meta = metadata or {}
-        meta["idempotency_key"] = idempotency_key
-        meta["strategy"] = strategy.value
+        # Circle requires idempotency keys in UUID v4 format
+        idempotency_key = idempotency_key or uuid4_str()
 
         # ── Trust Gate Check (ERC-8004) ──────────────────────────────
         # check_trust=None → auto (enabled if trust_gate configured and guards not skipped)
@@ -332,39 +530,47 @@ class OmniClaw:
         # check_trust=False → skip trust check
         run_trust = check_trust if check_trust is not None else (not skip_guards)
         trust_result: TrustCheckResult | None = None
+        trust_info: dict[str, Any] | None = None
         if self._trust_gate and run_trust:
-            trust_result = await self._trust_gate.evaluate(
-                recipient_address=recipient,
-                amount=amount_decimal,
-                wallet_id=wallet_id,
-            )
-            meta["trust"] = trust_result.to_dict()
-
-            if trust_result.verdict == TrustVerdict.BLOCKED:
-                return PaymentResult(
-                    success=False,
-                    transaction_id=None,
-                    blockchain_tx=None,
+            trust_result = self._pop_simulated_trust(wallet_id, recipient, amount_decimal)
+            if trust_result is None:
+                trust_result = await self._trust_gate.evaluate(
+                    recipient_address=recipient,
                     amount=amount_decimal,
-                    recipient=recipient,
-                    method=PaymentMethod.TRANSFER,
-                    status=PaymentStatus.BLOCKED,
-                    error=f"Trust Gate blocked: {trust_result.block_reason}",
-                    metadata={"trust": trust_result.to_dict()},
+                    wallet_id=wallet_id,
                 )
-            elif trust_result.verdict == TrustVerdict.HELD:
-                return PaymentResult(
-                    success=False,
-                    transaction_id=None,
-                    blockchain_tx=None,
-                    amount=amount_decimal,
-                    recipient=recipient,
-                    method=PaymentMethod.TRANSFER,
-                    status=PaymentStatus.PENDING,
-                    error=f"Trust Gate held for review: {trust_result.block_reason}",
-                    metadata={"trust": trust_result.to_dict()},
+            trust_info = trust_result.to_dict()
+
+            if trust_result.verdict is TrustVerdict.BLOCKED:
+                return self._fail_result(
+                    amount_decimal,
+                    recipient,
+                    PaymentStatus.BLOCKED,
+                    f"Trust Gate blocked: {trust_result.block_reason}",
+                    trust=trust_info,
+                )
+            elif trust_result.verdict is TrustVerdict.HELD:
+                return self._fail_result(
+                    amount_decimal,
+                    recipient,
+                    PaymentStatus.PENDING,
+                    f"Trust Gate held for review: {trust_result.block_reason}",
+                    trust=trust_info,
                 )
 
+        # Build a fresh dict so the caller's metadata is never mutated, in a
+        # single allocation whether or not metadata was supplied
+        if metadata:
+            meta = {
+                **metadata,
+                "idempotency_key": idempotency_key,
+                "strategy": _STRATEGY_VALUE[strategy],
+            }
+        else:
+            meta = {"idempotency_key": idempotency_key, "strategy": _STRATEGY_VALUE[strategy]}
+        if trust_info is not None:
+            meta["trust"] = trust_info
+
         context = PaymentContext(
             wallet_id=wallet_id,
             wallet_set_id=wallet_set_id,
@@ -374,44 +580,32 @@ class OmniClaw:
             metadata=meta,
         )
 
-        ledger_entry = LedgerEntry(
-            wallet_id=wallet_id,
-            recipient=recipient,
-            amount=amount_decimal,
-            purpose=purpose,
-            metadata=meta,
-        )
-        await self._ledger.record(ledger_entry)
+        # Guarded payments are recorded up front so blocked attempts leave a
+        # trail; otherwise the entry is written once, when it is finalized
+        ledger_entry = LedgerEntry.from_context(context)
+        if not skip_guards:
+            await self._ledger.record(ledger_entry)
 
         guards_chain = None
-        reservation_tokens = []
+        reservation_tokens: list[tuple[str, str | None]] = []
         guards_passed: list[str] = []
 
         if not skip_guards:
-            guards_chain = await self._guard_manager.get_guard_chain(
+            guards_chain = await self._guard_manager.get_cached_guard_chain(
                 wallet_id=wallet_id, wallet_set_id=wallet_set_id
             )
             try:
                 # Reserve budget/limits first (atomic counters)
                 reservation_tokens = await guards_chain.reserve(context)
-                guards_passed = [g.name for g in guards_chain]
+                guards_passed = list(guards_chain.names)
             except ValueError as e:
-                await self._ledger.update_status(
-                    ledger_entry.id,
-                    LedgerEntryStatus.BLOCKED,
-                    tx_hash=None,
-                )
-                return PaymentResult(
-                    success=False,
-                    transaction_id=None,
-                    blockchain_tx=None,
-                    amount=amount_decimal,
-                    recipient=recipient,
-                    method=PaymentMethod.TRANSFER,
-                    status=PaymentStatus.BLOCKED,
-                    error=f"Blocked by guard: {e}",
-                    guards_passed=guards_passed,
-                    metadata={"guard_reason": str(e)},
+                await self._ledger.record_and_finalize(ledger_entry, LedgerEntryStatus.BLOCKED)
+                return self._fail_result(
+                    amount_decimal,
+                    recipient,
+                    PaymentStatus.BLOCKED,
+                    f"Blocked by guard: {e}",
+                    guard_reason=str(e),
                 )
 
         # Acquire Fund Lock (Mutex) to prevent double-spend race conditions
@@ -419,17 +613,22 @@ class OmniClaw:
         if not lock_token:
              # Could not acquire lock (busy)
              error_msg = "Wallet is busy (locked by another transaction). Please retry."
-             if guards_chain and reservation_tokens:
-                 await guards_chain.release(reservation_tokens)
-             
-             await self._ledger.update_status(
-                 ledger_entry.id, 
-                 LedgerEntryStatus.FAILED, 
-                 metadata_updates={"error": error_msg}
+             await self._teardown(
+                 guards_chain,
+                 reservation_tokens,
+                 ledger_entry,
+                 LedgerEntryStatus.FAILED,
+                 metadata_updates={"error": error_msg},
              )
              raise PaymentError(error_msg)
 
+        debiting = False
         try:
+            # Lock-free intent authorizations see the debit through the
+            # reservation version and retry or wait (see _authorize_intent)
+            await self._reservation.begin_debit(wallet_id)
+            debiting = True
+
             # If we are confirming an intent, release its reservation now that we hold the mutex
             if consume_intent_id:
                 await self._reservation.release(consume_intent_id)
@@ -440,12 +639,12 @@ class OmniClaw:
             available = balance - reserved_total
             if amount_decimal > available:
                 error_msg = f"Insufficient available balance (Total: {balance}, Reserved: {reserved_total}, Available: {available})"
-                if guards_chain and reservation_tokens:
-                    await guards_chain.release(reservation_tokens)
-                await self._ledger.update_status(
-                    ledger_entry.id,
+                await self._teardown(
+                    guards_chain,
+                    reservation_tokens,
+                    ledger_entry,
                     LedgerEntryStatus.FAILED,
-                    metadata_updates={"error": error_msg}
+                    metadata_updates={"error": error_msg},
                 )
                 raise InsufficientBalanceError(
                     error_msg,
@@ -462,11 +661,10 @@ class OmniClaw:
             if not await circuit.is_available():
                 if strategy == PaymentStrategy.QUEUE_BACKGROUND:
                     # Queue it
-                    return await self._queue_payment(context, ledger_entry.id, guards_chain, reservation_tokens)
+                    return await self._queue_payment(context, ledger_entry, guards_chain, reservation_tokens)
                 
                 # Fail Fast / Retry logic implies fail if circuit open
-                recovery_ts = await circuit.get_recovery_ts() if hasattr(circuit, "get_recovery_ts") else 0
-                raise CircuitOpenError(circuit.service, recovery_ts)
+                raise CircuitOpenError(circuit.service, await circuit.get_recovery_ts())
 
             # 2. Execute with Strategy
             async with circuit:
@@ -503,8 +701,8 @@ class OmniClaw:
 
             # 3. Success Handling
             if result.success:
-                await self._ledger.update_status(
-                    ledger_entry.id,
+                await self._ledger.record_and_finalize(
+                    ledger_entry,
                     LedgerEntryStatus.COMPLETED
                     if result.status == PaymentStatus.COMPLETED
                     else LedgerEntryStatus.PENDING,
@@ -514,9 +712,9 @@ class OmniClaw:
                 if guards_chain:
                     await guards_chain.commit(reservation_tokens)
             else:
-                await self._ledger.update_status(ledger_entry.id, LedgerEntryStatus.FAILED)
-                if guards_chain:
-                    await guards_chain.release(reservation_tokens)
+                await self._teardown(
+                    guards_chain, reservation_tokens, ledger_entry, LedgerEntryStatus.FAILED
+                )
 
             return result
 
@@ -524,50 +722,173 @@ class OmniClaw:
             # 4. Failure Handling & Queueing
             if strategy == PaymentStrategy.QUEUE_BACKGROUND:
                 self._logger.warning(f"Payment failed ({e}), queueing background retry.")
-                return await self._queue_payment(context, ledger_entry.id, guards_chain, reservation_tokens)
+                return await self._queue_payment(context, ledger_entry, guards_chain, reservation_tokens)
             
             # Release guards on final failure
-            if guards_chain:
-                await guards_chain.release(reservation_tokens)
-
-            await self._ledger.update_status(ledger_entry.id, LedgerEntryStatus.FAILED, metadata_updates={"error": str(e)})
+            await self._teardown(
+                guards_chain,
+                reservation_tokens,
+                ledger_entry,
+                LedgerEntryStatus.FAILED,
+                metadata_updates={"error": str(e)},
+            )
             raise e
         finally:
-            # Release lock in all cases
-            if lock_token:
-                await self._fund_lock.release_with_key(wallet_id, lock_token)
+            # Release lock in all cases (acquire failure already raised above)
+            if debiting:
+                await self._reservation.end_debit(wallet_id)
+            await self._fund_lock.release_with_key(wallet_id, lock_token)
+
+    async def pay_simple(
+        self,
+        wallet_id: str,
+        recipient: str,
+        amount: AmountType,
+        *,
+        idempotency_key: str | None = None,
+    ) -> PaymentResult:
+        """
+        Execute a payment with routing only: no guards, Trust Gate or ledger.
+
+        A lean alternative to pay(skip_guards=True, check_trust=False) for
+        scripts paying known-good recipients. It also skips the fund lock,
+        the reservation-aware balance check and the circuit breaker, and
+        records nothing: ledger integration is the caller's responsibility.
+
+        Args:
+            wallet_id: Source wallet ID (REQUIRED)
+            recipient: Payment recipient (address or URL)
+            amount: Amount to pay (USDC)
+            idempotency_key: Unique key for deduplication
+
+        Returns:
+            PaymentResult with transaction details
+        """
+        if not wallet_id:
+            raise ValidationError("wallet_id is required")
+
+        amount_decimal = as_decimal(amount)
+        if amount_decimal <= 0:
+            raise ValidationError(f"Payment amount must be positive. Got: {amount_decimal}")
+
+        return await self._router.pay(
+            wallet_id=wallet_id,
+            recipient=recipient,
+            amount=amount_decimal,
+            idempotency_key=idempotency_key or uuid4_str(),
+        )
+
+    async def _teardown(
+        self,
+        guards_chain: Any,
+        reservation_tokens: list[tuple[str, str | None]],
+        ledger_entry: LedgerEntry,
+        status: LedgerEntryStatus,
+        metadata_updates: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Release guard reservations and finalize the ledger entry concurrently.
+
+        Both writes are attempted even if one of them fails; failures are logged
+        so they never mask the payment error being reported to the caller.
+        """
+        ops = [
+            self._ledger.record_and_finalize(
+                ledger_entry, status, metadata_updates=metadata_updates
+            )
+        ]
+        if guards_chain and reservation_tokens:
+            ops.append(guards_chain.release(reservation_tokens))
+
+        for outcome in await asyncio.gather(*ops, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                self._logger.error(f"Payment teardown step failed: {outcome}")
+
+    @staticmethod
+    def _fail_result(
+        amount: Decimal,
+        recipient: str,
+        status: PaymentStatus,
+        error: str,
+        **meta: Any,
+    ) -> PaymentResult:
+        """Build a failed transfer PaymentResult; extra kwargs become its metadata."""
+        return PaymentResult(
+            success=False,
+            transaction_id=None,
+            blockchain_tx=None,
+            amount=amount,
+            recipient=recipient,
+            method=PaymentMethod.TRANSFER,
+            status=status,
+            error=error,
+            metadata=meta,
+        )
+
+    def _ensure_bg_workers(self) -> asyncio.Queue[_QueuedPayment]:
+        """Start the background payment workers on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._bg_queue is None or self._bg_loop is not loop:
+            self._bg_loop = loop
+            self._bg_queue = asyncio.Queue(maxsize=_BG_QUEUE_SIZE)
+            self._bg_workers = [
+                loop.create_task(self._bg_worker(self._bg_queue)) for _ in range(_BG_WORKERS)
+            ]
+        return self._bg_queue
+
+    async def _bg_worker(self, queue: asyncio.Queue[_QueuedPayment]) -> None:
+        """Consume queued payments and finish their ledger and guard bookkeeping."""
+        while True:
+            item = await queue.get()
+            try:
+                await self._record_queued_payment(*item)
+            except Exception as e:
+                self._logger.error(f"Failed to record queued payment: {e}")
+            finally:
+                queue.task_done()
 
     async def _queue_payment(
         self,
         context: PaymentContext,
-        ledger_entry_id: str,
+        ledger_entry: LedgerEntry,
         guards_chain: Any,
-        reservation_tokens: list[str]
+        reservation_tokens: list[tuple[str, str | None]],
     ) -> PaymentResult:
-        """Queue a payment for later execution with fund reservation."""
-        # Create intent
-        intent = await self._intent_service.create(
-            wallet_id=context.wallet_id,
-            recipient=context.recipient,
-            amount=context.amount,
-            purpose="Queued background payment",
-            metadata=context.metadata
-        )
+        """
+        Queue a payment for later execution.
 
-        # Reserve funds so they aren't double-spent while queued
-        await self._reservation.reserve(context.wallet_id, context.amount, intent.id)
-        intent.reserved_amount = context.amount
+        Must be called while holding the wallet's fund lock: the intent and the
+        fund reservation are created before returning, so concurrent payments
+        see the funds as reserved. Only the ledger update and guard release are
+        left to a background worker.
+        """
+        try:
+            intent = await self._intent_service.create(
+                wallet_id=context.wallet_id,
+                recipient=context.recipient,
+                amount=context.amount,
+                purpose="Queued background payment",
+                metadata=context.metadata,
+            )
+            # Reserve funds so they aren't double-spent while queued
+            await self._reservation.reserve(context.wallet_id, context.amount, intent.id)
+        except Exception as e:
+            error_msg = f"Failed to queue payment: {e}"
+            await self._teardown(
+                guards_chain,
+                reservation_tokens,
+                ledger_entry,
+                LedgerEntryStatus.FAILED,
+                metadata_updates={"error": error_msg},
+            )
+            return self._fail_result(context.amount, context.recipient, PaymentStatus.FAILED, error_msg)
 
-        # Update ledger to PENDING/QUEUED
-        await self._ledger.update_status(
-            ledger_entry_id, 
-            LedgerEntryStatus.PENDING, 
-            metadata_updates={"intent_id": intent.id, "queued": True}
-        )
-        
-        # Release guard reservations — the fund reservation protects the balance
-        if guards_chain:
-            await guards_chain.release(reservation_tokens)
+        item = (ledger_entry, guards_chain, reservation_tokens, intent.id)
+        try:
+            self._ensure_bg_workers().put_nowait(item)
+        except asyncio.QueueFull:
+            # The payment is already safely queued; just do the bookkeeping inline
+            await self._record_queued_payment(*item)
 
         return PaymentResult(
             success=True,  # It was successfully queued
@@ -580,6 +901,32 @@ class OmniClaw:
             metadata={"queued": True, "intent_id": intent.id},
         )
 
+    async def _record_queued_payment(
+        self,
+        ledger_entry: LedgerEntry,
+        guards_chain: Any,
+        reservation_tokens: list[tuple[str, str | None]],
+        intent_id: str,
+    ) -> None:
+        """
+        Mark a queued payment PENDING in the ledger and release its guard reservations.
+
+        The fund reservation now protects the balance. Both writes are attempted
+        even if one fails; failures are logged.
+        """
+        ops = [
+            self._ledger.record_and_finalize(
+                ledger_entry,
+                LedgerEntryStatus.PENDING,
+                metadata_updates={"intent_id": intent_id, "queued": True},
+            )
+        ]
+        if guards_chain and reservation_tokens:
+            ops.append(guards_chain.release(reservation_tokens))
+
+        for outcome in await asyncio.gather(*ops, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                self._logger.error(f"Queued payment bookkeeping step failed: {outcome}")
 
     async def simulate(
         self,
@@ -619,7 +966,7 @@ class OmniClaw:
                 reason="wallet_id is required",
             )
 
-        amount_decimal = Decimal(str(amount))
+        amount_decimal = as_decimal(amount)
 
         # Check available balance considering reservations
         reserved_total = await self._reservation.get_reserved_total(wallet_id)
@@ -658,7 +1005,7 @@ class OmniClaw:
                 amount=amount_decimal,
                 wallet_id=wallet_id,
             )
-            if trust_result.verdict != TrustVerdict.APPROVED:
+            if trust_result.verdict is not TrustVerdict.APPROVED:
                 return SimulationResult(
                     would_succeed=False,
                     route=PaymentMethod.TRANSFER,
@@ -675,8 +1022,33 @@ class OmniClaw:
         sim_result.guards_that_would_pass = passed_guards
         # Recipient type logic based on route
         sim_result.recipient_type = sim_result.route.value
+
+        if trust_result is not None and sim_result.would_succeed:
+            self._remember_simulated_trust(wallet_id, recipient, amount_decimal, trust_result)
         return sim_result
 
+    def _remember_simulated_trust(
+        self,
+        wallet_id: str,
+        recipient: str,
+        amount: Decimal,
+        trust_result: TrustCheckResult,
+    ) -> None:
+        """Cache an approved simulation trust verdict for a follow-up pay()."""
+        now = time.monotonic()
+        if len(self._sim_cache) >= 1024:
+            self._sim_cache = {k: v for k, v in self._sim_cache.items() if v[0] > now}
+        self._sim_cache[(wallet_id, recipient, amount)] = (now + _SIM_CACHE_TTL, trust_result)
+
+    def _pop_simulated_trust(
+        self, wallet_id: str, recipient: str, amount: Decimal
+    ) -> TrustCheckResult | None:
+        """Consume a fresh cached simulation trust verdict, if any."""
+        cached = self._sim_cache.pop((wallet_id, recipient, amount), None)
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        return cached[1]
+
     def can_pay(self, recipient: str) -> bool:
         """
         Check if a recipient can be paid.
@@ -708,49 +1080,178 @@ class OmniClaw:
         idempotency_key: str | None = None,
         **kwargs: Any,
     ) -> PaymentIntent:
-        """Create a Payment Intent (Authorize)."""
-        amount_decimal = Decimal(str(amount))
+        """
+        Create a Payment Intent (Authorize).
+
+        Uses optimistic concurrency instead of the wallet fund lock: the
+        wallet's reservation version is read, the payment is simulated
+        without holding a lock, and the reservation only succeeds if no
+        other reservation landed in between. Conflicts are retried with
+        exponential backoff.
+        """
+        amount_decimal = as_decimal(amount)
+
+        # Replays of a keyed request are answered from the idempotency store
+        idem_key: str | None = None
+        if idempotency_key:
+            idem_key = f"create_payment_intent:{wallet_id}:{idempotency_key}"
+            request_hash = _request_hash(
+                wallet_id, recipient, amount_decimal, purpose, expires_in, kwargs
+            )
+            record = await self._idempotency.claim(idem_key, request_hash)
+            if record is not None:
+                return await self._replay_intent(record, idempotency_key, request_hash)
 
-        # Acquire lock to ensure balance isn't changing while we simulate and reserve
-        lock_token = await self._fund_lock.acquire(wallet_id, amount_decimal)
-        if not lock_token:
-             raise PaymentError("Wallet is busy (locked by another transaction). Please retry.")
-             
         try:
-            # Simulate check (Routing + Guards) strictly
-            sim_result = await self.simulate(
-                wallet_id=wallet_id, recipient=recipient, amount=amount_decimal, **kwargs
+            intent = await self._authorize_intent(
+                wallet_id, recipient, amount_decimal, purpose, expires_in, idempotency_key, kwargs
             )
+        except Exception:
+            if idem_key:
+                await self._idempotency.fail(idem_key)
+            raise
 
-            if not sim_result.would_succeed:
-                raise PaymentError(f"Authorization failed: {sim_result.reason}")
+        if idem_key:
+            await self._idempotency.complete(idem_key, {"intent_id": intent.id})
+        return intent
 
-            # Create Intent
-            metadata = kwargs.copy()
-            metadata.update(
-                {
-                    "idempotency_key": idempotency_key,
-                    "simulated_route": sim_result.route.value,
-                }
+    async def _replay_intent(
+        self, record: IdempotencyRecord, idempotency_key: str, request_hash: str
+    ) -> PaymentIntent:
+        """Resolve a create_payment_intent replay from its idempotency record."""
+        if record.status is IdempotencyStatus.PENDING:
+            raise IdempotencyError(
+                "A request with this idempotency key is already in progress",
+                idempotency_key=idempotency_key,
+            )
+        if record.request_hash != request_hash:
+            raise IdempotencyError(
+                "Idempotency key was already used with different parameters",
+                idempotency_key=idempotency_key,
             )
 
-            intent = await self._intent_service.create(
-                wallet_id=wallet_id, 
-                recipient=recipient, 
-                amount=amount_decimal, 
+        intent_id = (record.response or {}).get("intent_id")
+        intent = await self._intent_service.get(intent_id) if intent_id else None
+        if intent is None:
+            raise IdempotencyError(
+                f"Intent for idempotency key no longer exists: {intent_id}",
+                idempotency_key=idempotency_key,
+            )
+        return intent
+
+    async def _authorize_intent(
+        self,
+        wallet_id: str,
+        recipient: str,
+        amount_decimal: Decimal,
+        purpose: str | None,
+        expires_in: int | None,
+        idempotency_key: str | None,
+        kwargs: dict[str, Any],
+    ) -> PaymentIntent:
+        """
+        Simulate, reserve and create a payment intent.
+
+        Runs without the fund lock: the reservation is a compare-and-swap on
+        the wallet's reservation version, which concurrent reservations and
+        pay() debits both advance. While a debit is in flight (odd version)
+        the attempt waits for it under the fund lock instead.
+        """
+        intent_id = uuid4_str()
+
+        for attempt in range(_INTENT_CAS_ATTEMPTS):
+            version = await self._reservation.get_version(wallet_id)
+            lock_token: str | None = None
+            if version % 2:
+                lock_token = await self._fund_lock.acquire(wallet_id, amount_decimal)
+                if not lock_token:
+                    raise PaymentError(
+                        "Wallet is busy (locked by another transaction). Please retry."
+                    )
+                version = await self._reservation.get_version(wallet_id)
+
+            try:
+                reserved, intent = await self._try_reserve_intent(
+                    wallet_id,
+                    recipient,
+                    amount_decimal,
+                    purpose,
+                    expires_in,
+                    idempotency_key,
+                    kwargs,
+                    intent_id,
+                    version,
+                )
+            finally:
+                if lock_token:
+                    await self._fund_lock.release_with_key(wallet_id, lock_token)
+            if reserved:
+                break
+
+            await asyncio.sleep(_INTENT_CAS_BACKOFF * (2**attempt))
+        else:
+            raise PaymentError("Wallet is busy (concurrent authorizations). Please retry.")
+
+        intent.reserved_amount = amount_decimal
+        return intent
+
+    async def _try_reserve_intent(
+        self,
+        wallet_id: str,
+        recipient: str,
+        amount_decimal: Decimal,
+        purpose: str | None,
+        expires_in: int | None,
+        idempotency_key: str | None,
+        kwargs: dict[str, Any],
+        intent_id: str,
+        version: int,
+    ) -> tuple[bool, PaymentIntent]:
+        """One simulate + reserve attempt; returns (reserved, intent)."""
+        # Simulate check (Routing + Guards) strictly
+        sim_result = await self.simulate(
+            wallet_id=wallet_id, recipient=recipient, amount=amount_decimal, **kwargs
+        )
+
+        if not sim_result.would_succeed:
+            raise PaymentError(f"Authorization failed: {sim_result.reason}")
+
+        metadata = {
+            **kwargs,
+            "idempotency_key": idempotency_key,
+            "simulated_route": sim_result.route.value,
+        }
+
+        # Layer 2: Reserve the funds (unless a reservation or debit raced in) and
+        # write the intent concurrently; the intent ID is pre-allocated and not
+        # yet visible to callers, so either write can be rolled back.
+        reserved, intent = await asyncio.gather(
+            self._reservation.reserve_cas(
+                wallet_id, amount_decimal, intent_id, expected_version=version
+            ),
+            self._intent_service.create(
+                wallet_id=wallet_id,
+                recipient=recipient,
+                amount=amount_decimal,
                 purpose=purpose,
                 expires_in=expires_in,
-                metadata=metadata
-            )
-            
-            # Layer 2: Reserve the funds in the ledger
-            await self._reservation.reserve(wallet_id, amount_decimal, intent.id)
-            intent.reserved_amount = amount_decimal
-            
-            return intent
-        finally:
-            if lock_token:
-                await self._fund_lock.release_with_key(wallet_id, lock_token)
+                metadata=metadata,
+                intent_id=intent_id,
+            ),
+            return_exceptions=True,
+        )
+
+        if isinstance(intent, BaseException):
+            if reserved is True:
+                await self._reservation.release(intent_id)
+            raise intent
+        if reserved is True:
+            return True, intent
+
+        await self._intent_service.delete(intent_id)
+        if isinstance(reserved, BaseException):
+            raise reserved
+        return False, intent
 
     async def confirm_payment_intent(self, intent_id: str) -> PaymentResult:
         """Confirm and execute a Payment Intent (Capture)."""
@@ -762,49 +1263,48 @@ class OmniClaw:
             raise ValidationError(f"Intent cannot be confirmed. Status: {intent.status}")
 
         # Check expiry
-        if intent.expires_at:
-            from datetime import datetime
-            if datetime.utcnow() > intent.expires_at:
-                # Auto-cancel expired intent and release reservation
-                await self._reservation.release(intent.id)
-                await self._intent_service.cancel(intent.id, reason="Expired")
-                raise ValidationError(f"Intent expired at {intent.expires_at}")
+        if intent.expires_at and datetime.now(timezone.utc) > intent.expires_at:
+            # Auto-cancel expired intent and release reservation
+            await self._reservation.release(intent.id)
+            await self._intent_service.cancel(intent.id, reason="Expired")
+            raise ValidationError(f"Intent expired at {intent.expires_at}")
+
+        # PROCESSING is what turns away a second confirm of the same intent
+        await self._intent_service.transition(
+            intent, PaymentIntentStatus.REQUIRES_CONFIRMATION, PaymentIntentStatus.PROCESSING
+        )
 
         try:
-            # Update to Processing
-            await self._intent_service.update_status(intent.id, PaymentIntentStatus.PROCESSING)
-
-            # Prepare exec args from intent + metadata
-            exec_kwargs = intent.metadata.copy()
-
-            # Remove internal metadata keys that aren't for routing
-            purpose = exec_kwargs.pop("purpose", None)
-            idempotency_key = exec_kwargs.pop("idempotency_key", None)
-            exec_kwargs.pop("simulated_route", None)
+            # Prepare exec args from intent metadata, minus internal keys
+            metadata = intent.metadata
+            exec_kwargs = {k: v for k, v in metadata.items() if k not in _INTERNAL_META_KEYS}
 
             # Execute Pay
             result = await self.pay(
                 wallet_id=intent.wallet_id,
                 recipient=intent.recipient,
                 amount=intent.amount,
-                purpose=purpose,
-                idempotency_key=idempotency_key,
+                purpose=metadata.get("purpose"),
+                idempotency_key=metadata.get("idempotency_key"),
                 consume_intent_id=intent.id, # Key part: releases reservation inside the lock
+                preselected_method=_simulated_method(metadata.get("simulated_route")),
                 **exec_kwargs,
             )
 
-            if result.success:
-                await self._intent_service.update_status(intent.id, PaymentIntentStatus.SUCCEEDED)
-            else:
-                await self._intent_service.update_status(intent.id, PaymentIntentStatus.FAILED)
-
-            return result
-
         except Exception as e:
             # Mark failed on exception
-            await self._intent_service.update_status(intent.id, PaymentIntentStatus.FAILED)
+            await self._intent_service.transition(
+                intent, PaymentIntentStatus.PROCESSING, PaymentIntentStatus.FAILED
+            )
             raise e
 
+        await self._intent_service.transition(
+            intent,
+            PaymentIntentStatus.PROCESSING,
+            PaymentIntentStatus.SUCCEEDED if result.success else PaymentIntentStatus.FAILED,
+        )
+        return result
+
     async def get_payment_intent(self, intent_id: str) -> PaymentIntent | None:
         """Get Payment Intent by ID."""
         return await self._intent_service.get(intent_id)
@@ -831,16 +1331,36 @@ class OmniClaw:
 
         Args:
             requests: List of payment requests to execute
-            concurrency: Maximum number of concurrent executions (default 5)
+            concurrency: Maximum concurrent executions per payment method (default 5)
 
         Returns:
             BatchPaymentResult containing status of all payments
         """
         return await self._batch_processor.process(requests, concurrency)
 
+    async def batch_pay_iter(
+        self, requests: list[PaymentRequest], concurrency: int = 5
+    ) -> AsyncIterator[PaymentResult]:
+        """
+        Execute multiple payments, yielding each result as soon as it completes.
+
+        Results arrive in completion order, not request order. If iteration
+        stops early, payments already started still complete (their results
+        are dropped) and payments not yet started are cancelled.
+
+        Args:
+            requests: List of payment requests to execute
+            concurrency: Maximum concurrent executions per payment method (default 5)
+
+        Yields:
+            PaymentResult for each request
+        """
+        async for _, result in self._batch_processor.iter_results(requests, concurrency):
+            yield result
+
     async def sync_transaction(self, entry_id: str) -> LedgerEntry:
         """Synchronize a ledger entry with the provider status."""
-        entry = await self._ledger.get(entry_id)
+        entry: LedgerEntry | None = await self._ledger.get(entry_id)
         if not entry:
             raise ValidationError(f"Ledger entry not found: {entry_id}")
 
@@ -850,18 +1370,21 @@ class OmniClaw:
 
         # Call Provider
         try:
-            tx_info = self._circle_client.get_transaction(tx_id)
+            tx_info = await self._fetch_transaction(tx_id)
         except Exception as e:
             raise PaymentError(f"Failed to fetch transaction from provider: {e}") from e
 
         # Map status
-        new_status = entry.status
-        if tx_info.state == "COMPLETE":
-            new_status = LedgerEntryStatus.COMPLETED
-        elif tx_info.state == "FAILED":
-            new_status = LedgerEntryStatus.FAILED
-        elif tx_info.state == "CANCELLED":
-            new_status = LedgerEntryStatus.CANCELLED
+        state_str = _enum_value(tx_info.state)
+        new_status = entry.status if state_str is None else _STATE_MAP.get(state_str, entry.status)
+
+        # Nothing changed since the last sync: skip the ledger write
+        if (
+            new_status == entry.status
+            and tx_info.tx_hash == entry.tx_hash
+            and entry.metadata.get("provider_state") == state_str
+        ):
+            return entry
 
         # Update Ledger
         await self._ledger.update_status(
@@ -869,17 +1392,37 @@ class OmniClaw:
             new_status,
             tx_hash=tx_info.tx_hash,
             metadata_updates={
-                "last_synced": datetime.utcnow().isoformat(),
-                "provider_state": tx_info.state.value
-                if hasattr(tx_info.state, "value")
-                else str(tx_info.state),
-                "fee_level": tx_info.fee_level.value if tx_info.fee_level else None,
+                "last_synced": _now_iso(),
+                "provider_state": state_str,
+                "fee_level": _enum_value(tx_info.fee_level),
             },
         )
 
         updated = await self._ledger.get(entry.id)
         return updated  # type: ignore
 
+    async def _fetch_transaction(self, tx_id: str) -> TransactionInfo:
+        """
+        Fetch a transaction from the provider, collapsing concurrent lookups.
+
+        Concurrent callers for the same tx_id share one provider request. It
+        runs in its own task, so a caller that is cancelled stops waiting
+        without cancelling the request for the others.
+        """
+        task = self._sync_inflight.get(tx_id)
+        if task is None:
+            task = asyncio.ensure_future(self._circle_client.aget_transaction(tx_id))
+            self._sync_inflight[tx_id] = task
+            task.add_done_callback(functools.partial(self._forget_fetch, tx_id))
+        return await asyncio.shield(task)
+
+    def _forget_fetch(self, tx_id: str, task: asyncio.Task[TransactionInfo]) -> None:
+        """Drop a finished provider lookup so the next sync fetches afresh."""
+        if self._sync_inflight.get(tx_id) is task:
+            del self._sync_inflight[tx_id]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every caller stopped waiting
+
     async def add_budget_guard(
         self,
         wallet_id: str,
@@ -900,11 +1443,9 @@ class OmniClaw:
             total_limit: Max total spend (lifetime)
             name: Custom name for the guard
         """
-        from omniclaw.guards.budget import BudgetGuard
-
-        d_limit = Decimal(str(daily_limit)) if daily_limit else None
-        h_limit = Decimal(str(hourly_limit)) if hourly_limit else None
-        t_limit = Decimal(str(total_limit)) if total_limit else None
+        d_limit = as_decimal(daily_limit) if daily_limit else None
+        h_limit = as_decimal(hourly_limit) if hourly_limit else None
+        t_limit = as_decimal(total_limit) if total_limit else None
 
         guard = BudgetGuard(
             daily_limit=d_limit, hourly_limit=h_limit, total_limit=t_limit, name=name
@@ -929,11 +1470,9 @@ class OmniClaw:
             total_limit: Max total spend (lifetime)
             name: Custom name for the guard
         """
-        from omniclaw.guards.budget import BudgetGuard
-
-        d_limit = Decimal(str(daily_limit)) if daily_limit else None
-        h_limit = Decimal(str(hourly_limit)) if hourly_limit else None
-        t_limit = Decimal(str(total_limit)) if total_limit else None
+        d_limit = as_decimal(daily_limit) if daily_limit else None
+        h_limit = as_decimal(hourly_limit) if hourly_limit else None
+        t_limit = as_decimal(total_limit) if total_limit else None
 
         guard = BudgetGuard(
             daily_limit=d_limit, hourly_limit=h_limit, total_limit=t_limit, name=name
@@ -956,11 +1495,9 @@ class OmniClaw:
             min_amount: Min amount per transaction
             name: Guard name
         """
-        from omniclaw.guards.single_tx import SingleTxGuard
-
         guard = SingleTxGuard(
-            max_amount=Decimal(str(max_amount)),
-            min_amount=Decimal(str(min_amount)) if min_amount else None,
+            max_amount=as_decimal(max_amount),
+            min_amount=as_decimal(min_amount) if min_amount else None,
             name=name,
         )
         await self._guard_manager.add_guard(wallet_id, guard)
@@ -985,8 +1522,6 @@ class OmniClaw:
             domains: List of allowed/blocked domains (for x402/URLs)
             name: Guard name
         """
-        from omniclaw.guards.recipient import RecipientGuard
-
         guard = RecipientGuard(
             mode=mode, addresses=addresses, patterns=patterns, domains=domains, name=name
         )
@@ -1012,8 +1547,6 @@ class OmniClaw:
             max_per_day: Max txs per day
             name: Custom name for the guard
         """
-        from omniclaw.guards.rate_limit import RateLimitGuard
-
         guard = RateLimitGuard(
             max_per_minute=max_per_minute,
             max_per_hour=max_per_hour,
@@ -1041,9 +1574,7 @@ class OmniClaw:
             always_confirm: If True, require confirmation for ALL payments
             name: Custom name for the guard
         """
-        from omniclaw.guards.confirm import ConfirmGuard
-
-        t_threshold = Decimal(str(threshold)) if threshold else None
+        t_threshold = as_decimal(threshold) if threshold else None
 
         guard = ConfirmGuard(threshold=t_threshold, always_confirm=always_confirm, name=name)
         await self._guard_manager.add_guard(wallet_id, guard)
@@ -1064,9 +1595,7 @@ class OmniClaw:
             always_confirm: If True, require confirmation for ALL payments
             name: Custom name for the guard
         """
-        from omniclaw.guards.confirm import ConfirmGuard
-
-        t_threshold = Decimal(str(threshold)) if threshold else None
+        t_threshold = as_decimal(threshold) if threshold else None
 
         guard = ConfirmGuard(threshold=t_threshold, always_confirm=always_confirm, name=name)
         await self._guard_manager.add_guard_for_set(wallet_set_id, guard)
@@ -1089,8 +1618,6 @@ class OmniClaw:
             max_per_day: Max txs per day
             name: Custom name for the guard
         """
-        from omniclaw.guards.rate_limit import RateLimitGuard
-
         guard = RateLimitGuard(
             max_per_minute=max_per_minute,
             max_per_hour=max_per_hour,
@@ -1119,8 +1646,6 @@ class OmniClaw:
             domains: List of allowed/blocked domains (for x402/URLs)
             name: Guard name
         """
-        from omniclaw.guards.recipient import RecipientGuard
-
         guard = RecipientGuard(
             mode=mode, addresses=addresses, patterns=patterns, domains=domains, name=name
         )
@@ -5,6 +5,9 @@ Official contract addresses from Circle:
 https://developers.circle.com/cctp/references/contract-addresses
 """
 
+import functools
+from typing import NamedTuple
+
 from omniclaw.core.types import Network
 
 # CCTP V2 Domain IDs
@@ -103,21 +106,58 @@ USDC_CONTRACTS = {
     "ARC-TESTNET": "0x79A02482A880bCE3F13e09Da970dC34db4CD24d1",
 }
 
+
+class CctpAddresses(NamedTuple):
+    """Everything CCTP V2 needs to know about one network, resolved in a single lookup."""
+
+    domain: int
+    token_messenger: str | None
+    message_transmitter: str | None
+    usdc: str | None
+
+
+# Merged per-network view of the tables above, built once at import
+CCTP_TABLE: dict[Network, CctpAddresses] = {
+    network: CctpAddresses(
+        domain=domain,
+        token_messenger=TOKEN_MESSENGER_V2_CONTRACTS.get(network.value),
+        message_transmitter=MESSAGE_TRANSMITTER_V2_CONTRACTS.get(network.value),
+        usdc=USDC_CONTRACTS.get(network.value),
+    )
+    for network, domain in CCTP_DOMAIN_IDS.items()
+}
+
 # Iris API
 IRIS_API_SANDBOX = "https://iris-api-sandbox.circle.com"
 IRIS_API_MAINNET = "https://iris-api.circle.com"
 IRIS_V2_MESSAGES_PATH = "/v2/messages"
 
+# Iris base URL per network, resolved once instead of on every attestation poll
+_IRIS_URL_BY_NETWORK = {
+    network: IRIS_API_SANDBOX if network.is_testnet() else IRIS_API_MAINNET
+    for network in Network
+}
+
 
 def get_iris_url(network: Network) -> str:
     """Get the appropriate Iris API URL for a network."""
-    return IRIS_API_SANDBOX if network.is_testnet() else IRIS_API_MAINNET
+    return _IRIS_URL_BY_NETWORK[network]
+
+
+@functools.lru_cache(maxsize=64)
+def _iris_v2_messages_prefix(network: Network, domain: int) -> str:
+    return f"{_IRIS_URL_BY_NETWORK[network]}{IRIS_V2_MESSAGES_PATH}/{domain}?transactionHash="
 
 
 def get_iris_v2_attestation_url(network: Network, domain: int, tx_hash: str) -> str:
     """Get the CCTP V2 attestation API URL."""
-    base_url = get_iris_url(network)
-    return f"{base_url}{IRIS_V2_MESSAGES_PATH}/{domain}?transactionHash={tx_hash}"
+    return _iris_v2_messages_prefix(network, domain) + tx_hash
+
+
+def get_iris_v2_attestation_urls(items: list[tuple[Network, int, str]]) -> list[str]:
+    """Get CCTP V2 attestation API URLs for many ``(network, domain, tx_hash)`` items."""
+    prefix = _iris_v2_messages_prefix
+    return [prefix(network, domain) + tx_hash for network, domain, tx_hash in items]
 
 
 def is_cctp_supported(network: Network) -> bool:
@@ -125,14 +165,21 @@ def is_cctp_supported(network: Network) -> bool:
     return network in CCTP_DOMAIN_IDS
 
 
+def get_cctp_addresses(network: Network) -> CctpAddresses | None:
+    """Get the CCTP domain and contract addresses for a network, or None if unsupported."""
+    return CCTP_TABLE.get(network)
+
+
 def get_token_messenger_v2(network: Network) -> str | None:
     """Get TokenMessengerV2 contract address."""
-    return TOKEN_MESSENGER_V2_CONTRACTS.get(network.value)
+    entry = CCTP_TABLE.get(network)
+    return entry.token_messenger if entry else None
 
 
 def get_message_transmitter_v2(network: Network) -> str | None:
     """Get MessageTransmitterV2 contract address."""
-    return MESSAGE_TRANSMITTER_V2_CONTRACTS.get(network.value)
+    entry = CCTP_TABLE.get(network)
+    return entry.message_transmitter if entry else None
 
 
 # CCTP V2 Transfer Parameters
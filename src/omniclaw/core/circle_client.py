@@ -7,10 +7,19 @@ wallet and transaction operations.
 
 from __future__ import annotations
 
-import uuid
-from typing import Any
+import asyncio
+import base64
+import copy
+import functools
+import hashlib
+import threading
+import time
+from typing import Any, TypeVar
 
 from circle.web3 import developer_controlled_wallets, utils
+from circle.web3.developer_controlled_wallets import rest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 
 from omniclaw.core.config import Config
 from omniclaw.core.exceptions import (
@@ -26,31 +35,184 @@ from omniclaw.core.types import (
     TransactionInfo,
     WalletInfo,
     WalletSetInfo,
+    uuid4_str,
 )
 
+# Connections kept per host by a shared SDK client (the SDK default is 4,
+# which blocking calls offloaded to worker threads quickly exhaust)
+_POOL_MAXSIZE = 20
+
+# SDK API clients shared by every CircleClient using the same credentials,
+# and how many open CircleClients use each one
+_API_CLIENTS: dict[str, Any] = {}
+_API_CLIENT_REFS: dict[str, int] = {}
+_API_CLIENTS_LOCK = threading.Lock()
+
+
+def _credentials_key(api_key: str, entity_secret: str) -> str:
+    return hashlib.sha256(f"{api_key}\x1f{entity_secret}".encode()).hexdigest()
+
+
+# Network values resolved once; plain strings miss and pass through unchanged
+_NETWORK_VALUE: dict[Network | str, str] = {n: n.value for n in Network}
+
+# How long wallet and wallet-set metadata fetched from Circle is reused
+_METADATA_CACHE_TTL = 300.0
+
+# Entries held per response cache before expired ones are swept
+_RESPONSE_CACHE_SIZE = 1024
+
+
+# Guards the response caches, which worker threads running SDK calls share
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+_T = TypeVar("_T")
+
+
+def _cache_get(cache: dict[str, tuple[float, _T]], key: str) -> _T | None:
+    with _RESPONSE_CACHE_LOCK:
+        entry = cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        # Callers get their own copy so mutating it cannot corrupt the cache
+        return copy.deepcopy(entry[1])
+    return None
+
+
+def _cache_put(cache: dict[str, tuple[float, _T]], key: str, value: _T) -> None:
+    value = copy.deepcopy(value)
+    with _RESPONSE_CACHE_LOCK:
+        now = time.monotonic()
+        if len(cache) >= _RESPONSE_CACHE_SIZE:
+            for stale in [k for k, v in cache.items() if v[0] <= now]:
+                del cache[stale]
+            if len(cache) >= _RESPONSE_CACHE_SIZE:
+                cache.clear()
+        cache[key] = (now + _METADATA_CACHE_TTL, value)
+
+
+# OAEP parameters Circle expects for the entity secret ciphertext
+_OAEP_SHA256 = padding.OAEP(
+    mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _rsa_public_key(pem: str) -> Any:
+    """Parse Circle's entity public key once; parsing costs as much as an encryption."""
+    return serialization.load_pem_public_key(pem.encode())
+
 
 class CircleClient:
     """Wrapper around Circle's Python SDK for wallet and transaction operations."""
 
     def __init__(self, config: Config) -> None:
         self._config = config
+        self._client_key = _credentials_key(config.circle_api_key, config.entity_secret)
+        self._client = self._shared_api_client(config)
+        self._closed = False
+
+        # Response caches: (expires_at, value) keyed by Circle ID. Transactions
+        # are only cached once terminal, so status polling always hits the API.
+        self._wallet_cache: dict[str, tuple[float, WalletInfo]] = {}
+        self._wallet_set_cache: dict[str, tuple[float, WalletSetInfo]] = {}
+        self._tx_cache: dict[str, tuple[float, TransactionInfo]] = {}
+
+    # API instances are built on first use; CCTP-only callers never touch wallet sets
+    @functools.cached_property
+    def _wallet_sets_api(self) -> Any:
+        return developer_controlled_wallets.WalletSetsApi(self._client)
+
+    @functools.cached_property
+    def _wallets_api(self) -> Any:
+        return developer_controlled_wallets.WalletsApi(self._client)
+
+    @functools.cached_property
+    def _transactions_api(self) -> Any:
+        return developer_controlled_wallets.TransactionsApi(self._client)
+
+    @staticmethod
+    def _shared_api_client(config: Config) -> Any:
+        """
+        Return the SDK API client for these credentials, creating it on first use.
 
-        try:
-            # Initialize the Circle SDK client
-            self._client = utils.init_developer_controlled_wallets_client(
-                api_key=config.circle_api_key,
-                entity_secret=config.entity_secret,
+        Building a client fetches the entity public key and opens a fresh
+        connection pool, so clients with the same credentials reuse one.
+        """
+        key = _credentials_key(config.circle_api_key, config.entity_secret)
+        with _API_CLIENTS_LOCK:
+            api_client = _API_CLIENTS.get(key)
+            if api_client is not None:
+                _API_CLIENT_REFS[key] = _API_CLIENT_REFS.get(key, 0) + 1
+                return api_client
+            try:
+                # Initialize the Circle SDK client
+                api_client = utils.init_developer_controlled_wallets_client(
+                    api_key=config.circle_api_key,
+                    entity_secret=config.entity_secret,
+                )
+            except Exception as e:
+                raise ConfigurationError(
+                    f"Failed to initialize Circle SDK client: {e}",
+                    details={"error": str(e)},
+                ) from e
+            api_client.rest_client = rest.RESTClientObject(  # type: ignore[no-untyped-call]
+                api_client.configuration, maxsize=_POOL_MAXSIZE
             )
-        except Exception as e:
-            raise ConfigurationError(
-                f"Failed to initialize Circle SDK client: {e}",
-                details={"error": str(e)},
-            ) from e
+            _API_CLIENTS[key] = api_client
+            _API_CLIENT_REFS[key] = 1
+            return api_client
+
+    @staticmethod
+    def _close_api_client(api_client: Any) -> None:
+        api_client.rest_client.pool_manager.clear()
+        api_client.close()
+
+    async def aclose(self) -> None:
+        """
+        Release this client's use of the shared SDK client.
+
+        The SDK client and its connection pool are closed once no open
+        CircleClient with the same credentials is using them. Idempotent.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        key = self._client_key
+        with _API_CLIENTS_LOCK:
+            # Already dropped (and closed) by close_all()
+            if _API_CLIENTS.get(key) is not self._client:
+                return
+            refs = _API_CLIENT_REFS[key] - 1
+            if refs:
+                _API_CLIENT_REFS[key] = refs
+                return
+            del _API_CLIENTS[key], _API_CLIENT_REFS[key]
+        self._close_api_client(self._client)
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every shared SDK client and drop their connection pools."""
+        with _API_CLIENTS_LOCK:
+            api_clients = list(_API_CLIENTS.values())
+            _API_CLIENTS.clear()
+            _API_CLIENT_REFS.clear()
+        for api_client in api_clients:
+            cls._close_api_client(api_client)
+
+    def invalidate(self, wallet_id: str | None = None) -> None:
+        """
+        Drop cached API responses.
 
-        # Initialize API instances
-        self._wallet_sets_api = developer_controlled_wallets.WalletSetsApi(self._client)
-        self._wallets_api = developer_controlled_wallets.WalletsApi(self._client)
-        self._transactions_api = developer_controlled_wallets.TransactionsApi(self._client)
+        Args:
+            wallet_id: Forget only this wallet; clears every cache if omitted
+        """
+        with _RESPONSE_CACHE_LOCK:
+            if wallet_id is not None:
+                self._wallet_cache.pop(wallet_id, None)
+                return
+            self._wallet_cache.clear()
+            self._wallet_set_cache.clear()
+            self._tx_cache.clear()
 
     # ==================== Wallet Set Operations ====================
 
@@ -72,18 +234,36 @@ class CircleClient:
                 details={"api_error": str(e)},
             ) from e
 
+    @functools.cached_property
+    def _entity_secret_bytes(self) -> bytes:
+        entity_secret = bytes.fromhex(self._config.entity_secret)
+        if len(entity_secret) != 32:
+            raise ConfigurationError("Invalid entity secret: expected 32 bytes of hex")
+        return entity_secret
+
     def _get_ciphertext(self) -> str:
-        return utils.generate_entity_secret_ciphertext(
-            api_key=self._config.circle_api_key,
-            entity_secret_hex=self._config.entity_secret,
-        )
+        """
+        Encrypt the entity secret for a single request.
+
+        Circle rejects a ciphertext that was already used, so every call
+        performs a fresh RSA-OAEP encryption; only the key parsing is cached.
+        """
+        entity_secret = self._entity_secret_bytes
+        public_key = _rsa_public_key(utils.get_public_key())
+        encrypted = public_key.encrypt(entity_secret, _OAEP_SHA256)
+        return base64.b64encode(encrypted).decode()
 
     def get_wallet_set(self, wallet_set_id: str) -> WalletSetInfo:
         """Get a specific wallet set by ID."""
+        cached = _cache_get(self._wallet_set_cache, wallet_set_id)
+        if cached is not None:
+            return cached
         try:
             response = self._wallet_sets_api.get_wallet_set(wallet_set_id)
             ws_data = response.data.wallet_set.actual_instance.to_dict()
-            return WalletSetInfo.from_api_response(ws_data)
+            wallet_set = WalletSetInfo.from_api_response(ws_data)
+            _cache_put(self._wallet_set_cache, wallet_set_id, wallet_set)
+            return wallet_set
 
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(
@@ -100,7 +280,7 @@ class CircleClient:
         """Create a new wallet set."""
         try:
             ciphertext = self._get_ciphertext()
-            idempotency_key = str(uuid.uuid4())
+            idempotency_key = uuid4_str()
 
             request = developer_controlled_wallets.CreateWalletSetRequest.from_dict(
                 {
@@ -141,11 +321,11 @@ class CircleClient:
             )
 
         # Convert Network enum to string if needed
-        blockchain_str = blockchain.value if isinstance(blockchain, Network) else blockchain
+        blockchain_str = _NETWORK_VALUE.get(blockchain, blockchain)
 
         try:
             ciphertext = self._get_ciphertext()
-            idempotency_key = str(uuid.uuid4())
+            idempotency_key = uuid4_str()
 
             request = developer_controlled_wallets.CreateWalletRequest.from_dict(
                 {
@@ -159,12 +339,10 @@ class CircleClient:
             )
             response = self._wallets_api.create_wallet(request)
 
-            wallets = []
-            for wallet in response.data.wallets:
-                wallet_data = wallet.actual_instance.to_dict()
-                wallets.append(WalletInfo.from_api_response(wallet_data))
-
-            return wallets
+            return [
+                WalletInfo.from_sdk_model(wallet.actual_instance)
+                for wallet in response.data.wallets
+            ]
 
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(
@@ -179,10 +357,14 @@ class CircleClient:
 
     def get_wallet(self, wallet_id: str) -> WalletInfo:
         """Get a specific wallet by ID."""
+        cached = _cache_get(self._wallet_cache, wallet_id)
+        if cached is not None:
+            return cached
         try:
             response = self._wallets_api.get_wallet(wallet_id)
-            wallet_data = response.data.wallet.actual_instance.to_dict()
-            return WalletInfo.from_api_response(wallet_data)
+            wallet = WalletInfo.from_sdk_model(response.data.wallet.actual_instance)
+            _cache_put(self._wallet_cache, wallet_id, wallet)
+            return wallet
 
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(
@@ -203,17 +385,14 @@ class CircleClient:
             if wallet_set_id:
                 kwargs["wallet_set_id"] = wallet_set_id
             if blockchain:
-                blockchain_str = blockchain.value if isinstance(blockchain, Network) else blockchain
-                kwargs["blockchain"] = blockchain_str
+                kwargs["blockchain"] = _NETWORK_VALUE.get(blockchain, blockchain)
 
             response = self._wallets_api.get_wallets(**kwargs)
 
-            wallets = []
-            for wallet in response.data.wallets:
-                wallet_data = wallet.actual_instance.to_dict()
-                wallets.append(WalletInfo.from_api_response(wallet_data))
-
-            return wallets
+            return [
+                WalletInfo.from_sdk_model(wallet.actual_instance)
+                for wallet in response.data.wallets
+            ]
 
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(
@@ -228,13 +407,8 @@ class CircleClient:
         try:
             response = self._wallets_api.list_wallet_balance(wallet_id)
 
-            balances = []
-            for tb in response.data.token_balances:
-                # Balance is a direct Pydantic model, not wrapped in actual_instance
-                balance_data = tb.to_dict()
-                balances.append(Balance.from_api_response(balance_data))
-
-            return balances
+            # Balance is a direct Pydantic model, not wrapped in actual_instance
+            return [Balance.from_sdk_model(tb) for tb in response.data.token_balances]
 
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(
@@ -243,17 +417,38 @@ class CircleClient:
                 details={"api_error": str(e)},
             ) from e
 
+    async def get_wallet_balances_batch(
+        self,
+        wallet_ids: list[str],
+        concurrency: int = 10,
+    ) -> dict[str, list[Balance]]:
+        """
+        Get token balances for several wallets concurrently.
+
+        Each lookup runs in a worker thread (the SDK is synchronous), with at
+        most `concurrency` requests in flight at once.
+
+        Args:
+            wallet_ids: Wallets to fetch balances for
+            concurrency: Maximum concurrent balance requests
+
+        Returns:
+            Balances keyed by wallet ID
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(wallet_id: str) -> list[Balance]:
+            async with semaphore:
+                return await asyncio.to_thread(self.get_wallet_balances, wallet_id)
+
+        results = await asyncio.gather(*(fetch(wallet_id) for wallet_id in wallet_ids))
+        return dict(zip(wallet_ids, results, strict=True))
+
     def get_usdc_balance(self, wallet_id: str) -> Balance | None:
         """Get USDC balance for a wallet."""
         balances = self.get_wallet_balances(wallet_id)
-
-        for balance in balances:
-            # Check for USDC on mainnet or USDC-TESTNET on testnets
-            symbol = balance.token.symbol.upper()
-            if symbol == "USDC" or symbol == "USDC-TESTNET":
-                return balance
-
-        return None
+        # USDC on mainnet or USDC-TESTNET on testnets
+        return next((balance for balance in balances if balance.token.is_usdc), None)
 
     # ==================== Transaction Operations ====================
 
@@ -270,7 +465,7 @@ class CircleClient:
         try:
             # Generate idempotency key if not provided
             if not idempotency_key:
-                idempotency_key = str(uuid.uuid4())
+                idempotency_key = uuid4_str()
 
             ciphertext = self._get_ciphertext()
 
@@ -307,10 +502,15 @@ class CircleClient:
 
     def get_transaction(self, transaction_id: str) -> TransactionInfo:
         """Get transaction status by ID."""
+        cached = _cache_get(self._tx_cache, transaction_id)
+        if cached is not None:
+            return cached
         try:
             response = self._transactions_api.get_transaction(transaction_id)
-            tx_data = response.data.transaction.to_dict()
-            return TransactionInfo.from_api_response(tx_data)
+            tx_info = TransactionInfo.from_sdk_model(response.data.transaction)
+            if tx_info.is_terminal():
+                _cache_put(self._tx_cache, transaction_id, tx_info)
+            return tx_info
 
         except developer_controlled_wallets.ApiException as e:
             raise NetworkError(
@@ -318,6 +518,15 @@ class CircleClient:
                 details={"api_error": str(e), "transaction_id": transaction_id},
             ) from e
 
+    async def aget_transaction(self, transaction_id: str) -> TransactionInfo:
+        """
+        Get transaction status by ID without blocking the event loop.
+
+        The Circle SDK is synchronous, so the request runs in a worker thread
+        using the shared connection pool.
+        """
+        return await asyncio.to_thread(self.get_transaction, transaction_id)
+
     def list_transactions(
         self,
         wallet_id: str | None = None,
@@ -329,17 +538,11 @@ class CircleClient:
             if wallet_id:
                 kwargs["wallet_ids"] = wallet_id
             if blockchain:
-                blockchain_str = blockchain.value if isinstance(blockchain, Network) else blockchain
-                kwargs["blockchain"] = blockchain_str
+                kwargs["blockchain"] = _NETWORK_VALUE.get(blockchain, blockchain)
 
             response = self._transactions_api.list_transactions(**kwargs)
 
-            transactions = []
-            for tx in response.data.transactions:
-                tx_data = tx.to_dict()
-                transactions.append(TransactionInfo.from_api_response(tx_data))
-
-            return transactions
+            return [TransactionInfo.from_sdk_model(tx) for tx in response.data.transactions]
 
         except developer_controlled_wallets.ApiException as e:
             raise NetworkError(
@@ -381,7 +584,7 @@ class CircleClient:
         """
         try:
             if not idempotency_key:
-                idempotency_key = str(uuid.uuid4())
+                idempotency_key = uuid4_str()
 
             ciphertext = self._get_ciphertext()
 
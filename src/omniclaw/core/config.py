@@ -7,7 +7,7 @@ Handles loading configuration from environment variables and validation.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any
 
 from omniclaw.core.types import Network
@@ -21,6 +21,22 @@ def _get_env_var(name: str, default: str | None = None, required: bool = False)
     return value
 
 
+# Environment variables read by Config.from_env()
+_ENV_VARS = (
+    "CIRCLE_API_KEY",
+    "ENTITY_SECRET",
+    "OMNICLAW_NETWORK",
+    "OMNICLAW_DEFAULT_WALLET",
+    "OMNICLAW_LOG_LEVEL",
+    "OMNICLAW_ENV",
+)
+
+# Configs built by Config.from_env(), keyed by (env values, overrides).
+# Config is frozen, so one instance can be handed to every caller.
+_FROM_ENV_CACHE: dict[tuple[Any, ...], Config] = {}
+_FROM_ENV_CACHE_SIZE = 64
+
+
 @dataclass(frozen=True)
 class Config:
     """SDK configuration."""
@@ -65,7 +81,34 @@ class Config:
 
     @classmethod
     def from_env(cls, **overrides: Any) -> Config:
-        """Load configuration from environment variables."""
+        """
+        Load configuration from environment variables.
+
+        Repeated calls with the same environment values and overrides return
+        the same (immutable) Config instead of re-parsing and re-validating.
+        """
+        environ = os.environ
+        key: tuple[Any, ...] | None = (
+            cls,
+            tuple(environ.get(name) for name in _ENV_VARS),
+            tuple(sorted(overrides.items())),
+        )
+        try:
+            cached = _FROM_ENV_CACHE.get(key)  # type: ignore[arg-type]
+        except TypeError:  # Unhashable override value
+            cached = key = None
+        if cached is not None:
+            return cached
+
+        config = cls._load_env(overrides)
+        if key is not None:
+            if len(_FROM_ENV_CACHE) >= _FROM_ENV_CACHE_SIZE:
+                _FROM_ENV_CACHE.clear()
+            _FROM_ENV_CACHE[key] = config
+        return config
+
+    @classmethod
+    def _load_env(cls, overrides: dict[str, Any]) -> Config:
         circle_api_key = overrides.get("circle_api_key") or _get_env_var(
             "CIRCLE_API_KEY", required=True
         )
@@ -109,23 +152,8 @@ class Config:
         )
 
     def with_updates(self, **updates: Any) -> Config:
-        """Create a new Config with updated values."""
-        current = {
-            "circle_api_key": self.circle_api_key,
-            "entity_secret": self.entity_secret,
-            "network": self.network,
-            "default_wallet_id": self.default_wallet_id,
-            "circle_api_base_url": self.circle_api_base_url,
-            "x402_facilitator_url": self.x402_facilitator_url,
-            "gateway_api_url": self.gateway_api_url,
-            "request_timeout": self.request_timeout,
-            "transaction_poll_interval": self.transaction_poll_interval,
-            "transaction_poll_timeout": self.transaction_poll_timeout,
-            "log_level": self.log_level,
-            "env": self.env,
-        }
-        current.update(updates)
-        return Config(**current)
+        """Create a new Config with updated values; unspecified fields are kept."""
+        return replace(self, **updates)
 
     def masked_api_key(self) -> str:
         """Return API key with most characters masked for safe logging."""
@@ -9,6 +9,12 @@ Reference: https://eips.ethereum.org/EIPS/eip-8004
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any
+
 from omniclaw.core.types import Network
 
 
@@ -37,6 +43,22 @@ VALIDATION_REGISTRY_ADDRESSES: dict[str, str] = {
     # Contracts not yet deployed; will be added when published by the EIP authors.
 }
 
+
+def _intern_addresses(table: dict[str, str]) -> None:
+    """Validate 20-byte hex addresses once at import and intern them."""
+    for key, address in table.items():
+        if len(address) != 42 or not address.startswith("0x"):
+            raise ValueError(f"Invalid registry address for {key}: {address}")
+        bytes.fromhex(address[2:])
+        table[key] = sys.intern(address)
+
+
+# Literals above are EIP-55 checksummed (verified in tests), so callers can pass
+# them to RPC/web3 calls as-is without re-checksumming per call
+_intern_addresses(IDENTITY_REGISTRY_ADDRESSES)
+_intern_addresses(REPUTATION_REGISTRY_ADDRESSES)
+_intern_addresses(VALIDATION_REGISTRY_ADDRESSES)
+
 # Chain IDs for agentRegistry string construction
 CHAIN_IDS: dict[str, int] = {
     "ETH": 1,
@@ -51,11 +73,34 @@ CHAIN_IDS: dict[str, int] = {
     "OP-SEPOLIA": 11155420,
 }
 
+# Networks with a deployed Identity Registry
+ERC8004_SUPPORTED: frozenset[str] = frozenset(IDENTITY_REGISTRY_ADDRESSES)
+
+# agentRegistry identifiers ({namespace}:{chainId}:{identityRegistry}), built once
+AGENT_REGISTRY_STRINGS: dict[str, str] = {
+    key: f"eip155:{CHAIN_IDS[key]}:{address}"
+    for key, address in IDENTITY_REGISTRY_ADDRESSES.items()
+    if key in CHAIN_IDS
+}
+
 
 # ───────────────────────────────────────────────────────────────────
 # Contract ABIs (minimal — only functions we need)
 # ───────────────────────────────────────────────────────────────────
 
+# Descriptors shared by the register(...) overloads
+_AGENT_URI_IN = {"name": "agentURI", "type": "string"}
+_AGENT_ID_OUT = {"name": "agentId", "type": "uint256"}
+
+# Unnamed single-value outputs, shared across all three ABIs
+_OUT_ADDRESS = {"name": "", "type": "address"}
+_OUT_ADDRESS_ARRAY = {"name": "", "type": "address[]"}
+_OUT_BYTES = {"name": "", "type": "bytes"}
+_OUT_STRING = {"name": "", "type": "string"}
+_OUT_UINT64 = {"name": "", "type": "uint64"}
+_OUT_UINT256 = {"name": "", "type": "uint256"}
+_REQUEST_HASHES_OUT = {"name": "requestHashes", "type": "bytes32[]"}
+
 IDENTITY_REGISTRY_ABI = [
     # ─── ERC-721 base functions ───
     # read: ownerOf(uint256) → address
@@ -64,7 +109,7 @@ IDENTITY_REGISTRY_ABI = [
         "type": "function",
         "stateMutability": "view",
         "inputs": [{"name": "tokenId", "type": "uint256"}],
-        "outputs": [{"name": "", "type": "address"}],
+        "outputs": [_OUT_ADDRESS],
     },
     # read: tokenURI(uint256) → string (agentURI)
     {
@@ -72,7 +117,7 @@ IDENTITY_REGISTRY_ABI = [
         "type": "function",
         "stateMutability": "view",
         "inputs": [{"name": "tokenId", "type": "uint256"}],
-        "outputs": [{"name": "", "type": "string"}],
+        "outputs": [_OUT_STRING],
     },
     # read: balanceOf(address) → uint256
     {
@@ -80,7 +125,7 @@ IDENTITY_REGISTRY_ABI = [
         "type": "function",
         "stateMutability": "view",
         "inputs": [{"name": "owner", "type": "address"}],
-        "outputs": [{"name": "", "type": "uint256"}],
+        "outputs": [_OUT_UINT256],
     },
     # read: tokenOfOwnerByIndex(address, uint256) → uint256
     {
@@ -91,7 +136,7 @@ IDENTITY_REGISTRY_ABI = [
             {"name": "owner", "type": "address"},
             {"name": "index", "type": "uint256"},
         ],
-        "outputs": [{"name": "", "type": "uint256"}],
+        "outputs": [_OUT_UINT256],
     },
 
     # ─── ERC-8004 Identity extensions ───
@@ -101,7 +146,7 @@ IDENTITY_REGISTRY_ABI = [
         "type": "function",
         "stateMutability": "view",
         "inputs": [{"name": "agentId", "type": "uint256"}],
-        "outputs": [{"name": "", "type": "address"}],
+        "outputs": [_OUT_ADDRESS],
     },
     # read: getMetadata(uint256, string) → bytes
     {
@@ -112,7 +157,7 @@ IDENTITY_REGISTRY_ABI = [
             {"name": "agentId", "type": "uint256"},
             {"name": "metadataKey", "type": "string"},
         ],
-        "outputs": [{"name": "", "type": "bytes"}],
+        "outputs": [_OUT_BYTES],
     },
     # write: register() → uint256  (no URI, add later with setAgentURI)
     {
@@ -120,15 +165,15 @@ IDENTITY_REGISTRY_ABI = [
         "type": "function",
         "stateMutability": "nonpayable",
         "inputs": [],
-        "outputs": [{"name": "agentId", "type": "uint256"}],
+        "outputs": [_AGENT_ID_OUT],
     },
     # write: register(string) → uint256  (with agentURI)
     {
         "name": "register",
         "type": "function",
         "stateMutability": "nonpayable",
-        "inputs": [{"name": "agentURI", "type": "string"}],
-        "outputs": [{"name": "agentId", "type": "uint256"}],
+        "inputs": [_AGENT_URI_IN],
+        "outputs": [_AGENT_ID_OUT],
     },
     # write: register(string, MetadataEntry[]) → uint256  (with agentURI + metadata)
     {
@@ -136,7 +181,7 @@ IDENTITY_REGISTRY_ABI = [
         "type": "function",
         "stateMutability": "nonpayable",
         "inputs": [
-            {"name": "agentURI", "type": "string"},
+            _AGENT_URI_IN,
             {
                 "name": "metadata",
                 "type": "tuple[]",
@@ -146,7 +191,7 @@ IDENTITY_REGISTRY_ABI = [
                 ],
             },
         ],
-        "outputs": [{"name": "agentId", "type": "uint256"}],
+        "outputs": [_AGENT_ID_OUT],
     },
     # write: setAgentURI(uint256, string)
     {
@@ -210,7 +255,7 @@ REPUTATION_REGISTRY_ABI = [
         "type": "function",
         "stateMutability": "view",
         "inputs": [{"name": "agentId", "type": "uint256"}],
-        "outputs": [{"name": "", "type": "address[]"}],
+        "outputs": [_OUT_ADDRESS_ARRAY],
     },
     # read: readFeedback(uint256, address, uint64) → (int128, uint8, string, string, bool)
     {
@@ -261,7 +306,7 @@ REPUTATION_REGISTRY_ABI = [
             {"name": "agentId", "type": "uint256"},
             {"name": "clientAddress", "type": "address"},
         ],
-        "outputs": [{"name": "", "type": "uint64"}],
+        "outputs": [_OUT_UINT64],
     },
     # read: getSummary(uint256, address[], string, string) → (uint64, int128, uint8)
     {
@@ -376,7 +421,7 @@ VALIDATION_REGISTRY_ABI = [
         "type": "function",
         "stateMutability": "view",
         "inputs": [{"name": "agentId", "type": "uint256"}],
-        "outputs": [{"name": "requestHashes", "type": "bytes32[]"}],
+        "outputs": [_REQUEST_HASHES_OUT],
     },
     # read: getValidatorRequests(address) → bytes32[]
     {
@@ -384,7 +429,7 @@ VALIDATION_REGISTRY_ABI = [
         "type": "function",
         "stateMutability": "view",
         "inputs": [{"name": "validatorAddress", "type": "address"}],
-        "outputs": [{"name": "requestHashes", "type": "bytes32[]"}],
+        "outputs": [_REQUEST_HASHES_OUT],
     },
     # ─── Write functions ───
     # write: validationRequest(address, uint256, string, bytes32)
@@ -417,26 +462,168 @@ VALIDATION_REGISTRY_ABI = [
 ]
 
 
+# ───────────────────────────────────────────────────────────────────
+# Function Selectors
+#
+# keccak256(signature)[:4] as hex for every function in the ABIs above,
+# keyed by canonical signature. Precomputed so callers need no keccak
+# implementation at runtime; tests re-derive them from the ABIs.
+# ───────────────────────────────────────────────────────────────────
+
+FUNCTION_SELECTORS: dict[str, str] = {
+    # ─── Identity Registry (ERC-721 base) ───
+    "ownerOf(uint256)": "6352211e",
+    "tokenURI(uint256)": "c87b56dd",
+    "balanceOf(address)": "70a08231",
+    "tokenOfOwnerByIndex(address,uint256)": "2f745c59",
+
+    # ─── Identity Registry (ERC-8004 extensions) ───
+    "register()": "1aa3a008",
+    "register(string)": "f2c298be",
+    "register(string,(string,bytes)[])": "8ea42286",
+    "setAgentURI(uint256,string)": "0af28bd3",
+    "getMetadata(uint256,string)": "cb4799f2",
+    "setMetadata(uint256,string,bytes)": "466648da",
+    "getAgentWallet(uint256)": "00339509",
+    "setAgentWallet(uint256,address,uint256,bytes)": "2d1ef5ae",
+    "unsetAgentWallet(uint256)": "3fddcf19",
+
+    # ─── Reputation Registry ───
+    "getIdentityRegistry()": "bc4d861b",
+    "giveFeedback(uint256,int128,uint8,string,string,string,string,bytes32)": "3c036a7e",
+    "revokeFeedback(uint256,uint64)": "4ab3ca99",
+    "appendResponse(uint256,address,uint64,string,bytes32)": "c2349ab2",
+    "readFeedback(uint256,address,uint64)": "232b0810",
+    "readAllFeedback(uint256,address[],string,string,bool)": "d9d84224",
+    "getSummary(uint256,address[],string,string)": "81bbba58",
+    "getResponseCount(uint256,address,uint64,address[])": "6e04cacd",
+    "getClients(uint256)": "42dd519c",
+    "getLastIndex(uint256,address)": "f2d81759",
+
+    # ─── Validation Registry ───
+    "validationRequest(address,uint256,string,bytes32)": "aaf400c4",
+    "validationResponse(bytes32,uint8,string,bytes32,string)": "3d659a96",
+    "getValidationStatus(bytes32)": "ff2febfc",
+    "getSummary(uint256,address[],string)": "1b7cabd6",
+    "getAgentValidations(uint256)": "8d5d0c2d",
+    "getValidatorRequests(address)": "4bf3158c",
+}
+
+
+def _freeze(value: Any, memo: dict[int, Any] | None = None) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples.
+
+    ``memo`` maps already-frozen objects by id so shared descriptors stay shared.
+    """
+    if memo is None:
+        memo = {}
+    frozen = memo.get(id(value))
+    if frozen is not None:
+        return frozen
+    if isinstance(value, dict):
+        frozen = MappingProxyType({k: _freeze(v, memo) for k, v in value.items()})
+    elif isinstance(value, list):
+        frozen = tuple(_freeze(v, memo) for v in value)
+    else:
+        return value
+    memo[id(value)] = frozen
+    return frozen
+
+
+def _canonical_type(param: Mapping[str, Any]) -> str:
+    """Canonical ABI type, expanding tuple components recursively."""
+    abi_type = str(param["type"])
+    if abi_type.startswith("tuple"):
+        inner = ",".join(_canonical_type(c) for c in param["components"])
+        return f"({inner}){abi_type[5:]}"
+    return abi_type
+
+
+def _signature(entry: Mapping[str, Any]) -> str:
+    """Canonical function signature, e.g. ``register(string,(string,bytes)[])``."""
+    return f"{entry['name']}({','.join(_canonical_type(p) for p in entry['inputs'])})"
+
+
+class AbiRegistry:
+    """
+    Function lookup over one contract ABI.
+
+    Entries are addressed by ``(name, arity)`` so overloads such as
+    ``register()`` / ``register(string)`` resolve without scanning the list.
+    Tables are built on first use.
+    """
+
+    def __init__(self, entries: tuple[Mapping[str, Any], ...]) -> None:
+        self.entries = entries
+
+    @cached_property
+    def _by_name(self) -> dict[tuple[str, int], Mapping[str, Any]]:
+        return {(e["name"], len(e["inputs"])): e for e in self.entries}
+
+    @cached_property
+    def _signatures(self) -> dict[tuple[str, int], str]:
+        return {key: _signature(e) for key, e in self._by_name.items()}
+
+    @cached_property
+    def selectors(self) -> dict[str, str]:
+        """Canonical signature → 4-byte selector (hex) for every function."""
+        return {sig: FUNCTION_SELECTORS[sig] for sig in self._signatures.values()}
+
+    def by_name(self, name: str, arity: int) -> Mapping[str, Any]:
+        """Get the ABI entry for a function."""
+        return self._by_name[(name, arity)]
+
+    def signature(self, name: str, arity: int) -> str:
+        """Get the canonical signature of a function."""
+        return self._signatures[(name, arity)]
+
+    def selector(self, name: str, arity: int) -> str:
+        """Get the 4-byte selector (hex) of a function."""
+        return FUNCTION_SELECTORS[self._signatures[(name, arity)]]
+
+
+# ABIs are read-only config: freeze them so they can be shared without copies
+# in one call, so the id-keyed memo only ever sees live source objects
+IDENTITY_REGISTRY_ABI, REPUTATION_REGISTRY_ABI, VALIDATION_REGISTRY_ABI = _freeze(
+    [IDENTITY_REGISTRY_ABI, REPUTATION_REGISTRY_ABI, VALIDATION_REGISTRY_ABI]
+)
+
+IDENTITY_REGISTRY = AbiRegistry(IDENTITY_REGISTRY_ABI)
+REPUTATION_REGISTRY = AbiRegistry(REPUTATION_REGISTRY_ABI)
+VALIDATION_REGISTRY = AbiRegistry(VALIDATION_REGISTRY_ABI)
+
+
 # ───────────────────────────────────────────────────────────────────
 # Helper Functions
 # ───────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=64)
+def _norm_name(network: str) -> str:
+    return str(network).upper()
+
+
+def _norm_key(network: Network | str) -> str:
+    """Normalize a network enum or name to the upper-case table key."""
+    if network.__class__ is Network:
+        # Enum values are already upper-case table keys; _value_ skips the
+        # enum property descriptor behind .value
+        return network._value_
+    return _norm_name(network)
+
+
 def get_identity_registry(network: Network | str) -> str | None:
     """Get Identity Registry address for a network."""
-    key = network.value if isinstance(network, Network) else str(network).upper()
-    return IDENTITY_REGISTRY_ADDRESSES.get(key)
+    return IDENTITY_REGISTRY_ADDRESSES.get(_norm_key(network))
 
 
 def get_reputation_registry(network: Network | str) -> str | None:
     """Get Reputation Registry address for a network."""
-    key = network.value if isinstance(network, Network) else str(network).upper()
-    return REPUTATION_REGISTRY_ADDRESSES.get(key)
+    return REPUTATION_REGISTRY_ADDRESSES.get(_norm_key(network))
 
 
 def get_chain_id(network: Network | str) -> int | None:
     """Get chain ID for a network."""
-    key = network.value if isinstance(network, Network) else str(network).upper()
-    return CHAIN_IDS.get(key)
+    return CHAIN_IDS.get(_norm_key(network))
 
 
 def get_validation_registry(network: Network | str) -> str | None:
@@ -445,8 +632,7 @@ def get_validation_registry(network: Network | str) -> str | None:
     NOTE: Validation Registry contracts are not yet deployed (EIP-8004 v1).
     This will return None until contracts go live (expected Q3 2026).
     """
-    key = network.value if isinstance(network, Network) else str(network).upper()
-    return VALIDATION_REGISTRY_ADDRESSES.get(key)
+    return VALIDATION_REGISTRY_ADDRESSES.get(_norm_key(network))
 
 
 def build_agent_registry_string(network: Network | str) -> str | None:
@@ -456,16 +642,12 @@ def build_agent_registry_string(network: Network | str) -> str | None:
     Format: {namespace}:{chainId}:{identityRegistry}
     Example: eip155:1:0x8004A169FB4a3325136EB29fA0ceB6D2e539a432
     """
-    chain_id = get_chain_id(network)
-    identity_addr = get_identity_registry(network)
-    if chain_id is None or identity_addr is None:
-        return None
-    return f"eip155:{chain_id}:{identity_addr}"
+    return AGENT_REGISTRY_STRINGS.get(_norm_key(network))
 
 
 def is_erc8004_supported(network: Network | str) -> bool:
     """Check if ERC-8004 registries are deployed on this network."""
-    return get_identity_registry(network) is not None
+    return _norm_key(network) in ERC8004_SUPPORTED
 
 
 __all__ = [
@@ -475,7 +657,14 @@ __all__ = [
     "IDENTITY_REGISTRY_ABI",
     "REPUTATION_REGISTRY_ABI",
     "VALIDATION_REGISTRY_ABI",
+    "FUNCTION_SELECTORS",
+    "AbiRegistry",
+    "IDENTITY_REGISTRY",
+    "REPUTATION_REGISTRY",
+    "VALIDATION_REGISTRY",
     "CHAIN_IDS",
+    "AGENT_REGISTRY_STRINGS",
+    "ERC8004_SUPPORTED",
     "get_identity_registry",
     "get_reputation_registry",
     "get_validation_registry",
@@ -6,8 +6,42 @@ All SDK-specific exceptions inherit from OmniClawError for easy catching.
 
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import Any
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+
+class X402Stage(str, Enum):
+    """Stage of the x402 flow at which an X402Error was raised."""
+
+    REQUIREMENTS = "requirements"
+    VERIFICATION = "verification"
+    SETTLEMENT = "settlement"
+    ACCESS = "access"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class CrosschainMethod(str, Enum):
+    """Transfer mechanism that raised a CrosschainError."""
+
+    BRIDGE_KIT = "bridge_kit"
+    CCTP = "cctp"
+    GATEWAY = "gateway"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+def _as_member(enum_cls: type[Enum], value: Any) -> Any:
+    """Map a known value onto its enum member, passing unknown values through."""
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return value
 
 
 class OmniClawError(Exception):
@@ -23,11 +57,22 @@ class OmniClawError(Exception):
         ...     print(f"Payment SDK error: {e}")
     """
 
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
         super().__init__(message)
         self.message = message
         self.details = details or {}
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # BaseException only pickles __dict__; carry slot attributes as well
+        state = dict(getattr(self, "__dict__", {}))
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (type(self), self.args, state)
+
     def __str__(self) -> str:
         if self.details:
             return f"{self.message} | Details: {self.details}"
@@ -44,7 +89,7 @@ class ConfigurationError(OmniClawError):
     - Environment variables are not set
     """
 
-    pass
+    __slots__ = ()
 
 
 class WalletError(OmniClawError):
@@ -57,6 +102,8 @@ class WalletError(OmniClawError):
     - Wallet is in invalid state (e.g., frozen)
     """
 
+    __slots__ = ("wallet_id",)
+
     def __init__(
         self,
         message: str,
@@ -77,6 +124,8 @@ class PaymentError(OmniClawError):
     - External services return errors
     """
 
+    __slots__ = ("recipient", "amount")
+
     def __init__(
         self,
         message: str,
@@ -106,6 +155,8 @@ class GuardError(PaymentError):
         ...     print(f"Blocked by {e.guard_name}: {e.reason}")
     """
 
+    __slots__ = ("guard_name", "reason")
+
     def __init__(
         self,
         message: str,
@@ -133,6 +184,8 @@ class ProtocolError(PaymentError):
     - Unsupported protocol features
     """
 
+    __slots__ = ("protocol",)
+
     def __init__(
         self,
         message: str,
@@ -155,7 +208,7 @@ class ValidationError(OmniClawError):
     - Parameter values are invalid
     """
 
-    pass
+    __slots__ = ()
 
 
 class InsufficientBalanceError(PaymentError):
@@ -167,6 +220,8 @@ class InsufficientBalanceError(PaymentError):
     - Balance check fails before payment execution
     """
 
+    __slots__ = ("current_balance", "required_amount", "wallet_id", "shortfall", "_str_cache")
+
     def __init__(
         self,
         message: str,
@@ -180,13 +235,17 @@ class InsufficientBalanceError(PaymentError):
         self.required_amount = required_amount
         self.wallet_id = wallet_id
         self.shortfall = required_amount - current_balance
+        self._str_cache: str | None = None
 
     def __str__(self) -> str:
-        return (
-            f"{self.message} | "
-            f"Balance: {self.current_balance}, Required: {self.required_amount}, "
-            f"Shortfall: {self.shortfall}"
-        )
+        # Rendered once; loggers and retry wrappers format the same error repeatedly
+        if self._str_cache is None:
+            self._str_cache = (
+                f"{self.message} | "
+                f"Balance: {self.current_balance}, Required: {self.required_amount}, "
+                f"Shortfall: {self.shortfall}"
+            )
+        return self._str_cache
 
 
 class NetworkError(OmniClawError):
@@ -199,6 +258,8 @@ class NetworkError(OmniClawError):
     - Rate limiting encountered
     """
 
+    __slots__ = ("status_code", "url", "_is_rate_limited", "_is_server_error")
+
     def __init__(
         self,
         message: str,
@@ -209,14 +270,17 @@ class NetworkError(OmniClawError):
         super().__init__(message, details)
         self.status_code = status_code
         self.url = url
+        # Classified once; retry and logging paths query these repeatedly
+        self._is_rate_limited = status_code == 429
+        self._is_server_error = status_code is not None and 500 <= status_code < 600
 
     def is_rate_limited(self) -> bool:
         """Check if this is a rate limit error."""
-        return self.status_code == 429
+        return self._is_rate_limited
 
     def is_server_error(self) -> bool:
         """Check if this is a server-side error."""
-        return self.status_code is not None and 500 <= self.status_code < 600
+        return self._is_server_error
 
 
 class X402Error(PaymentError):
@@ -230,19 +294,24 @@ class X402Error(PaymentError):
     - Resource access denied after payment
     """
 
+    __slots__ = ("url", "stage", "_str_cache")
+
     def __init__(
         self,
         message: str,
         url: str,
-        stage: str,  # "requirements", "verification", "settlement", "access"
+        stage: X402Stage | str,
         details: dict[str, Any] | None = None,
     ) -> None:
         super().__init__(message, recipient=url, details=details)
         self.url = url
-        self.stage = stage
+        self.stage = _as_member(X402Stage, stage)
+        self._str_cache: str | None = None
 
     def __str__(self) -> str:
-        return f"[x402:{self.stage}] {self.message} (URL: {self.url})"
+        if self._str_cache is None:
+            self._str_cache = f"[x402:{self.stage}] {self.message} (URL: {self.url})"
+        return self._str_cache
 
 
 class CrosschainError(PaymentError):
@@ -255,24 +324,29 @@ class CrosschainError(PaymentError):
     - Gateway deposit/mint fails
     """
 
+    __slots__ = ("source_chain", "destination_chain", "method", "_str_cache")
+
     def __init__(
         self,
         message: str,
         source_chain: str,
         destination_chain: str,
-        method: str,  # "bridge_kit", "cctp", "gateway"
+        method: CrosschainMethod | str,
         details: dict[str, Any] | None = None,
     ) -> None:
         super().__init__(message, details=details)
         self.source_chain = source_chain
         self.destination_chain = destination_chain
-        self.method = method
+        self.method = _as_member(CrosschainMethod, method)
+        self._str_cache: str | None = None
 
     def __str__(self) -> str:
-        return (
-            f"[crosschain:{self.method}] {self.message} "
-            f"({self.source_chain} → {self.destination_chain})"
-        )
+        if self._str_cache is None:
+            self._str_cache = (
+                f"[crosschain:{self.method}] {self.message} "
+                f"({self.source_chain} → {self.destination_chain})"
+            )
+        return self._str_cache
 
 
 class TransactionTimeoutError(PaymentError):
@@ -284,6 +358,8 @@ class TransactionTimeoutError(PaymentError):
     - Polling for transaction status exceeded timeout
     """
 
+    __slots__ = ("transaction_id", "last_state", "timeout_seconds")
+
     def __init__(
         self,
         message: str,
@@ -307,6 +383,8 @@ class IdempotencyError(PaymentError):
     - Previous payment with same key has different outcome
     """
 
+    __slots__ = ("idempotency_key", "existing_transaction_id")
+
     def __init__(
         self,
         message: str,
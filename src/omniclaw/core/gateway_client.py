@@ -7,8 +7,10 @@ off-chain signing of burn intents for gasless USDC transfers.
 
 from __future__ import annotations
 
+import asyncio
 import secrets
 import struct
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
@@ -39,8 +41,56 @@ DOMAIN_TO_NETWORK = {
     6: Network.BASE,
 }
 
-
-@dataclass
+# HTTP clients shared by every GatewayAPIClient on the same event loop with the
+# same pool settings (an httpx.AsyncClient's connections are bound to one loop),
+# and how many open GatewayAPIClients use each one
+_PoolKey = tuple[asyncio.AbstractEventLoop, tuple[Any, ...]]
+_SHARED_CLIENTS: dict[_PoolKey, httpx.AsyncClient] = {}
+_SHARED_CLIENT_REFS: dict[_PoolKey, int] = {}
+
+
+def _acquire_client(key: _PoolKey, factory: Callable[[], httpx.AsyncClient]) -> httpx.AsyncClient:
+    """Take a reference to the pooled HTTP client for ``key``, creating it once."""
+    client = _SHARED_CLIENTS.get(key)
+    if client is None or client.is_closed:
+        client = _SHARED_CLIENTS[key] = factory()
+        _SHARED_CLIENT_REFS[key] = 1
+    else:
+        _SHARED_CLIENT_REFS[key] += 1
+    return client
+
+
+def _release_client(key: _PoolKey, client: httpx.AsyncClient) -> httpx.AsyncClient | None:
+    """Drop a reference to a pooled HTTP client; returns it if it is now unused."""
+    # Already dropped (and closed) by close_shared_clients()
+    if _SHARED_CLIENTS.get(key) is not client:
+        return None
+    refs = _SHARED_CLIENT_REFS[key] - 1
+    if refs:
+        _SHARED_CLIENT_REFS[key] = refs
+        return None
+    del _SHARED_CLIENTS[key], _SHARED_CLIENT_REFS[key]
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close every Gateway HTTP client created on the running event loop."""
+    loop = asyncio.get_running_loop()
+    keys = [key for key in _SHARED_CLIENTS if key[0] is loop]
+    for key in keys:
+        client = _SHARED_CLIENTS.pop(key)
+        del _SHARED_CLIENT_REFS[key]
+        await client.aclose()
+
+
+def _fan_out_semaphore(concurrency: int) -> asyncio.Semaphore:
+    """Semaphore bounding a request fan-out; a bound below 1 would never admit one."""
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    return asyncio.Semaphore(concurrency)
+
+
+@dataclass(slots=True)
 class TransferSpec:
     """Specification for a Gateway transfer (EIP-712 compatible)."""
 
@@ -79,7 +129,7 @@ class TransferSpec:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BurnIntent:
     """A burn intent for gasless transfer via Gateway."""
 
@@ -96,7 +146,7 @@ class BurnIntent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SignedBurnIntent:
     """A signed burn intent ready for Gateway API submission."""
 
@@ -165,11 +215,17 @@ class GatewayAPIClient:
         6: "Base",
     }
 
+    # Idle connections are kept this long so bursts reuse TLS sessions
+    KEEPALIVE_EXPIRY = 30.0
+
     def __init__(
         self,
         base_url: str | None = None,
         is_testnet: bool = True,
         timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive: int = 100,
+        http2: bool = False,
     ) -> None:
         """
         Initialize Gateway API client.
@@ -178,26 +234,60 @@ class GatewayAPIClient:
             base_url: Override base URL (uses testnet/mainnet defaults if None)
             is_testnet: Use testnet URL if base_url not provided
             timeout: Request timeout in seconds
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive: Maximum idle connections kept open for reuse
+            http2: Multiplex requests over HTTP/2 (requires ``httpx[http2]``)
         """
         self._base_url = base_url or (
             self.TESTNET_BASE_URL if is_testnet else self.MAINNET_BASE_URL
         )
         self._timeout = timeout
+        self._max_connections = max_connections
+        self._max_keepalive = max_keepalive
+        self._http2 = http2
+        self._pool_key = (self._base_url, timeout, max_connections, max_keepalive, http2)
+        self._held: tuple[_PoolKey, httpx.AsyncClient] | None = None
         self._logger = get_logger("gateway_api")
-        self._http_client: httpx.AsyncClient | None = None
+
+    def _new_client(self) -> httpx.AsyncClient:
+        import httpx
+
+        return httpx.AsyncClient(
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_keepalive,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY,
+            ),
+            http2=self._http2,
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None:
-            import httpx
-            self._http_client = httpx.AsyncClient(timeout=self._timeout)
-        return self._http_client
+        """Get the HTTP client shared by clients with the same settings."""
+        key = (asyncio.get_running_loop(), self._pool_key)
+        held = self._held
+        if held is not None:
+            if held[0] == key and not held[1].is_closed:
+                return held[1]
+            # Pool from another (finished) loop; its connections die with it
+            _release_client(*held)
+        client = _acquire_client(key, self._new_client)
+        self._held = (key, client)
+        return client
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        """
+        Release this client's use of the shared HTTP client.
+
+        The pool is closed once no open GatewayAPIClient with the same settings
+        on this event loop is using it. Idempotent.
+        """
+        held, self._held = self._held, None
+        if held is None:
+            return
+        client = _release_client(*held)
+        if client is not None:
+            await client.aclose()
 
     async def _get(self, path: str) -> dict[str, Any]:
         """Make GET request to Gateway API."""
@@ -321,6 +411,63 @@ class GatewayAPIClient:
         }
         return await self._post("/estimate", body)
 
+    async def estimate_many(
+        self,
+        transfers: list[tuple[int, int, int]],
+        concurrency: int = 10,
+    ) -> list[dict[str, Any]]:
+        """
+        Estimate fees for several transfers concurrently.
+
+        Args:
+            transfers: ``(source_domain, destination_domain, amount)`` per transfer
+            concurrency: Maximum concurrent estimate requests
+
+        Returns:
+            Fee estimations in the same order as ``transfers``
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        semaphore = _fan_out_semaphore(concurrency)
+
+        async def estimate(transfer: tuple[int, int, int]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.estimate_transfer(*transfer)
+
+        return list(await asyncio.gather(*(estimate(t) for t in transfers)))
+
+    async def balances_many(
+        self,
+        token: str,
+        depositors: list[str],
+        domains: list[int] | None = None,
+        concurrency: int = 10,
+    ) -> dict[str, list[GatewayBalance]]:
+        """
+        Get unified token balances for several depositors concurrently.
+
+        Args:
+            token: Token symbol (e.g. "USDC")
+            depositors: Depositor addresses (checksummed)
+            domains: Optional list of domain IDs to check
+            concurrency: Maximum concurrent balance requests
+
+        Returns:
+            Balances per domain, keyed by depositor
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        semaphore = _fan_out_semaphore(concurrency)
+
+        async def fetch(depositor: str) -> list[GatewayBalance]:
+            async with semaphore:
+                return await self.balances(token, depositor, domains)
+
+        results = await asyncio.gather(*(fetch(depositor) for depositor in depositors))
+        return dict(zip(depositors, results, strict=True))
+
 
 def generate_salt() -> str:
     """Generate a random 32-byte salt for burn intent."""
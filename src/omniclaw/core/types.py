@@ -5,8 +5,10 @@ This module contains all the enums, data classes, and type definitions
 used throughout the SDK.
 """
 
+import functools
+import os
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import (
@@ -18,6 +20,33 @@ from typing import (
 AmountType: TypeAlias = Decimal | int | float | str
 
 
+def as_decimal(value: AmountType) -> Decimal:
+    """Normalize an amount to Decimal, passing Decimals through without a str() round-trip."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(value if isinstance(value, str) else str(value))
+
+
+def _sdk_value(value: Any) -> Any:
+    """Unwrap an SDK enum to its raw value, as the SDK's to_dict() would."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def uuid4_str() -> str:
+    """
+    Return a random RFC 4122 version 4 UUID string.
+
+    Equivalent to str(uuid4()) but formats the random bytes directly instead
+    of going through the uuid.UUID constructor and its int round-trip. Circle
+    requires idempotency keys in this format.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class Network(str, Enum):
     """Supported blockchain networks for Circle Developer-Controlled Wallets."""
 
@@ -74,11 +103,9 @@ class Network(str, Enum):
 
     @classmethod
     def from_string(cls, value: str) -> "Network":
-        value_upper = value.upper().replace("_", "-")
-        for member in cls:
-            if member.value == value_upper:
-                return member
-        raise ValueError(f"Unknown network: {value}. Supported: {[n.value for n in cls]}")
+        if isinstance(value, cls):
+            return value
+        return _network_from_string(value)
 
     def is_testnet(self) -> bool:
         testnet_suffix = ("-SEPOLIA", "-TESTNET", "-FUJI", "-DEVNET", "-AMOY")
@@ -99,6 +126,16 @@ class Network(str, Enum):
         return self in (Network.SOL, Network.SOL_DEVNET)
 
 
+@functools.lru_cache(maxsize=256)
+def _network_from_string(value: str) -> Network:
+    """Resolve a network name once per distinct spelling instead of scanning members."""
+    value_upper = value.upper().replace("_", "-")
+    for member in Network:
+        if member.value == value_upper:
+            return member
+    raise ValueError(f"Unknown network: {value}. Supported: {[n.value for n in Network]}")
+
+
 def normalize_network(network: Network | str | None) -> Network | None:
     """
     Normalize a network value to a Network enum.
@@ -124,6 +161,14 @@ def normalize_network(network: Network | str | None) -> Network | None:
     return Network.from_string(str(network))
 
 
+def _utc_datetime(value: str) -> datetime:
+    """Parse an ISO timestamp, treating naive values (older records) as UTC."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
 class PaymentStrategy(str, Enum):
     """Strategy for handling payment execution reliability."""
 
@@ -204,6 +249,10 @@ class FeeLevel(str, Enum):
     HIGH = "HIGH"
 
 
+# USDC symbols used by Circle on mainnets and testnets
+_USDC_SYMBOLS = frozenset({"USDC", "USDC-TESTNET"})
+
+
 @dataclass
 class TokenInfo:
     """Token information from Circle API."""
@@ -217,6 +266,11 @@ class TokenInfo:
     token_address: str | None = None
     standard: str | None = None
 
+    @functools.cached_property
+    def is_usdc(self) -> bool:
+        """Whether this token is USDC (mainnet or testnet symbol), computed once."""
+        return self.symbol.upper() in _USDC_SYMBOLS
+
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> "TokenInfo":
         return cls(
@@ -230,6 +284,20 @@ class TokenInfo:
             standard=data.get("standard"),
         )
 
+    @classmethod
+    def from_sdk_model(cls, model: Any) -> "TokenInfo":
+        """Build from a Circle SDK Token model without a to_dict() round-trip."""
+        return cls(
+            id=model.id,
+            blockchain=_sdk_value(model.blockchain),
+            symbol=model.symbol or "",
+            name=model.name or "",
+            decimals=model.decimals,
+            is_native=bool(model.is_native),
+            token_address=model.token_address,
+            standard=_sdk_value(model.standard),
+        )
+
 
 @dataclass
 class Balance:
@@ -249,6 +317,14 @@ class Balance:
             token=TokenInfo.from_api_response(data["token"]),
         )
 
+    @classmethod
+    def from_sdk_model(cls, model: Any) -> "Balance":
+        """Build from a Circle SDK Balance model without a to_dict() round-trip."""
+        return cls(
+            amount=Decimal(model.amount),
+            token=TokenInfo.from_sdk_model(model.token),
+        )
+
 
 @dataclass
 class WalletSetInfo:
@@ -319,6 +395,22 @@ class WalletInfo:
             update_date=parse_dt(data.get("updateDate")),
         )
 
+    @classmethod
+    def from_sdk_model(cls, model: Any) -> "WalletInfo":
+        """Build from a Circle SDK wallet model without a to_dict() round-trip."""
+        return cls(
+            id=model.id,
+            address=model.address,
+            blockchain=_sdk_value(model.blockchain),
+            state=WalletState(_sdk_value(model.state)),
+            wallet_set_id=model.wallet_set_id,
+            custody_type=CustodyType(_sdk_value(model.custody_type)),
+            account_type=AccountType(_sdk_value(model.account_type)),
+            name=model.name,
+            create_date=model.create_date,
+            update_date=model.update_date,
+        )
+
 
 @dataclass
 class TransactionInfo:
@@ -365,6 +457,26 @@ class TransactionInfo:
             error_reason=data.get("errorReason"),
         )
 
+    @classmethod
+    def from_sdk_model(cls, model: Any) -> "TransactionInfo":
+        """Build from a Circle SDK Transaction model without a to_dict() round-trip."""
+        fee_level = _sdk_value(model.fee_level)
+        return cls(
+            id=model.id,
+            state=TransactionState(_sdk_value(model.state)),
+            blockchain=_sdk_value(model.blockchain),
+            tx_hash=model.tx_hash,
+            wallet_id=model.wallet_id,
+            source_address=model.source_address,
+            destination_address=model.destination_address,
+            token_id=model.token_id,
+            amounts=list(model.amounts or ()),
+            fee_level=FeeLevel(fee_level) if fee_level else None,
+            create_date=model.create_date,
+            update_date=model.update_date,
+            error_reason=model.error_reason,
+        )
+
     def is_terminal(self) -> bool:
         return self.state in (
             TransactionState.COMPLETE,
@@ -442,10 +554,8 @@ class PaymentIntent:
             amount=Decimal(data["amount"]),
             currency=data["currency"],
             status=PaymentIntentStatus(data["status"]),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            expires_at=datetime.fromisoformat(data["expires_at"])
-            if data.get("expires_at")
-            else None,
+            created_at=_utc_datetime(data["created_at"]),
+            expires_at=_utc_datetime(data["expires_at"]) if data.get("expires_at") else None,
             purpose=data.get("purpose"),
             cancel_reason=data.get("cancel_reason"),
             reserved_amount=Decimal(data["reserved_amount"]) if data.get("reserved_amount") else None,
@@ -454,7 +564,7 @@ class PaymentIntent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentResult:
     """Result of a payment operation."""
 
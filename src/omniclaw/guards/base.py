@@ -6,6 +6,7 @@ Guards provide spending controls for AI agent payments.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from decimal import Decimal
@@ -37,7 +38,7 @@ class GuardResult:
         return self.allowed
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentContext:
     """
     Context for a payment being checked by guards.
@@ -119,10 +120,12 @@ class GuardChain:
 
     def __init__(self, guards: list[Guard] | None = None) -> None:
         self._guards: list[Guard] = guards or []
+        self._names: tuple[str, ...] | None = None
 
     def add(self, guard: Guard) -> GuardChain:
         """Add a guard to the chain."""
         self._guards.append(guard)
+        self._names = None
         return self
 
     def remove(self, name: str) -> bool:
@@ -130,6 +133,7 @@ class GuardChain:
         for i, guard in enumerate(self._guards):
             if guard.name == name:
                 del self._guards[i]
+                self._names = None
                 return True
         return False
 
@@ -145,6 +149,13 @@ class GuardChain:
         """Get all guards in the chain."""
         return list(self._guards)
 
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Names of the guards in chain order, computed once until the chain changes."""
+        if self._names is None:
+            self._names = tuple(guard.name for guard in self._guards)
+        return self._names
+
     async def check(self, context: PaymentContext) -> GuardResult:
         """
         Run all guards and return result.
@@ -170,6 +181,55 @@ class GuardChain:
             metadata={"passed_guards": passed_guards},
         )
 
+    async def check_parallel(self, context: PaymentContext) -> GuardResult:
+        """
+        Run all guard checks concurrently and return the combined result.
+
+        Unlike check(), guards do not run in chain order: each guard's check()
+        must be free of side effects and must not depend on another guard
+        having run first (stateful work belongs in reserve()). Remaining checks
+        are cancelled as soon as one guard blocks. If several guards block, the
+        earliest one in chain order among those finished is reported.
+        """
+        if not self._guards:
+            return GuardResult(
+                allowed=True,
+                reason="All guards passed",
+                guard_name="chain",
+                metadata={"passed_guards": []},
+            )
+
+        tasks = [asyncio.ensure_future(guard.check(context)) for guard in self._guards]
+        pending = set(tasks)
+        blocked: GuardResult | None = None
+        try:
+            while pending and blocked is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if task in done and not task.result().allowed:
+                        blocked = task.result()
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        passed_guards = [
+            guard.name
+            for guard, task in zip(self._guards, tasks, strict=True)
+            if task.done() and not task.cancelled() and task.result().allowed
+        ]
+        if blocked is not None:
+            blocked.metadata = blocked.metadata or {}
+            blocked.metadata["passed_guards"] = passed_guards
+            return blocked
+
+        return GuardResult(
+            allowed=True,
+            reason="All guards passed",
+            guard_name="chain",
+            metadata={"passed_guards": passed_guards},
+        )
+
     async def check_all(self, context: PaymentContext) -> list[GuardResult]:
         """
         Run all guards and return all results.
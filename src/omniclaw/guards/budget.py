@@ -6,13 +6,26 @@ Tracks cumulative spending and enforces daily/hourly/total budgets.
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
+from omniclaw.core.types import as_decimal
 from omniclaw.guards.base import Guard, GuardResult, PaymentContext
 from omniclaw.storage import StorageBackend
 
+_ZERO = Decimal("0")
+
+
+def _parse_counter(value: Any) -> Decimal:
+    """Parse a stored budget counter (bare value or {"value": ...} record) to Decimal."""
+    if value is None:
+        return _ZERO
+    if isinstance(value, dict):
+        value = value.get("value", "0")
+    return as_decimal(value)
+
 
 class BudgetGuard(Guard):
     """
@@ -45,9 +58,10 @@ class BudgetGuard(Guard):
             raise ValueError("At least one limit must be specified")
 
         self._name = name
-        self._daily_limit = daily_limit
-        self._hourly_limit = hourly_limit
-        self._total_limit = total_limit
+        # Normalized once so the per-payment comparisons are Decimal-to-Decimal
+        self._daily_limit = None if daily_limit is None else as_decimal(daily_limit)
+        self._hourly_limit = None if hourly_limit is None else as_decimal(hourly_limit)
+        self._total_limit = None if total_limit is None else as_decimal(total_limit)
         self._storage = storage
 
     def bind_storage(self, storage: StorageBackend) -> None:
@@ -119,6 +133,7 @@ class BudgetGuard(Guard):
         """Check if payment fits within budget limits."""
         amount = context.amount
         wallet_id = context.wallet_id
+        remaining = {}
 
         # Check hourly limit
         if self._hourly_limit is not None:
@@ -139,6 +154,8 @@ class BudgetGuard(Guard):
                         "requested": str(amount),
                     },
                 )
+            if self._hourly_limit:
+                remaining["hourly"] = self._hourly_limit - hourly_spent
 
         # Check daily limit
         if self._daily_limit is not None:
@@ -159,6 +176,8 @@ class BudgetGuard(Guard):
                         "requested": str(amount),
                     },
                 )
+            if self._daily_limit:
+                remaining["daily"] = self._daily_limit - daily_spent
 
         # Check total limit
         if self._total_limit is not None:
@@ -180,11 +199,6 @@ class BudgetGuard(Guard):
                     },
                 )
 
-        remaining = {}
-        if self._hourly_limit:
-            remaining["hourly"] = self._hourly_limit - await self.get_hourly_spent(wallet_id)
-        if self._daily_limit:
-            remaining["daily"] = self._daily_limit - await self.get_daily_spent(wallet_id)
 
         return GuardResult(
             allowed=True,
@@ -216,6 +230,7 @@ class BudgetGuard(Guard):
             return None
 
         amount = context.amount
+        amount_str = str(amount)
         wallet_id = context.wallet_id
         now = datetime.now()
 
@@ -233,23 +248,16 @@ class BudgetGuard(Guard):
                 key_main = key_base
                 limit = getattr(self, f"_{limit_type}_limit")
 
-                # Optimistic Increment Reserved
-                await self._storage.atomic_add("guard_state", key_reserved, str(amount))
+                # Optimistic Increment Reserved; atomic_add returns the new
+                # reserved total, so only the committed counter needs a read.
+                new_reserved = await self._storage.atomic_add(
+                    "guard_state", key_reserved, amount_str
+                )
                 reserved_keys.append(key_reserved)
 
-                # Fetch Check
                 main_data = await self._storage.get("guard_state", key_main)
-                res_data = await self._storage.get("guard_state", key_reserved)
-
-                def _parse_val(d: Any) -> Decimal:
-                    if d is None:
-                        return Decimal("0")
-                    if isinstance(d, dict):
-                        return Decimal(str(d.get("value", "0")))
-                    return Decimal(str(d))
-
-                current_main = _parse_val(main_data)
-                current_res = _parse_val(res_data)
+                current_main = _parse_counter(main_data)
+                current_res = _parse_counter(new_reserved)
 
                 if current_main + current_res > limit:
                     raise ValueError(
@@ -263,15 +271,12 @@ class BudgetGuard(Guard):
             raise
 
         # Token = JSON string with context to reconstruct keys
-        import json
-
-        token_data = {"v": 2, "w": wallet_id, "a": str(amount), "ts": now.isoformat()}
+        token_data = {"v": 2, "w": wallet_id, "a": amount_str, "ts": now.isoformat()}
         return json.dumps(token_data)
 
     async def commit(self, token: str | None) -> None:
         if not token or not self._storage:
             return
-        import json
 
         try:
             data = json.loads(token)
@@ -279,6 +284,7 @@ class BudgetGuard(Guard):
                 return
 
             amount = Decimal(data["a"])
+            neg_amount = str(-amount)
             wallet_id = data["w"]
             ts = datetime.fromisoformat(data["ts"])
 
@@ -290,8 +296,8 @@ class BudgetGuard(Guard):
                 key_reserved = f"{key_base}:reserved"
 
                 # Move Reserved -> Main
-                await self._storage.atomic_add("guard_state", key_base, str(amount))
-                await self._storage.atomic_add("guard_state", key_reserved, str(-amount))
+                await self._storage.atomic_add("guard_state", key_base, data["a"])
+                await self._storage.atomic_add("guard_state", key_reserved, neg_amount)
 
         except Exception:
             pass  # Best effort commit? Or log failure.
@@ -299,7 +305,6 @@ class BudgetGuard(Guard):
     async def release(self, token: str | None) -> None:
         if not token or not self._storage:
             return
-        import json
 
         try:
             data = json.loads(token)
@@ -326,9 +331,7 @@ class BudgetGuard(Guard):
             return Decimal("0")
         key = f"budget:{wallet_id}:{self.name}:total"
         data = await self._storage.get("guard_state", key)
-        if isinstance(data, dict):
-            return Decimal(str(data.get("value", "0")))
-        return Decimal(str(data) if data else "0")
+        return _parse_counter(data) if data else _ZERO
 
     def reset(self) -> None:
         pass
@@ -9,6 +9,7 @@ Clean architecture following the Ledger pattern:
 
 from __future__ import annotations
 
+import time
 import uuid
 from dataclasses import dataclass, field
 from decimal import Decimal
@@ -17,6 +18,11 @@ from typing import TYPE_CHECKING, Any
 
 from omniclaw.core.logging import get_logger
 from omniclaw.guards.base import Guard, GuardChain, PaymentContext
+from omniclaw.guards.budget import BudgetGuard
+from omniclaw.guards.confirm import ConfirmGuard
+from omniclaw.guards.rate_limit import RateLimitGuard
+from omniclaw.guards.recipient import RecipientGuard
+from omniclaw.guards.single_tx import SingleTxGuard
 
 if TYPE_CHECKING:
     from omniclaw.storage.base import StorageBackend
@@ -52,6 +58,8 @@ class GuardConfig:
     # Recipient guard params
     recipient_mode: str = "whitelist"  # "whitelist" or "blacklist"
     recipient_addresses: list[str] = field(default_factory=list)
+    recipient_patterns: list[str] = field(default_factory=list)
+    recipient_domains: list[str] = field(default_factory=list)
 
     # Rate limit guard params
     max_per_minute: int | None = None
@@ -77,6 +85,8 @@ class GuardConfig:
             # Recipient
             "recipient_mode": self.recipient_mode,
             "recipient_addresses": self.recipient_addresses,
+            "recipient_patterns": self.recipient_patterns,
+            "recipient_domains": self.recipient_domains,
             # Rate limit
             "max_per_minute": self.max_per_minute,
             "max_per_hour": self.max_per_hour,
@@ -102,6 +112,8 @@ class GuardConfig:
             # Recipient
             recipient_mode=data.get("recipient_mode", "whitelist"),
             recipient_addresses=data.get("recipient_addresses", []),
+            recipient_patterns=data.get("recipient_patterns", []),
+            recipient_domains=data.get("recipient_domains", []),
             # Rate limit
             max_per_minute=data.get("max_per_minute"),
             max_per_hour=data.get("max_per_hour"),
@@ -141,6 +153,10 @@ class GuardConfig:
             config.recipient_mode = guard._mode
         if hasattr(guard, "_addresses"):
             config.recipient_addresses = list(guard._addresses)
+        if hasattr(guard, "_patterns"):
+            config.recipient_patterns = [p.pattern for p in guard._patterns]
+        if hasattr(guard, "_domains"):
+            config.recipient_domains = list(guard._domains)
 
         # Rate limit guard
         if hasattr(guard, "_max_per_minute"):
@@ -173,12 +189,6 @@ class GuardConfig:
 
     def to_guard(self, storage: StorageBackend) -> Guard:
         """Create a Guard instance from this config."""
-        from omniclaw.guards.budget import BudgetGuard
-        from omniclaw.guards.confirm import ConfirmGuard
-        from omniclaw.guards.rate_limit import RateLimitGuard
-        from omniclaw.guards.recipient import RecipientGuard
-        from omniclaw.guards.single_tx import SingleTxGuard
-
         if self.guard_type == GuardType.BUDGET:
             guard = BudgetGuard(
                 name=self.name,
@@ -197,6 +207,8 @@ class GuardConfig:
                 name=self.name,
                 mode=self.recipient_mode,
                 addresses=self.recipient_addresses,
+                patterns=self.recipient_patterns,
+                domains=self.recipient_domains,
             )
         elif self.guard_type == GuardType.RATE_LIMIT:
             guard = RateLimitGuard(
@@ -222,6 +234,11 @@ class GuardManager:
     """Manages guard registrations using StorageBackend."""
 
     COLLECTION = "guard_registrations"
+    # Seconds a built guard list is reused before re-reading storage, so
+    # registrations made by other processes sharing the backend take effect
+    GUARD_CACHE_TTL = 2.0
+    # Max assembled chains kept per manager before the chain cache is reset
+    CHAIN_CACHE_SIZE = 4096
 
     def __init__(self, storage: StorageBackend) -> None:
         """
@@ -232,6 +249,15 @@ class GuardManager:
         """
         self._storage = storage
         self._logger = get_logger("guards")
+        # Guard names per storage key, as (expires_at, names)
+        self._names_cache: dict[str, tuple[float, list[str]]] = {}
+        # Built guard instances per storage key, as (expires_at, guards)
+        self._guards_cache: dict[str, tuple[float, tuple[Guard, ...]]] = {}
+        # Assembled chains per (wallet_id, wallet_set_id), with the guard
+        # tuples they were built from: (set_guards, wallet_guards, chain)
+        self._chain_cache: dict[
+            tuple[str, str | None], tuple[tuple[Guard, ...], tuple[Guard, ...], GuardChain]
+        ] = {}
 
     def _make_key(self, scope_type: str, scope_id: str) -> str:
         """Make storage key."""
@@ -260,6 +286,7 @@ class GuardManager:
         data["guards"].append(config.to_dict())
 
         await self._storage.save(self.COLLECTION, key, data)
+        self._invalidate(key)
         return self
 
     async def add_guard_for_set(self, wallet_set_id: str, guard: Guard) -> GuardManager:
@@ -271,6 +298,7 @@ class GuardManager:
         data["guards"].append(config.to_dict())
 
         await self._storage.save(self.COLLECTION, key, data)
+        self._invalidate(key)
         return self
 
     # ==================== Remove Guards ====================
@@ -288,6 +316,7 @@ class GuardManager:
 
         if len(data["guards"]) < original_count:
             await self._storage.save(self.COLLECTION, key, data)
+            self._invalidate(key)
             return True
         return False
 
@@ -304,6 +333,7 @@ class GuardManager:
 
         if len(data["guards"]) < original_count:
             await self._storage.save(self.COLLECTION, key, data)
+            self._invalidate(key)
             return True
         return False
 
@@ -311,49 +341,64 @@ class GuardManager:
 
     async def get_wallet_guards(self, wallet_id: str) -> GuardChain:
         """Get guards for a wallet."""
-        key = self._make_key("wallet", wallet_id)
-        data = await self._storage.get(self.COLLECTION, key)
-
-        chain = GuardChain()
-        if data:
-            for guard_data in data.get("guards", []):
-                config = GuardConfig.from_dict(guard_data)
-                guard = config.to_guard(self._storage)
-                chain.add(guard)
-
-        return chain
+        return GuardChain(list(await self._load_guards(self._make_key("wallet", wallet_id))))
 
     async def get_wallet_set_guards(self, wallet_set_id: str) -> GuardChain:
         """Get guards for a wallet set."""
-        key = self._make_key("wallet_set", wallet_set_id)
-        data = await self._storage.get(self.COLLECTION, key)
+        return GuardChain(
+            list(await self._load_guards(self._make_key("wallet_set", wallet_set_id)))
+        )
 
-        chain = GuardChain()
-        if data:
-            for guard_data in data.get("guards", []):
-                config = GuardConfig.from_dict(guard_data)
-                guard = config.to_guard(self._storage)
-                chain.add(guard)
+    async def _load_guards(self, key: str) -> tuple[Guard, ...]:
+        """
+        Build the guards stored under a key, reusing recently built instances.
 
-        return chain
+        Guards keep their counters in storage, so instances can be shared
+        between checks. Entries are dropped when this manager modifies the key
+        and otherwise expire after GUARD_CACHE_TTL seconds.
+        """
+        now = time.monotonic()
+        cached = self._guards_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
 
-    async def list_wallet_guard_names(self, wallet_id: str) -> list[str]:
-        """List guard names for a wallet."""
-        key = self._make_key("wallet", wallet_id)
         data = await self._storage.get(self.COLLECTION, key)
+        guards = tuple(
+            GuardConfig.from_dict(guard_data).to_guard(self._storage)
+            for guard_data in (data or {}).get("guards", [])
+        )
+        self._guards_cache[key] = (now + self.GUARD_CACHE_TTL, guards)
+        return guards
 
-        if not data:
-            return []
-        return [g.get("name", "unnamed") for g in data.get("guards", [])]
+    def _invalidate(self, key: str) -> None:
+        """Drop cached names and guards for a storage key."""
+        self._names_cache.pop(key, None)
+        self._guards_cache.pop(key, None)
+
+    async def list_wallet_guard_names(self, wallet_id: str) -> list[str]:
+        """List guard names for a wallet."""
+        return await self._list_guard_names(self._make_key("wallet", wallet_id))
 
     async def list_wallet_set_guard_names(self, wallet_set_id: str) -> list[str]:
         """List guard names for a wallet set."""
-        key = self._make_key("wallet_set", wallet_set_id)
-        data = await self._storage.get(self.COLLECTION, key)
+        return await self._list_guard_names(self._make_key("wallet_set", wallet_set_id))
 
-        if not data:
-            return []
-        return [g.get("name", "unnamed") for g in data.get("guards", [])]
+    async def _list_guard_names(self, key: str) -> list[str]:
+        """
+        List guard names stored under a key, reusing a recent read.
+
+        Like built guards, names are dropped when this manager modifies the key
+        and otherwise expire after GUARD_CACHE_TTL seconds.
+        """
+        now = time.monotonic()
+        cached = self._names_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return list(cached[1])
+
+        data = await self._storage.get(self.COLLECTION, key)
+        names = [g.get("name", "unnamed") for g in data.get("guards", [])] if data else []
+        self._names_cache[key] = (now + self.GUARD_CACHE_TTL, names)
+        return list(names)
 
     # ==================== Combined Operations ====================
 
@@ -367,20 +412,44 @@ class GuardManager:
 
         Merges guards from wallet set (if provided) and wallet.
         """
-        combined = GuardChain()
+        guards: list[Guard] = []
 
         # Add wallet set guards first
         if wallet_set_id:
-            set_chain = await self.get_wallet_set_guards(wallet_set_id)
-            for guard in set_chain:
-                combined.add(guard)
+            guards.extend(await self._load_guards(self._make_key("wallet_set", wallet_set_id)))
 
         # Add wallet-specific guards
-        wallet_chain = await self.get_wallet_guards(wallet_id)
-        for guard in wallet_chain:
-            combined.add(guard)
+        guards.extend(await self._load_guards(self._make_key("wallet", wallet_id)))
+
+        return GuardChain(guards)
 
-        return combined
+    async def get_cached_guard_chain(
+        self,
+        wallet_id: str,
+        wallet_set_id: str | None = None,
+    ) -> GuardChain:
+        """
+        Get the combined guard chain for a wallet, shared between callers.
+
+        Same guards as get_guard_chain(), but the chain is only reassembled
+        when one of its guard lists is reloaded (after a local modification or
+        GUARD_CACHE_TTL). Callers must not add or remove guards on it.
+        """
+        set_guards: tuple[Guard, ...] = ()
+        if wallet_set_id:
+            set_guards = await self._load_guards(self._make_key("wallet_set", wallet_set_id))
+        wallet_guards = await self._load_guards(self._make_key("wallet", wallet_id))
+
+        key = (wallet_id, wallet_set_id)
+        cached = self._chain_cache.get(key)
+        if cached is not None and cached[0] is set_guards and cached[1] is wallet_guards:
+            return cached[2]
+
+        chain = GuardChain([*set_guards, *wallet_guards])
+        if len(self._chain_cache) >= self.CHAIN_CACHE_SIZE:
+            self._chain_cache.clear()
+        self._chain_cache[key] = (set_guards, wallet_guards, chain)
+        return chain
 
     async def check(self, context: PaymentContext) -> tuple[bool, str | None, list[str]]:
         """
@@ -389,7 +458,7 @@ class GuardManager:
         Returns:
             Tuple of (allowed, reason, passed_guards)
         """
-        chain = await self.get_guard_chain(
+        chain = await self.get_cached_guard_chain(
             context.wallet_id,
             context.wallet_set_id,
         )
@@ -397,9 +466,9 @@ class GuardManager:
         if len(chain) == 0:
             return True, None, []
 
-        self._logger.debug(f"Checking {len(chain)} guards for wallet={context.wallet_id}")
+        self._logger.debug("Checking %d guards for wallet=%s", len(chain), context.wallet_id)
 
-        result = await chain.check(context)
+        result = await chain.check_parallel(context)
         passed = result.metadata.get("passed_guards", []) if result.metadata else []
 
         if not result.allowed:
@@ -407,7 +476,7 @@ class GuardManager:
                 f"Payment BLOCKED by guard: {result.reason} (Wallet: {context.wallet_id})"
             )
         else:
-            self._logger.debug(f"Guards passed: {passed}")
+            self._logger.debug("Guards passed: %s", passed)
 
         return result.allowed, result.reason, passed
 
@@ -420,7 +489,7 @@ class GuardManager:
         purpose: str | None,
     ) -> None:
         """Record spending in all relevant guards."""
-        chain = await self.get_guard_chain(wallet_id, wallet_set_id)
+        chain = await self.get_cached_guard_chain(wallet_id, wallet_set_id)
 
         for guard in chain:
             # BudgetGuard uses record_spending
@@ -439,8 +508,10 @@ class GuardManager:
         """Clear all guards for a wallet."""
         key = self._make_key("wallet", wallet_id)
         await self._storage.delete(self.COLLECTION, key)
+        self._invalidate(key)
 
     async def clear_wallet_set_guards(self, wallet_set_id: str) -> None:
         """Clear all guards for a wallet set."""
         key = self._make_key("wallet_set", wallet_set_id)
         await self._storage.delete(self.COLLECTION, key)
+        self._invalidate(key)
@@ -6,11 +6,53 @@ Supports whitelist and blacklist modes for recipient validation.
 
 from __future__ import annotations
 
+import functools
 import re
 
 from omniclaw.guards.base import Guard, GuardResult, PaymentContext
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a recipient pattern once per process.
+
+    Guards are rebuilt from stored config on every guard-chain load, so the
+    same pattern strings are compiled over and over without this cache.
+    """
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Flags every pattern compiled by _compile_pattern() carries; anything beyond
+# these comes from inline global flags in the pattern itself
+_DEFAULT_FLAGS = re.IGNORECASE | re.UNICODE
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_alternation(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Fuse recipient patterns into one regex so a recipient is scanned once.
+
+    Returns None when fusing could change what matches: patterns with capture
+    groups (their numbering and backreferences would shift) or patterns whose
+    inline global flags, such as (?x) or (?s), would leak into the others when
+    fused (Python 3.10 only warns about them mid-pattern). Callers then search
+    the patterns one by one.
+    """
+    for p in patterns:
+        compiled = _compile_pattern(p)
+        if compiled.groups or compiled.flags != _DEFAULT_FLAGS:
+            return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_domains(domains: frozenset[str]) -> re.Pattern[str]:
+    """Compile lowercase domains into one literal alternation for substring search."""
+    return re.compile("|".join(re.escape(d) for d in sorted(domains)))
+
+
 class RecipientGuard(Guard):
     """
     Guard that controls which recipients are allowed.
@@ -47,7 +89,9 @@ class RecipientGuard(Guard):
         self._mode = mode
         self._addresses = {addr.lower() for addr in (addresses or [])}
         self._domains = {domain.lower() for domain in (domains or [])}
-        self._patterns = [re.compile(p, re.IGNORECASE) for p in (patterns or [])]
+        self._patterns = [_compile_pattern(p) for p in dict.fromkeys(patterns or [])]
+        # Fused (domain, pattern) regexes, rebuilt after the lists change
+        self._fused: tuple[re.Pattern[str] | None, re.Pattern[str] | None] | None = None
 
     @property
     def name(self) -> str:
@@ -68,10 +112,25 @@ class RecipientGuard(Guard):
     def add_domain(self, domain: str) -> None:
         """Add a domain to the list."""
         self._domains.add(domain.lower())
+        self._fused = None
 
     def add_pattern(self, pattern: str) -> None:
         """Add a regex pattern to the list."""
-        self._patterns.append(re.compile(pattern, re.IGNORECASE))
+        compiled = _compile_pattern(pattern)
+        if compiled not in self._patterns:
+            self._patterns.append(compiled)
+            self._fused = None
+
+    def _fused_matchers(self) -> tuple[re.Pattern[str] | None, re.Pattern[str] | None]:
+        """Return the (domain, pattern) regexes, each None if there is nothing to fuse."""
+        if self._fused is None:
+            self._fused = (
+                _compile_domains(frozenset(self._domains)) if self._domains else None,
+                _compile_alternation(tuple(p.pattern for p in self._patterns))
+                if self._patterns
+                else None,
+            )
+        return self._fused
 
     def _matches(self, recipient: str) -> bool:
         """Check if recipient matches any rule."""
@@ -81,12 +140,15 @@ class RecipientGuard(Guard):
         if recipient_lower in self._addresses:
             return True
 
+        domain_re, pattern_re = self._fused_matchers()
+
         # Check domain match (for URLs)
-        for domain in self._domains:
-            if domain in recipient_lower:
-                return True
+        if domain_re is not None and domain_re.search(recipient_lower):
+            return True
 
         # Check regex patterns
+        if pattern_re is not None:
+            return pattern_re.search(recipient) is not None
         return any(pattern.search(recipient) for pattern in self._patterns)
 
     async def check(self, context: PaymentContext) -> GuardResult:
@@ -134,3 +196,4 @@ class RecipientGuard(Guard):
         self._addresses.clear()
         self._domains.clear()
         self._patterns.clear()
+        self._fused = None
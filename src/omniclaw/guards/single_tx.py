@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 
+from omniclaw.core.types import as_decimal
 from omniclaw.guards.base import Guard, GuardResult, PaymentContext
 
 
@@ -33,8 +34,8 @@ class SingleTxGuard(Guard):
             name: Guard name for identification
         """
         self._name = name
-        self._max_amount = max_amount
-        self._min_amount = min_amount or Decimal("0")
+        self._max_amount = as_decimal(max_amount)
+        self._min_amount = as_decimal(min_amount) if min_amount else Decimal("0")
 
     @property
     def name(self) -> str:
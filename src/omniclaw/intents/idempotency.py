@@ -0,0 +1,170 @@
+"""
+Idempotency Key Store.
+
+Records the outcome of requests made with a caller-supplied idempotency key
+so that retried calls can be answered without repeating side effects.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from omniclaw.storage.base import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyStatus(str, Enum):
+    """Lifecycle of an idempotency record."""
+
+    PENDING = "pending"  # Claimed, request still in flight
+    COMPLETED = "completed"  # Request finished, response stored
+    ERRORED = "errored"  # Request failed, key may be retried
+
+
+@dataclass
+class IdempotencyRecord:
+    """Stored state for one idempotency key."""
+
+    key: str
+    request_hash: str
+    status: IdempotencyStatus
+    response: dict[str, Any] | None = None
+    expires_at: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "request_hash": self.request_hash,
+            "status": self.status.value,
+            "response": self.response,
+            "expires_at": self.expires_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IdempotencyRecord:
+        return cls(
+            key=data["key"],
+            request_hash=data.get("request_hash", ""),
+            status=IdempotencyStatus(data.get("status", IdempotencyStatus.PENDING.value)),
+            response=data.get("response"),
+            expires_at=float(data.get("expires_at", 0)),
+        )
+
+
+class IdempotencyService:
+    """
+    Service for claiming and resolving idempotency keys.
+
+    A key is claimed atomically through a storage counter before any side
+    effect runs, so two concurrent requests with the same key can never both
+    proceed.
+    """
+
+    COLLECTION = "idempotency_keys"
+    CLAIMS_COLLECTION = "idempotency_claims"
+    DEFAULT_TTL = 86400  # 24 hours
+    DEFAULT_CLAIM_TTL = 300  # 5 minutes
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        ttl: int = DEFAULT_TTL,
+        claim_ttl: int = DEFAULT_CLAIM_TTL,
+    ) -> None:
+        """
+        Initialize idempotency service.
+
+        Args:
+            storage: Storage backend
+            ttl: Seconds a completed record is kept for replays
+            claim_ttl: Seconds an in-flight claim blocks the key; a claim whose
+                request died without completing is released after this
+        """
+        self._storage = storage
+        self._ttl = ttl
+        self._claim_ttl = claim_ttl
+
+    async def claim(self, key: str, request_hash: str) -> IdempotencyRecord | None:
+        """
+        Claim an idempotency key.
+
+        Args:
+            key: Scoped idempotency key
+            request_hash: Hash of the request parameters
+
+        Returns:
+            None if the key was newly claimed and the caller should proceed,
+            otherwise the existing record for the key.
+        """
+        for _ in range(2):
+            claims = await self._storage.atomic_add(self.CLAIMS_COLLECTION, key, "1")
+            if int(float(claims)) == 1:
+                record = IdempotencyRecord(
+                    key=key,
+                    request_hash=request_hash,
+                    status=IdempotencyStatus.PENDING,
+                    expires_at=time.time() + self._claim_ttl,
+                )
+                await self._storage.save(self.COLLECTION, key, record.to_dict())
+                return None
+
+            data = await self._storage.get(self.COLLECTION, key)
+            if data is None:
+                # Claimed by a concurrent request that has not stored its record yet
+                return IdempotencyRecord(key=key, request_hash="", status=IdempotencyStatus.PENDING)
+
+            record = IdempotencyRecord.from_dict(data)
+            if record.expires_at > time.time():
+                return record
+
+            # Expired: drop it and claim afresh
+            await self._forget(key)
+
+        # Lost the re-claim to a concurrent request
+        return IdempotencyRecord(key=key, request_hash="", status=IdempotencyStatus.PENDING)
+
+    async def complete(self, key: str, response: dict[str, Any]) -> None:
+        """Mark a claimed key as completed and keep its response for the full TTL."""
+        await self._storage.update(
+            self.COLLECTION,
+            key,
+            {
+                "status": IdempotencyStatus.COMPLETED.value,
+                "response": response,
+                "expires_at": time.time() + self._ttl,
+            },
+        )
+
+    async def fail(self, key: str) -> None:
+        """Mark a claimed key as errored and free it so the request can be retried."""
+        await self._storage.update(
+            self.COLLECTION, key, {"status": IdempotencyStatus.ERRORED.value}
+        )
+        await self._storage.delete(self.CLAIMS_COLLECTION, key)
+        logger.debug("Idempotency key %s errored; released for retry", key)
+
+    async def purge_expired(self) -> int:
+        """
+        Delete expired idempotency records.
+
+        Returns:
+            Number of records deleted
+        """
+        now = time.time()
+        removed = 0
+        for data in await self._storage.query(self.COLLECTION):
+            if float(data.get("expires_at", 0)) <= now:
+                await self._forget(data["_key"])
+                removed += 1
+        return removed
+
+    async def _forget(self, key: str) -> None:
+        """Remove a record and its claim counter."""
+        await self._storage.delete(self.COLLECTION, key)
+        await self._storage.delete(self.CLAIMS_COLLECTION, key)
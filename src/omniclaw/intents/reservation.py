@@ -28,6 +28,10 @@ class ReservationService:
     """
 
     COLLECTION = "fund_reservations"
+    # Per-wallet counters for optimistic concurrency, used as a sequence lock:
+    # each reservation adds 2, and a debit adds 1 when it starts and 1 when it
+    # ends, so an odd version means a debit is in flight on the wallet
+    VERSION_COLLECTION = "fund_reservation_versions"
 
     def __init__(self, storage: StorageBackend) -> None:
         """
@@ -50,6 +54,62 @@ class ReservationService:
         Returns:
             Reservation ID (same as intent_id for simplicity)
         """
+        await self._save(wallet_id, amount, intent_id)
+        await self._bump_version(wallet_id, 2)
+        return intent_id
+
+    async def get_version(self, wallet_id: str) -> int:
+        """
+        Get the reservation version of a wallet.
+
+        The version changes whenever a reservation is created or a debit starts
+        or ends, so a caller can detect whether either happened since it read
+        it. An odd version means a debit is in flight (see begin_debit()).
+
+        Args:
+            wallet_id: Wallet ID
+
+        Returns:
+            Current version number
+        """
+        value = await self._storage.atomic_add(self.VERSION_COLLECTION, wallet_id, "0")
+        return int(float(value))
+
+    async def reserve_cas(
+        self,
+        wallet_id: str,
+        amount: Decimal,
+        intent_id: str,
+        expected_version: int,
+    ) -> bool:
+        """
+        Create a fund reservation only if the wallet version is unchanged.
+
+        The reservation is written first and then the version is bumped; if the
+        bump shows another reservation or a debit raced in after
+        `expected_version` was read, the reservation is rolled back.
+
+        Args:
+            wallet_id: Wallet ID
+            amount: Amount to reserve
+            intent_id: Associated payment intent ID
+            expected_version: Version read before the availability check
+
+        Returns:
+            True if reserved, False on version conflict
+        """
+        await self._save(wallet_id, amount, intent_id)
+        if await self._bump_version(wallet_id, 2) == expected_version + 2:
+            return True
+
+        await self._storage.delete(self.COLLECTION, intent_id)
+        logger.debug(
+            "Version conflict reserving for wallet %s (Intent: %s)", wallet_id, intent_id
+        )
+        return False
+
+    async def _save(self, wallet_id: str, amount: Decimal, intent_id: str) -> None:
+        """Persist a reservation record."""
         data = {
             "wallet_id": wallet_id,
             "amount": str(amount),
@@ -57,8 +117,26 @@ class ReservationService:
             "created_at": datetime.now().isoformat(),
         }
         await self._storage.save(self.COLLECTION, intent_id, data)
-        logger.debug(f"Reserved {amount} for wallet {wallet_id} (Intent: {intent_id})")
-        return intent_id
+        logger.debug("Reserved %s for wallet %s (Intent: %s)", amount, wallet_id, intent_id)
+
+    async def begin_debit(self, wallet_id: str) -> None:
+        """
+        Mark a debit of the wallet as in flight.
+
+        Called by the holder of the wallet's fund lock before it checks the
+        available balance; any reserve_cas() whose version read predates this
+        call then fails. Must be paired with end_debit().
+        """
+        await self._bump_version(wallet_id, 1)
+
+    async def end_debit(self, wallet_id: str) -> None:
+        """Mark the in-flight debit of the wallet as finished."""
+        await self._bump_version(wallet_id, 1)
+
+    async def _bump_version(self, wallet_id: str, step: int) -> int:
+        """Add `step` to the wallet reservation version and return it."""
+        value = await self._storage.atomic_add(self.VERSION_COLLECTION, wallet_id, str(step))
+        return int(float(value))
 
     async def release(self, intent_id: str) -> bool:
         """
@@ -72,7 +150,7 @@ class ReservationService:
         """
         result = await self._storage.delete(self.COLLECTION, intent_id)
         if result:
-            logger.debug(f"Released reservation for intent {intent_id}")
+            logger.debug("Released reservation for intent %s", intent_id)
         return result
 
     async def get_reserved_total(self, wallet_id: str) -> Decimal:
@@ -96,5 +174,5 @@ class ReservationService:
             except Exception as e:
                 logger.warning(f"Invalid decimal amount in reservation {res.get('_key')}: {amount_str}: {e}")
 
-        logger.debug(f"Wallet {wallet_id} has {total} in active reservations")
+        logger.debug("Wallet %s has %s in active reservations", wallet_id, total)
         return total
@@ -7,7 +7,7 @@ Handles storage and retrieval of intents for Authorize/Capture workflows.
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
@@ -26,6 +26,7 @@ class PaymentIntentService:
     """
 
     COLLECTION = "payment_intents"
+    TRANSITION_LOCK_TTL = 10  # seconds; held only for one read and one write
 
     def __init__(self, storage: StorageBackend) -> None:
         """Initialize with storage backend."""
@@ -45,6 +46,7 @@ class PaymentIntentService:
         expires_in: int | None = None,
         metadata: dict[str, Any] | None = None,
         client_secret: str | None = None,
+        intent_id: str | None = None,
     ) -> PaymentIntent:
         """
         Create a new payment intent.
@@ -58,17 +60,16 @@ class PaymentIntentService:
             expires_in: Time to live in seconds
             metadata: Additional metadata
             client_secret: Optional client secret for future use
+            intent_id: Pre-allocated intent ID (generated if omitted)
 
         Returns:
             PaymentIntent instance
         """
-        import datetime as dt
-
-        intent_id = str(uuid.uuid4())
-        created_at = datetime.utcnow()
+        intent_id = intent_id or str(uuid.uuid4())
+        created_at = datetime.now(timezone.utc)
         expires_at = None
         if expires_in is not None:
-            expires_at = created_at + dt.timedelta(seconds=expires_in)
+            expires_at = created_at + timedelta(seconds=expires_in)
 
         intent = PaymentIntent(
             id=intent_id,
@@ -110,6 +111,55 @@ class PaymentIntentService:
         await self._save(intent)
         return intent
 
+    async def transition(
+        self,
+        intent: PaymentIntent,
+        from_status: PaymentIntentStatus,
+        to_status: PaymentIntentStatus,
+    ) -> PaymentIntent:
+        """
+        Move an already-loaded intent to a new status.
+
+        The write is a compare-and-swap on the stored status: under a short
+        per-intent storage lock, the stored status is re-read and the new one
+        written only if it still equals from_status. Of two concurrent
+        transitions from the same status, exactly one succeeds.
+
+        Args:
+            intent: Intent previously returned by get()
+            from_status: Status the intent is expected to be in
+            to_status: New status
+
+        Raises:
+            ValidationError: If the intent is not in from_status, no longer
+                exists, or is being transitioned concurrently
+        """
+        if intent.status != from_status:
+            raise ValidationError(
+                f"Intent {intent.id} is {intent.status.value}, expected {from_status.value}"
+            )
+
+        key = self._make_key(intent.id)
+        lock_key = f"{key}:transition"
+        token = await self._storage.acquire_lock(lock_key, ttl=self.TRANSITION_LOCK_TTL)
+        if token is None:
+            raise ValidationError(f"Intent {intent.id} is being updated concurrently")
+        try:
+            data = await self._storage.get(self.COLLECTION, key)
+            if data is None:
+                raise ValidationError(f"Intent not found: {intent.id}")
+            stored = data.get("status")
+            if stored != from_status.value:
+                raise ValidationError(
+                    f"Intent {intent.id} is {stored}, expected {from_status.value}"
+                )
+            await self._storage.update(self.COLLECTION, key, {"status": to_status.value})
+        finally:
+            await self._storage.release_lock(lock_key, token)
+
+        intent.status = to_status
+        return intent
+
     async def cancel(self, intent_id: str, reason: str | None = None) -> PaymentIntent:
         """
         Cancel a payment intent.
@@ -131,6 +181,10 @@ class PaymentIntentService:
         await self._save(intent)
         return intent
 
+    async def delete(self, intent_id: str) -> bool:
+        """Delete an intent that was never handed out (e.g. a rolled-back create)."""
+        return await self._storage.delete(self.COLLECTION, self._make_key(intent_id))
+
     async def _save(self, intent: PaymentIntent) -> None:
         """Save intent to storage."""
         key = self._make_key(intent.id)
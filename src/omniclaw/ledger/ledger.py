@@ -15,6 +15,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from omniclaw.guards.base import PaymentContext
     from omniclaw.storage.base import StorageBackend
 
 
@@ -37,7 +38,7 @@ class LedgerEntryStatus(str, Enum):
     BLOCKED = "blocked"
 
 
-@dataclass
+@dataclass(slots=True)
 class LedgerEntry:
     """
     A single ledger entry representing a transaction.
@@ -70,6 +71,18 @@ class LedgerEntry:
     purpose: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def from_context(cls, context: PaymentContext) -> LedgerEntry:
+        """Create a pending LedgerEntry for a payment context, sharing its metadata."""
+        return cls(
+            wallet_id=context.wallet_id,
+            wallet_set_id=context.wallet_set_id,
+            recipient=context.recipient,
+            amount=context.amount,
+            purpose=context.purpose,
+            metadata=context.metadata if context.metadata is not None else {},
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage."""
         return {
@@ -195,6 +208,37 @@ class Ledger:
         await self._storage.update(self.COLLECTION, entry_id, updates)
         return True
 
+    async def record_and_finalize(
+        self,
+        entry: LedgerEntry,
+        status: LedgerEntryStatus,
+        tx_hash: str | None = None,
+        metadata_updates: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Apply a status change to an in-memory entry and persist it in one write.
+
+        Unlike update_status(), this does not read the stored entry first: the
+        caller's entry is the source of truth and is saved whole, so it works
+        whether or not the entry was recorded before.
+
+        Args:
+            entry: Ledger entry to finalize (updated in place)
+            status: New status
+            tx_hash: Optional transaction hash
+            metadata_updates: Optional metadata updates to merge
+
+        Returns:
+            Entry ID
+        """
+        entry.status = status
+        if tx_hash:
+            entry.tx_hash = tx_hash
+        if metadata_updates:
+            entry.metadata = {**entry.metadata, **metadata_updates}
+        await self._storage.save(self.COLLECTION, entry.id, entry.to_dict())
+        return entry.id
+
     async def query(
         self,
         wallet_id: str | None = None,
@@ -63,11 +63,11 @@ class FundLockService:
         for i in range(retry_count + 1):
             token = await self._storage.acquire_lock(lock_key, ttl)
             if token:
-                logger.debug(f"Acquired lock for wallet {wallet_id} (token: {token[:8]}...)")
+                logger.debug("Acquired lock for wallet %s (token: %.8s...)", wallet_id, token)
                 return token
             
             if i < retry_count:
-                logger.debug(f"Wallet {wallet_id} locked, retrying in {retry_delay}s...")
+                logger.debug("Wallet %s locked, retrying in %ss...", wallet_id, retry_delay)
                 await asyncio.sleep(retry_delay)
         
         logger.warning(f"Failed to acquire lock for wallet {wallet_id} after {retry_count} retries")
@@ -87,5 +87,5 @@ class FundLockService:
         lock_key = f"lock:wallet:{wallet_id}"
         result = await self._storage.release_lock(lock_key, lock_token)
         if result:
-            logger.debug(f"Released lock for wallet {wallet_id}")
+            logger.debug("Released lock for wallet %s", wallet_id)
         return result
@@ -7,10 +7,11 @@ Handles execution of multiple payments concurrently.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from omniclaw.core.types import PaymentRequest, PaymentResult, PaymentStatus
+from omniclaw.core.types import PaymentMethod, PaymentRequest, PaymentResult, PaymentStatus
 
 
 @dataclass
@@ -27,6 +28,10 @@ class BatchPaymentResult:
 if TYPE_CHECKING:
     from omniclaw.payment.router import PaymentRouter
 
+# Payments left running after their batch was abandoned; holds strong references
+# so the event loop does not garbage-collect them before they finish
+_IN_FLIGHT: set[asyncio.Future[PaymentResult]] = set()
+
 
 class BatchProcessor:
     """Processor for batch payments."""
@@ -37,56 +42,16 @@ class BatchProcessor:
     async def process(
         self, requests: list[PaymentRequest], concurrency: int = 5
     ) -> BatchPaymentResult:
-        """Execute multiple payments concurrently."""
-        sem = asyncio.Semaphore(concurrency)
+        """
+        Execute multiple payments concurrently.
 
-        async def _bounded_pay(req: PaymentRequest) -> PaymentResult:
-            async with sem:
-                # Convert PaymentRequest to kwargs
-                # Note: PaymentRequest validation happened at init
-                return await self._router.pay(
-                    wallet_id=req.wallet_id,
-                    recipient=req.recipient,
-                    amount=req.amount,
-                    purpose=req.purpose,
-                    idempotency_key=req.idempotency_key,
-                    destination_chain=req.destination_chain,
-                    **req.metadata,
-                )
-
-        # Create tasks
-        tasks = [_bounded_pay(req) for req in requests]
-
-        # Run
-        # return_exceptions=True? No, we want PaymentResult objects.
-        # But if pay() raises unhandled exception, we should catch it.
-        # Router.pay() generally catches and returns FAILED result?
-        # Let's verify Router.pay catches exceptions.
-        # Checking router.py...
-        # It catches specific ones but maybe not all.
-        # Safe to wrap?
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        final_results: list[PaymentResult] = []
-        for i, res in enumerate(results):
-            if isinstance(res, PaymentResult):
-                final_results.append(res)
-            elif isinstance(res, Exception):
-                # Synthesis failed result
-                req = requests[i]
-                final_results.append(
-                    PaymentResult(
-                        success=False,
-                        transaction_id=None,
-                        blockchain_tx=None,
-                        amount=req.amount,
-                        recipient=req.recipient,
-                        method=None,  # type: ignore
-                        status=PaymentStatus.FAILED,
-                        error=str(res),
-                    )
-                )
+        Results are returned in request order. See iter_results() for the
+        concurrency model.
+        """
+        ordered: list[PaymentResult | None] = [None] * len(requests)
+        async for index, result in self.iter_results(requests, concurrency):
+            ordered[index] = result
+        final_results: list[PaymentResult] = ordered  # type: ignore[assignment]
 
         # Aggregate
         success_count = sum(1 for r in final_results if r.success)
@@ -100,3 +65,77 @@ class BatchProcessor:
             results=final_results,
             transaction_ids=tx_ids,
         )
+
+    async def iter_results(
+        self, requests: list[PaymentRequest], concurrency: int = 5
+    ) -> AsyncIterator[tuple[int, PaymentResult]]:
+        """
+        Execute payments concurrently, yielding (request index, result) as each completes.
+
+        Requests are bucketed by the payment method their recipient routes to,
+        and each method gets its own semaphore of `concurrency` slots, so a
+        slow or rate-limited adapter cannot starve payments bound for others.
+        A payment that raises is reported as a FAILED result. If the consumer
+        stops iterating early, payments already sent to the router still run
+        to completion (only their results are dropped); queued payments that
+        have not started are cancelled.
+        """
+        methods = [self._detect_method(req) for req in requests]
+        sems = {method: asyncio.Semaphore(concurrency) for method in set(methods)}
+
+        async def _pay(req: PaymentRequest) -> PaymentResult:
+            try:
+                # Convert PaymentRequest to kwargs
+                # Note: PaymentRequest validation happened at init
+                return await self._router.pay(
+                    wallet_id=req.wallet_id,
+                    recipient=req.recipient,
+                    amount=req.amount,
+                    purpose=req.purpose,
+                    idempotency_key=req.idempotency_key,
+                    destination_chain=req.destination_chain,
+                    **req.metadata,
+                )
+            except Exception as e:
+                # Router.pay() returns FAILED results for known errors but can
+                # still raise; synthesize a failed result so the batch completes.
+                return PaymentResult(
+                    success=False,
+                    transaction_id=None,
+                    blockchain_tx=None,
+                    amount=req.amount,
+                    recipient=req.recipient,
+                    method=None,  # type: ignore
+                    status=PaymentStatus.FAILED,
+                    error=str(e),
+                )
+
+        async def _bounded_pay(
+            index: int, req: PaymentRequest, sem: asyncio.Semaphore
+        ) -> tuple[int, PaymentResult]:
+            async with sem:
+                # Shielded: cancelling the batch must not abort a payment mid-flight
+                payment = asyncio.ensure_future(_pay(req))
+                _IN_FLIGHT.add(payment)
+                payment.add_done_callback(_IN_FLIGHT.discard)
+                return index, await asyncio.shield(payment)
+
+        tasks = [
+            asyncio.ensure_future(_bounded_pay(i, req, sems[method]))
+            for i, (req, method) in enumerate(zip(requests, methods, strict=True))
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _detect_method(self, req: PaymentRequest) -> PaymentMethod | None:
+        """Best-effort routing lookup used only to pick a concurrency bucket."""
+        try:
+            return self._router.detect_method(
+                req.recipient, destination_chain=req.destination_chain, **req.metadata
+            )
+        except Exception:
+            return None
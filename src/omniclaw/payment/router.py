@@ -13,6 +13,7 @@ from omniclaw.core.types import (
     PaymentResult,
     PaymentStatus,
     SimulationResult,
+    as_decimal,
 )
 from omniclaw.protocols.base import ProtocolAdapter
 
@@ -24,6 +25,9 @@ if TYPE_CHECKING:
 class PaymentRouter:
     """Routes payments to the appropriate protocol adapter based on recipient type."""
 
+    # Max cached recipient -> adapter resolutions before the cache is reset
+    _ADAPTER_CACHE_SIZE = 4096
+
     def __init__(
         self,
         config: Config,
@@ -32,25 +36,53 @@ class PaymentRouter:
         self._config = config
         self._wallet_service = wallet_service
         self._adapters: list[ProtocolAdapter] = []
+        self._adapter_cache: dict[tuple[str, str | None, str | None], ProtocolAdapter | None] = {}
         self._logger = get_logger("router")
 
     def register_adapter(self, adapter: ProtocolAdapter) -> None:
         self._adapters.append(adapter)
         self._adapters.sort(key=lambda a: a.get_priority())
+        self._adapter_cache.clear()
 
     def unregister_adapter(self, method: PaymentMethod) -> None:
         self._adapters = [a for a in self._adapters if a.method != method]
+        self._adapter_cache.clear()
 
     def get_adapters(self) -> list[ProtocolAdapter]:
         return list(self._adapters)
 
     def detect_method(self, recipient: str, source_network: Network | str | None = None, destination_chain: Network | str | None = None, **kwargs: Any) -> PaymentMethod | None:
+        adapter = self._find_adapter(recipient, source_network=source_network, destination_chain=destination_chain, **kwargs)
+        return adapter.method if adapter else None
+
+    def _find_adapter(self, recipient: str, source_network: Network | str | None = None, destination_chain: Network | str | None = None, **kwargs: Any) -> ProtocolAdapter | None:
+        # Extra kwargs may influence supports(), so only plain lookups are cached
+        if kwargs:
+            return self._scan_adapters(recipient, source_network, destination_chain, **kwargs)
+
+        key = (
+            recipient,
+            str(source_network) if source_network is not None else None,
+            str(destination_chain) if destination_chain is not None else None,
+        )
+        try:
+            return self._adapter_cache[key]
+        except KeyError:
+            pass
+
+        adapter = self._scan_adapters(recipient, source_network, destination_chain)
+        if len(self._adapter_cache) >= self._ADAPTER_CACHE_SIZE:
+            self._adapter_cache.clear()
+        self._adapter_cache[key] = adapter
+        return adapter
+
+    def _adapter_for_method(self, method: PaymentMethod) -> ProtocolAdapter | None:
         for adapter in self._adapters:
-            if adapter.supports(recipient, source_network=source_network, destination_chain=destination_chain, **kwargs):
-                return adapter.method
+            if adapter.method == method:
+                return adapter
         return None
 
-    def _find_adapter(self, recipient: str, source_network: Network | str | None = None, destination_chain: Network | str | None = None, **kwargs: Any) -> ProtocolAdapter | None:
+    def _scan_adapters(self, recipient: str, source_network: Network | str | None, destination_chain: Network | str | None, **kwargs: Any) -> ProtocolAdapter | None:
         for adapter in self._adapters:
             if adapter.supports(recipient, source_network=source_network, destination_chain=destination_chain, **kwargs):
                 return adapter
@@ -68,16 +100,25 @@ class PaymentRouter:
         wait_for_completion: bool = False,
         timeout_seconds: float | None = None,
         destination_chain: Network | str | None = None,
+        preselected_method: PaymentMethod | None = None,
         **kwargs: Any,
     ) -> PaymentResult:
-        """Execute a payment via the appropriate method."""
-        amount_decimal = Decimal(str(amount))
+        """
+        Execute a payment via the appropriate method.
+
+        preselected_method, when given (e.g. the route an intent was simulated
+        with), selects the adapter for that method without probing adapters;
+        detection is used if no such adapter is registered.
+        """
+        amount_decimal = as_decimal(amount)
 
         # Resolve source network
         wallet = self._wallet_service.get_wallet(wallet_id)
         source_network = Network.from_string(wallet.blockchain)
 
-        adapter = self._find_adapter(recipient, destination_chain=destination_chain, source_network=source_network, **kwargs)
+        adapter = self._adapter_for_method(preselected_method) if preselected_method else None
+        if adapter is None:
+            adapter = self._find_adapter(recipient, destination_chain=destination_chain, source_network=source_network, **kwargs)
         if not adapter:
             self._logger.error(f"No adapter found for recipient: {recipient}")
             return PaymentResult(
@@ -129,7 +170,7 @@ class PaymentRouter:
         Returns:
             Simulation result
         """
-        amount_decimal = Decimal(str(amount))
+        amount_decimal = as_decimal(amount)
 
         # Resolve source network from wallet - MUST succeed
         wallet = self._wallet_service.get_wallet(wallet_id)
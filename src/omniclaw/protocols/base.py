@@ -114,6 +114,10 @@ class ProtocolAdapter(ABC):
             "amount": str(amount),
         }
 
+    async def close(self) -> None:  # noqa: B027
+        """Release resources (e.g. HTTP clients) held by the adapter."""
+        pass
+
     def get_priority(self) -> int:
         """
         Get adapter priority for routing.
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import time
+import asyncio
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
@@ -184,20 +184,18 @@ class GatewayAdapter(ProtocolAdapter):
             use_fast_transfer: Use Fast Transfer (2-5 secs) vs Standard (13-19 mins)
         """
         from omniclaw.core.cctp_constants import (
-            CCTP_DOMAIN_IDS,
             DEFAULT_MAX_FEE,
             EMPTY_DESTINATION_CALLER,
             FAST_TRANSFER_THRESHOLD,
             STANDARD_TRANSFER_THRESHOLD,
-            USDC_CONTRACTS,
+            get_cctp_addresses,
             get_iris_v2_attestation_url,
-            get_message_transmitter_v2,
-            get_token_messenger_v2,
-            is_cctp_supported,
         )
 
         # Validate network support
-        if not is_cctp_supported(source_network):
+        source_cctp = get_cctp_addresses(source_network)
+        dest_cctp = get_cctp_addresses(dest_network)
+        if source_cctp is None:
             return PaymentResult(
                 success=False,
                 transaction_id=None,
@@ -209,7 +207,7 @@ class GatewayAdapter(ProtocolAdapter):
                 error=f"Source network {source_network.value} not supported by CCTP",
             )
 
-        if not is_cctp_supported(dest_network):
+        if dest_cctp is None:
             return PaymentResult(
                 success=False,
                 transaction_id=None,
@@ -223,8 +221,8 @@ class GatewayAdapter(ProtocolAdapter):
 
         # Get V2 contract addresses
         source_network_str = source_network.value
-        token_messenger = get_token_messenger_v2(source_network)
-        usdc_address = USDC_CONTRACTS.get(source_network_str)
+        token_messenger = source_cctp.token_messenger
+        usdc_address = source_cctp.usdc
 
         if not token_messenger or not usdc_address:
             return PaymentResult(
@@ -241,8 +239,8 @@ class GatewayAdapter(ProtocolAdapter):
         # Prepare transaction parameters
         amount_units = int(amount * Decimal("1000000"))
         dest_address_bytes32 = "0x" + destination_address.lower().replace("0x", "").zfill(64)
-        source_domain = CCTP_DOMAIN_IDS[source_network]
-        dest_domain = CCTP_DOMAIN_IDS[dest_network]
+        source_domain = source_cctp.domain
+        dest_domain = dest_cctp.domain
         # V2 Transfer parameters
         # Arc Testnet: Explicitly disable Fast Transfer (Source not supported per docs)
         # Also disable Forwarding Service (max_fee=0) as fallback to prevent reverts
@@ -286,7 +284,8 @@ class GatewayAdapter(ProtocolAdapter):
         self._logger.info(f"CCTP V2: Approving {amount} USDC for TokenMessengerV2")
 
         try:
-            approve_tx = self._wallet_service._circle.create_contract_execution(
+            approve_tx = await asyncio.to_thread(
+                self._wallet_service._circle.create_contract_execution,
                 wallet_id=wallet_id,
                 contract_address=usdc_address,
                 abi_function_signature="approve(address,uint256)",
@@ -297,8 +296,10 @@ class GatewayAdapter(ProtocolAdapter):
             # Wait for approval confirmation to prevent race condition with burn
             self._logger.info("CCTP V2: Waiting for approval transaction confirmation...")
             for wait_attempt in range(60):  # 2 minutes max
-                time.sleep(2)
-                updated_approve_tx = self._wallet_service._circle.get_transaction(approve_tx.id)
+                await asyncio.sleep(2)
+                updated_approve_tx = await asyncio.to_thread(
+                    self._wallet_service._circle.get_transaction, approve_tx.id
+                )
                 
                 if updated_approve_tx.state in ["CONFIRMED", "COMPLETE", "FAILED"]:
                     if updated_approve_tx.state == "FAILED":
@@ -336,7 +337,8 @@ class GatewayAdapter(ProtocolAdapter):
 
         try:
             # depositForBurn(amount, destDomain, mintRecipient, burnToken, destCaller, maxFee, minFinalityThreshold)
-            burn_tx = self._wallet_service._circle.create_contract_execution(
+            burn_tx = await asyncio.to_thread(
+                self._wallet_service._circle.create_contract_execution,
                 wallet_id=wallet_id,
                 contract_address=token_messenger,
                 abi_function_signature="depositForBurn(uint256,uint32,bytes32,address,bytes32,uint256,uint32)",
@@ -356,8 +358,10 @@ class GatewayAdapter(ProtocolAdapter):
             self._logger.info("CCTP V2: Waiting for burn transaction confirmation...")
             burn_tx_hash = None
             for wait_attempt in range(150):  # 150 attempts * 2 seconds = 5 minutes max
-                time.sleep(2)
-                updated_tx = self._wallet_service._circle.get_transaction(burn_tx.id)
+                await asyncio.sleep(2)
+                updated_tx = await asyncio.to_thread(
+                    self._wallet_service._circle.get_transaction, burn_tx.id
+                )
                 
                 if updated_tx.tx_hash:
                     burn_tx_hash = updated_tx.tx_hash
@@ -412,9 +416,10 @@ class GatewayAdapter(ProtocolAdapter):
             
             self._logger.info(f"Attestation URL: {attestation_url}")
             
-            while attempt < max_attempts:
-                try:
-                    async with httpx.AsyncClient() as client:
+            # One client for the whole polling loop so the Iris connection is reused
+            async with httpx.AsyncClient() as client:
+                while attempt < max_attempts:
+                    try:
                         response = await client.get(attestation_url, timeout=10.0)
                         
                         if response.status_code == 200:
@@ -439,12 +444,12 @@ class GatewayAdapter(ProtocolAdapter):
                         else:
                             self._logger.debug(f"HTTP {response.status_code}")
                             
-                except Exception as e:
-                    self._logger.debug(f"Poll attempt {attempt + 1} failed: {e}")
+                    except Exception as e:
+                        self._logger.debug(f"Poll attempt {attempt + 1} failed: {e}")
                 
-                attempt += 1
-                if attempt < max_attempts:
-                    time.sleep(5)
+                    attempt += 1
+                    if attempt < max_attempts:
+                        await asyncio.sleep(5)
             
             if not attestation_signature or not attestation_message:
                 self._logger.warning("CCTP V2: Attestation polling timed out")
@@ -624,7 +629,8 @@ class GatewayAdapter(ProtocolAdapter):
         
         try:
             # receiveMessage(message, attestation)
-            mint_tx = self._wallet_service._circle.create_contract_execution(
+            mint_tx = await asyncio.to_thread(
+                self._wallet_service._circle.create_contract_execution,
                 wallet_id=executor_wallet.id,
                 contract_address=message_transmitter,
                 abi_function_signature="receiveMessage(bytes,bytes)",
@@ -636,8 +642,10 @@ class GatewayAdapter(ProtocolAdapter):
             self._logger.info("CCTP V2: Waiting for mint transaction confirmation...")
             mint_tx_hash = None
             for wait_attempt in range(60):
-                time.sleep(2)
-                updated_tx = self._wallet_service._circle.get_transaction(mint_tx.id)
+                await asyncio.sleep(2)
+                updated_tx = await asyncio.to_thread(
+                    self._wallet_service._circle.get_transaction, mint_tx.id
+                )
                 
                 if updated_tx.tx_hash:
                     mint_tx_hash = updated_tx.tx_hash
@@ -682,7 +690,7 @@ class GatewayAdapter(ProtocolAdapter):
         """Find a suitable wallet on the given network to execute transactions."""
         try:
             # List all wallets for this network
-            wallets = self._wallet_service.list_wallets(blockchain=network)
+            wallets = await asyncio.to_thread(self._wallet_service.list_wallets, blockchain=network)
             
             # Filter for active wallets
             active_wallets = [w for w in wallets if w.state == "LIVE"]
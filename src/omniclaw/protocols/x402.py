@@ -189,6 +189,12 @@ class X402Adapter(ProtocolAdapter):
             self._http_client = httpx.AsyncClient(timeout=30.0)
         return self._http_client
 
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     async def _request_with_402_check(
         self,
         url: str,
@@ -79,6 +79,11 @@ class CircuitBreaker:
             return CircuitState.CLOSED
         return CircuitState(data.get("state", CircuitState.CLOSED.value))
 
+    async def get_recovery_ts(self) -> float:
+        """Get the timestamp after which an OPEN circuit may recover (0 if unknown)."""
+        data = await self._storage.get("resilience", self._key_recovery)
+        return float(data.get("ts", 0)) if data else 0.0
+
     async def _set_state(self, state: CircuitState) -> None:
         """Set circuit state."""
         await self._storage.save(
@@ -174,10 +179,7 @@ class CircuitBreaker:
     async def __aenter__(self):
         """Context manager entry."""
         if not await self.is_available():
-            # Get recovery time for error message
-            data = await self._storage.get("resilience", self._key_recovery)
-            recovery_ts = float(data.get("ts", 0)) if data else 0
-            raise CircuitOpenError(self.service, recovery_ts)
+            raise CircuitOpenError(self.service, await self.get_recovery_ts())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
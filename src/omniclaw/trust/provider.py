@@ -24,6 +24,7 @@ from typing import Any
 
 import httpx
 
+from omniclaw.core.erc8004 import FUNCTION_SELECTORS as _FUNCTION_SELECTORS
 from omniclaw.core.erc8004 import (
     get_identity_registry,
     get_reputation_registry,
@@ -709,53 +710,6 @@ class ERC8004Provider:
             return []
 
 
-# ───────────────────────────────────────────────────────────────────
-# Pre-computed Keccak256 Function Selectors
-#
-# AUTHORITATIVE SOURCE: https://eips.ethereum.org/EIPS/eip-8004
-# All selectors verified via: keccak256(b"sig").hex()[:8]
-# using pycryptodome. DO NOT edit manually — recompute if needed.
-# ───────────────────────────────────────────────────────────────────
-
-_FUNCTION_SELECTORS: dict[str, str] = {
-    # ─── Identity Registry (ERC-721 base) ───
-    "ownerOf(uint256)": "6352211e",
-    "tokenURI(uint256)": "c87b56dd",
-    "balanceOf(address)": "70a08231",
-    "tokenOfOwnerByIndex(address,uint256)": "2f745c59",
-
-    # ─── Identity Registry (ERC-8004 extensions) ───
-    "register()": "1aa3a008",
-    "register(string)": "f2c298be",
-    "register(string,(string,bytes)[])": "8ea42286",
-    "setAgentURI(uint256,string)": "0af28bd3",
-    "getMetadata(uint256,string)": "cb4799f2",
-    "setMetadata(uint256,string,bytes)": "466648da",
-    "getAgentWallet(uint256)": "00339509",
-    "setAgentWallet(uint256,address,uint256,bytes)": "2d1ef5ae",
-    "unsetAgentWallet(uint256)": "3fddcf19",
-
-    # ─── Reputation Registry ───
-    "getIdentityRegistry()": "bc4d861b",
-    "giveFeedback(uint256,int128,uint8,string,string,string,string,bytes32)": "3c036a7e",
-    "revokeFeedback(uint256,uint64)": "4ab3ca99",
-    "appendResponse(uint256,address,uint64,string,bytes32)": "c2349ab2",
-    "readFeedback(uint256,address,uint64)": "232b0810",
-    "readAllFeedback(uint256,address[],string,string,bool)": "d9d84224",
-    "getSummary(uint256,address[],string,string)": "81bbba58",
-    "getResponseCount(uint256,address,uint64,address[])": "6e04cacd",
-    "getClients(uint256)": "42dd519c",
-    "getLastIndex(uint256,address)": "f2d81759",
-
-    # ─── Validation Registry ───
-    "validationRequest(address,uint256,string,bytes32)": "aaf400c4",
-    "validationResponse(bytes32,uint8,string,bytes32,string)": "3d659a96",
-    "getValidationStatus(bytes32)": "ff2febfc",
-    "getAgentValidations(uint256)": "8d5d0c2d",
-    "getValidatorRequests(address)": "4bf3158c",
-}
-
-
 __all__ = [
     "ERC8004Provider",
     "RPC_ENV_VAR",
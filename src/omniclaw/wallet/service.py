@@ -26,6 +26,7 @@ from omniclaw.core.types import (
     TransactionState,
     WalletInfo,
     WalletSetInfo,
+    as_decimal,
 )
 
 
@@ -475,7 +476,7 @@ class WalletService:
         Returns:
             Transfer result
         """
-        amount_decimal = Decimal(str(amount))
+        amount_decimal = as_decimal(amount)
         amount_str = str(amount_decimal)
 
         # Check balance if requested
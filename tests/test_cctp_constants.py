@@ -9,11 +9,14 @@ from omniclaw.core.cctp_constants import (
     TOKEN_MESSENGER_V2_CONTRACTS,
     MESSAGE_TRANSMITTER_V2_CONTRACTS,
     USDC_CONTRACTS,
+    CCTP_TABLE,
+    get_cctp_addresses,
     is_cctp_supported,
     get_token_messenger_v2,
     get_message_transmitter_v2,
     get_iris_url,
     get_iris_v2_attestation_url,
+    get_iris_v2_attestation_urls,
 )
 
 
@@ -100,7 +103,30 @@ class TestCCTPUtilities:
         contract = get_message_transmitter_v2(Network.BASE_SEPOLIA)
         assert contract is not None
         assert contract.startswith("0x")
+
+    def test_contract_lookups_match_string_tables(self):
+        """Enum-keyed lookups agree with the string-keyed address tables."""
+        for network in Network:
+            assert get_token_messenger_v2(network) == TOKEN_MESSENGER_V2_CONTRACTS.get(
+                network.value
+            )
+            assert get_message_transmitter_v2(network) == MESSAGE_TRANSMITTER_V2_CONTRACTS.get(
+                network.value
+            )
     
+    def test_cctp_table_merges_per_network_data(self):
+        """One lookup returns the domain and every contract address for a network."""
+        entry = get_cctp_addresses(Network.ARC_TESTNET)
+        assert entry.domain == 26
+        assert entry.token_messenger == TOKEN_MESSENGER_V2_CONTRACTS["ARC-TESTNET"]
+        assert entry.message_transmitter == MESSAGE_TRANSMITTER_V2_CONTRACTS["ARC-TESTNET"]
+        assert entry.usdc == USDC_CONTRACTS["ARC-TESTNET"]
+
+        # Supported for CCTP, but no EVM contracts configured
+        assert get_cctp_addresses(Network.SOL).token_messenger is None
+        assert get_cctp_addresses(Network.NEAR) is None
+        assert set(CCTP_TABLE) == set(CCTP_DOMAIN_IDS)
+
     def test_get_iris_url(self):
         """Test Iris API URL selection."""
         # Testnet should use sandbox
@@ -122,6 +148,27 @@ class TestCCTPUtilities:
         assert "v2/messages" in url
         assert "0x1234567890abcdef" in url
 
+    def test_get_iris_v2_attestation_url_format(self):
+        """Cached prefixes produce the full URL for each network and domain."""
+        assert get_iris_v2_attestation_url(Network.BASE, 6, "0xabc") == (
+            "https://iris-api.circle.com/v2/messages/6?transactionHash=0xabc"
+        )
+        assert get_iris_v2_attestation_url(Network.ARC_TESTNET, 26, "0xdef") == (
+            "https://iris-api-sandbox.circle.com/v2/messages/26?transactionHash=0xdef"
+        )
+
+    def test_get_iris_v2_attestation_urls_matches_single(self):
+        """Batch URL building preserves order and matches the single-item helper."""
+        items = [
+            (Network.BASE, 6, "0xabc"),
+            (Network.ETH_SEPOLIA, 0, "0x01"),
+            (Network.BASE, 6, "0xdef"),
+        ]
+        assert get_iris_v2_attestation_urls(items) == [
+            get_iris_v2_attestation_url(*item) for item in items
+        ]
+        assert get_iris_v2_attestation_urls([]) == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -161,3 +161,29 @@ async def test_execute_cctp_forces_mint_on_arc(mock_config, mock_wallet_service)
              
              # Verify _mint_usdc was called
              adapter._mint_usdc.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_mint_polling_does_not_block_event_loop(mock_config, mock_wallet_service):
+    """Confirmation polling yields to other tasks instead of sleeping the loop."""
+    adapter = GatewayAdapter(mock_config, mock_wallet_service)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.1)
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        result = await adapter._mint_usdc(
+            attestation_message="0xmsg",
+            attestation_signature="0xsig",
+            dest_network=Network.ARC_TESTNET,
+        )
+    finally:
+        ticker_task.cancel()
+
+    assert result["success"] is True
+    assert ticks > 5
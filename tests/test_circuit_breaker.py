@@ -164,3 +164,24 @@ async def test_manual_close(circuit):
     await circuit.close()
     assert await circuit.get_state() == CircuitState.CLOSED
     assert await circuit.is_available() is True
+
+
+@pytest.mark.asyncio
+async def test_get_recovery_ts(circuit):
+    """Recovery timestamp is 0 while closed and set in the future once tripped."""
+    assert await circuit.get_recovery_ts() == 0
+
+    before = time.time()
+    await circuit.trip()
+    assert await circuit.get_recovery_ts() > before
+
+
+@pytest.mark.asyncio
+async def test_breakers_share_state_through_storage(storage):
+    """Separate breakers for one service on the same storage see each other's trips."""
+    first = CircuitBreaker("svc", storage)
+    second = CircuitBreaker("svc", storage)
+
+    await first.trip()
+    assert await second.get_state() == CircuitState.OPEN
+    assert await CircuitBreaker("other", storage).get_state() == CircuitState.CLOSED
@@ -55,6 +55,11 @@ class TestClientInitialization:
         client = OmniClaw()
         assert client.config.circle_api_key == "test_api_key"
 
+    def test_router_built_on_first_use(self, client):
+        assert "_router" not in vars(client)
+        assert client.can_pay("0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0") is True
+        assert "_router" in vars(client)
+
     def test_init_no_default_wallet(self, mock_env):
         """Multi-tenant: no default_wallet_id parameter."""
         client = OmniClaw()
@@ -137,6 +142,84 @@ class TestGuardManager:
         assert "guard1" in names
         assert "guard2" in names
 
+    @pytest.mark.asyncio
+    async def test_list_guard_names_cache_invalidated_on_change(self):
+        from unittest.mock import AsyncMock
+
+        from omniclaw.storage.memory import InMemoryStorage
+
+        storage = InMemoryStorage()
+        gm = GuardManager(storage)
+        await gm.add_guard("w1", SingleTxGuard(max_amount=Decimal("10"), name="guard1"))
+        assert await gm.list_wallet_guard_names("w1") == ["guard1"]
+
+        storage.get = AsyncMock(wraps=storage.get)
+        assert await gm.list_wallet_guard_names("w1") == ["guard1"]
+        storage.get.assert_not_awaited()
+
+        await gm.add_guard("w1", BudgetGuard(daily_limit=Decimal("100"), name="guard2"))
+        assert await gm.list_wallet_guard_names("w1") == ["guard1", "guard2"]
+
+        await gm.remove_guard("w1", "guard1")
+        assert await gm.list_wallet_guard_names("w1") == ["guard2"]
+
+        await gm.clear_wallet_guards("w1")
+        assert await gm.list_wallet_guard_names("w1") == []
+
+    @pytest.mark.asyncio
+    async def test_list_guard_names_cache_expires(self, monkeypatch):
+        from omniclaw.guards import manager as manager_module
+        from omniclaw.storage.memory import InMemoryStorage
+
+        now = [100.0]
+        monkeypatch.setattr(manager_module.time, "monotonic", lambda: now[0])
+        storage = InMemoryStorage()
+        gm = GuardManager(storage)
+        other = GuardManager(storage)
+        assert await gm.list_wallet_guard_names("w1") == []
+
+        # Registered through another manager sharing the storage backend
+        await other.add_guard("w1", SingleTxGuard(max_amount=Decimal("10"), name="guard1"))
+        assert await gm.list_wallet_guard_names("w1") == []
+
+        now[0] += GuardManager.GUARD_CACHE_TTL
+        assert await gm.list_wallet_guard_names("w1") == ["guard1"]
+
+    @pytest.mark.asyncio
+    async def test_guard_chain_reuses_built_guards_until_changed(self):
+        from omniclaw.storage.memory import InMemoryStorage
+
+        gm = GuardManager(InMemoryStorage())
+        await gm.add_guard_for_set("set-1", BudgetGuard(daily_limit=Decimal("100"), name="b"))
+        await gm.add_guard("w1", SingleTxGuard(max_amount=Decimal("10"), name="s"))
+
+        first = await gm.get_guard_chain("w1", "set-1")
+        second = await gm.get_guard_chain("w1", "set-1")
+        assert first is not second
+        assert [g is h for g, h in zip(first, second, strict=True)] == [True, True]
+
+        await gm.add_guard_for_set("set-1", SingleTxGuard(max_amount=Decimal("5"), name="t"))
+        third = await gm.get_guard_chain("w1", "set-1")
+        assert [g.name for g in third] == ["b", "t", "s"]
+        assert third.get("s") is first.get("s")
+
+    @pytest.mark.asyncio
+    async def test_cached_guard_chain_shared_until_changed(self):
+        from omniclaw.storage.memory import InMemoryStorage
+
+        gm = GuardManager(InMemoryStorage())
+        await gm.add_guard_for_set("set-1", BudgetGuard(daily_limit=Decimal("100"), name="b"))
+        await gm.add_guard("w1", SingleTxGuard(max_amount=Decimal("10"), name="s"))
+
+        first = await gm.get_cached_guard_chain("w1", "set-1")
+        assert await gm.get_cached_guard_chain("w1", "set-1") is first
+        assert await gm.get_cached_guard_chain("w1") is not first
+
+        await gm.remove_guard_from_set("set-1", "b")
+        changed = await gm.get_cached_guard_chain("w1", "set-1")
+        assert changed is not first
+        assert [g.name for g in changed] == ["s"]
+
 
 class TestClientGuardManagement:
     """Tests for client.guards property (GuardManager)."""
@@ -277,6 +360,26 @@ class TestPayBlocked:
 
         assert entries[0].status == LedgerEntryStatus.BLOCKED
 
+    @pytest.mark.asyncio
+    async def test_pay_does_not_mutate_caller_metadata(self, client):
+        await client.guards.add_guard(
+            "wallet-123",
+            SingleTxGuard(max_amount=Decimal("5.00"), name="limit"),
+        )
+        metadata = {"order_id": "A-1"}
+
+        await client.pay(
+            wallet_id="wallet-123",
+            recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
+            amount=Decimal("10.00"),
+            metadata=metadata,
+        )
+
+        assert metadata == {"order_id": "A-1"}
+        entries = await client.ledger.query(wallet_id="wallet-123", limit=1)
+        assert entries[0].metadata["order_id"] == "A-1"
+        assert "idempotency_key" in entries[0].metadata
+
 
 class TestPayRequiresWallet:
     """Tests that pay() requires wallet_id."""
@@ -291,3 +394,166 @@ class TestPayRequiresWallet:
                 recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
                 amount=Decimal("10.00"),
             )
+
+
+class TestTimestamps:
+    """Tests for the cached ISO timestamp formatter."""
+
+    def test_now_iso_matches_datetime_isoformat(self):
+        from datetime import datetime, timedelta, timezone
+
+        from omniclaw.client import _now_iso
+
+        before = datetime.now(timezone.utc).replace(tzinfo=None)
+        stamps = [_now_iso() for _ in range(3)]
+        after = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        for stamp in stamps:
+            # Same naive UTC form the ledger has always stored for last_synced
+            parsed = datetime.fromisoformat(stamp)
+            assert parsed.tzinfo is None
+            assert before - timedelta(milliseconds=1) <= parsed <= after
+            assert parsed.isoformat() == stamp
+
+    def test_now_iso_omits_zero_microseconds(self, monkeypatch):
+        from datetime import datetime, timezone
+
+        from omniclaw.client import _now_iso
+
+        whole = 1_700_000_000 * 10**9
+        for ns in (whole, whole + 1_000, whole + 999):
+            monkeypatch.setattr("omniclaw.client.time.time_ns", lambda ns=ns: ns)
+            expected = (
+                datetime.fromtimestamp(ns // 1_000 / 1e6, timezone.utc)
+                .replace(tzinfo=None)
+                .isoformat()
+            )
+            assert _now_iso() == expected
+
+
+class TestAsyncLifecycle:
+    """Tests for async context manager teardown."""
+
+    @pytest.mark.asyncio
+    async def test_aexit_closes_adapter_http_clients(self, client):
+        from unittest.mock import AsyncMock
+
+        from omniclaw.protocols.x402 import X402Adapter
+
+        x402 = next(a for a in client._router.get_adapters() if isinstance(a, X402Adapter))
+        assert x402 in client._closables
+        http_client = AsyncMock()
+        x402._http_client = http_client
+
+        async with client:
+            pass
+
+        http_client.aclose.assert_awaited_once()
+        assert x402._http_client is None
+
+    @pytest.mark.asyncio
+    async def test_close_releases_circle_client(self, client):
+        from unittest.mock import AsyncMock
+
+        client._circle_client.aclose = AsyncMock()
+        await client.close()
+        client._circle_client.aclose.assert_awaited_once()
+
+
+class TestSyncTransaction:
+    """Tests for syncing ledger entries with the provider."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_syncs_share_one_provider_call(self, client):
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock
+
+        from omniclaw.core.types import TransactionInfo, TransactionState
+        from omniclaw.ledger import LedgerEntry, LedgerEntryStatus
+
+        release = asyncio.Event()
+
+        async def aget_transaction(tx_id):
+            await release.wait()
+            return TransactionInfo(id=tx_id, state=TransactionState.COMPLETE, tx_hash="0xhash")
+
+        client._circle_client = MagicMock()
+        client._circle_client.aget_transaction = AsyncMock(side_effect=aget_transaction)
+
+        entry = LedgerEntry(
+            wallet_id="w1",
+            recipient="0xabc",
+            amount=Decimal("1.00"),
+            metadata={"transaction_id": "tx-1"},
+        )
+        await client.ledger.record(entry)
+
+        syncs = [asyncio.create_task(client.sync_transaction(entry.id)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*syncs)
+
+        assert client._circle_client.aget_transaction.await_count == 1
+        assert all(r.status == LedgerEntryStatus.COMPLETED for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_sync_does_not_cancel_shared_fetch(self, client):
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock
+
+        from omniclaw.core.types import TransactionInfo, TransactionState
+
+        release = asyncio.Event()
+
+        async def aget_transaction(tx_id):
+            await release.wait()
+            return TransactionInfo(id=tx_id, state=TransactionState.COMPLETE)
+
+        client._circle_client = MagicMock()
+        client._circle_client.aget_transaction = AsyncMock(side_effect=aget_transaction)
+
+        leader = asyncio.create_task(client._fetch_transaction("tx-1"))
+        follower = asyncio.create_task(client._fetch_transaction("tx-1"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert (await follower).state == TransactionState.COMPLETE
+        assert leader.cancelled()
+        assert client._circle_client.aget_transaction.await_count == 1
+        assert not client._sync_inflight
+
+        # Nothing is cached: the next sync asks the provider again
+        await client._fetch_transaction("tx-1")
+        assert client._circle_client.aget_transaction.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sync_skips_ledger_write(self, client):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from omniclaw.core.types import TransactionInfo, TransactionState
+        from omniclaw.ledger import LedgerEntry
+
+        client._circle_client = MagicMock()
+        client._circle_client.aget_transaction = AsyncMock(
+            return_value=TransactionInfo(
+                id="tx-1", state=TransactionState.COMPLETE, tx_hash="0xhash"
+            )
+        )
+        entry = LedgerEntry(
+            wallet_id="w1",
+            recipient="0xabc",
+            amount=Decimal("1.00"),
+            metadata={"transaction_id": "tx-1"},
+        )
+        await client.ledger.record(entry)
+
+        first = await client.sync_transaction(entry.id)
+        assert first.metadata["provider_state"] == "COMPLETE"
+
+        client.ledger.update_status = AsyncMock()
+        second = await client.sync_transaction(entry.id)
+
+        client.ledger.update_status.assert_not_awaited()
+        assert second.metadata["last_synced"] == first.metadata["last_synced"]
@@ -121,6 +121,34 @@ class TestConfig:
         assert config.entity_secret == "env_secret"
         assert config.network == Network.ETH
 
+    def test_from_env_reuses_config_until_env_changes(self) -> None:
+        """Repeated from_env calls share one Config per environment snapshot."""
+        env_vars = {
+            "CIRCLE_API_KEY": "env_key",
+            "ENTITY_SECRET": "env_secret",
+            "OMNICLAW_NETWORK": "ARC-TESTNET",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=False):
+            first = Config.from_env()
+            assert Config.from_env() is first
+            assert Config.from_env(default_wallet_id="w1") is not first
+
+            os.environ["OMNICLAW_NETWORK"] = "ETH"
+            changed = Config.from_env()
+
+        assert changed is not first
+        assert changed.network == Network.ETH
+
+    def test_from_env_unhashable_override_not_cached(self) -> None:
+        """Unhashable override values bypass the cache instead of failing."""
+        env_vars = {"CIRCLE_API_KEY": "env_key", "ENTITY_SECRET": "env_secret"}
+
+        with patch.dict(os.environ, env_vars, clear=False):
+            config = Config.from_env(unused=["x"])
+
+        assert config.circle_api_key == "env_key"
+
     def test_with_updates(self) -> None:
         """Test creating new config with updates."""
         original = Config(
@@ -143,6 +171,22 @@ class TestConfig:
         assert updated.default_wallet_id == "new-wallet"
         assert updated.circle_api_key == "test_key"  # preserved
 
+    def test_with_updates_keeps_unlisted_fields(self) -> None:
+        """Fields not passed to with_updates keep their current values."""
+        original = Config(
+            circle_api_key="test_key",
+            entity_secret="test_secret",
+            storage_backend="redis",
+            redis_url="redis://localhost:6379/0",
+            http_timeout=5.0,
+        )
+
+        updated = original.with_updates(default_wallet_id="new-wallet")
+
+        assert updated.storage_backend == "redis"
+        assert updated.redis_url == "redis://localhost:6379/0"
+        assert updated.http_timeout == 5.0
+
     def test_masked_api_key(self) -> None:
         """Test API key masking for safe logging."""
         config = Config(
@@ -1,10 +1,12 @@
 """Unit tests for exceptions module."""
 
+import pickle
 from decimal import Decimal
 
 from omniclaw.core.exceptions import (
     ConfigurationError,
     CrosschainError,
+    CrosschainMethod,
     GuardError,
     IdempotencyError,
     InsufficientBalanceError,
@@ -14,6 +16,7 @@ from omniclaw.core.exceptions import (
     TransactionTimeoutError,
     WalletError,
     X402Error,
+    X402Stage,
 )
 
 
@@ -28,6 +31,13 @@ class TestOmniClawError:
         assert error.message == "Something went wrong"
         assert error.details == {}
 
+    def test_details_are_mutable_and_per_instance(self) -> None:
+        error = OmniClawError("Something went wrong")
+        error.details["retry_after"] = 5
+
+        assert error.details == {"retry_after": 5}
+        assert OmniClawError("Another").details == {}
+
     def test_error_with_details(self) -> None:
         """Test error with details dict."""
         error = OmniClawError(
@@ -144,6 +154,7 @@ class TestInsufficientBalanceError:
         assert "Balance: 2.50" in str_repr
         assert "Required: 10.00" in str_repr
         assert "Shortfall: 7.50" in str_repr
+        assert str(error) is str_repr
 
 
 class TestNetworkError:
@@ -208,6 +219,16 @@ class TestX402Error:
         assert "https://api.example.com" in str_repr
 
 
+    def test_x402_stage_is_enum_member(self) -> None:
+        """Test known stages map to X402Stage while staying string-comparable."""
+        error = X402Error("Settlement failed", url="https://api.example.com", stage="settlement")
+        custom = X402Error("Other", url="https://api.example.com", stage="custom")
+
+        assert error.stage is X402Stage.SETTLEMENT
+        assert error.stage == "settlement"
+        assert custom.stage == "custom"
+
+
 class TestCrosschainError:
     """Tests for CrosschainError."""
 
@@ -236,6 +257,7 @@ class TestCrosschainError:
         str_repr = str(error)
         assert "[crosschain:cctp]" in str_repr
         assert "ETH → ARC" in str_repr
+        assert error.method is CrosschainMethod.CCTP
 
 
 class TestTransactionTimeoutError:
@@ -302,3 +324,22 @@ class TestExceptionHierarchy:
         assert isinstance(balance_error, PaymentError)
         assert isinstance(x402_error, PaymentError)
         assert isinstance(crosschain_error, PaymentError)
+
+    def test_attributes_live_in_slots(self) -> None:
+        """Test fields are stored in slots rather than the instance dict."""
+        error = InsufficientBalanceError(
+            "test", Decimal("1"), Decimal("3"), wallet_id="wallet-123"
+        )
+
+        assert error.__dict__ == {}
+        assert error.shortfall == Decimal("2")
+
+    def test_pickle_round_trip_keeps_slot_attributes(self) -> None:
+        """Test slot attributes survive pickling."""
+        wallet_error = pickle.loads(pickle.dumps(WalletError("gone", wallet_id="wallet-123")))
+        network_error = pickle.loads(pickle.dumps(NetworkError("slow", status_code=504)))
+
+        assert wallet_error.wallet_id == "wallet-123"
+        assert str(wallet_error) == "gone"
+        assert network_error.status_code == 504
+        assert network_error.url is None
@@ -0,0 +1,151 @@
+"""
+Tests for the Circle Gateway API client.
+
+No real Gateway API calls are made.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from omniclaw.core.gateway_client import (
+    _SHARED_CLIENTS,
+    BurnIntent,
+    GatewayAPIClient,
+    SignedBurnIntent,
+    TransferSpec,
+    close_shared_clients,
+)
+
+
+class TestGatewayAPIClientPool:
+    """Connection pool configuration."""
+
+    @pytest.mark.asyncio
+    async def test_client_uses_tuned_limits(self, monkeypatch):
+        captured = {}
+        real_client = httpx.AsyncClient
+
+        def fake_client(**kwargs):
+            captured.update(kwargs)
+            return real_client(timeout=kwargs["timeout"])
+
+        monkeypatch.setattr(httpx, "AsyncClient", fake_client)
+        client = GatewayAPIClient(timeout=5.0, max_connections=50, max_keepalive=10)
+        http_client = await client._get_client()
+
+        assert captured["timeout"] == 5.0
+        assert captured["http2"] is False
+        limits = captured["limits"]
+        assert limits.max_connections == 50
+        assert limits.max_keepalive_connections == 10
+        assert limits.keepalive_expiry == GatewayAPIClient.KEEPALIVE_EXPIRY
+        assert await client._get_client() is http_client
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_pool_per_settings(self):
+        first = GatewayAPIClient()
+        second = GatewayAPIClient()
+        other = GatewayAPIClient(timeout=5.0)
+
+        pooled = await first._get_client()
+        assert await second._get_client() is pooled
+        assert await other._get_client() is not pooled
+
+        await first.close()
+        await first.close()
+        assert not pooled.is_closed
+        assert await second._get_client() is pooled
+
+        await second.close()
+        assert pooled.is_closed
+        assert await first._get_client() is not pooled
+        await first.close()
+        await other.close()
+        assert not _SHARED_CLIENTS
+
+    @pytest.mark.asyncio
+    async def test_close_shared_clients_closes_pools(self):
+        client = GatewayAPIClient()
+        pooled = await client._get_client()
+
+        await close_shared_clients()
+        assert pooled.is_closed
+        assert not _SHARED_CLIENTS
+
+        fresh = await client._get_client()
+        assert fresh is not pooled
+        await client.close()
+        assert fresh.is_closed
+
+
+class TestGatewayAPIClientFanOut:
+    """Concurrent estimate and balance requests."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        client = GatewayAPIClient()
+        client.in_flight = client.max_in_flight = 0
+
+        async def fake_post(path, body):
+            client.in_flight += 1
+            client.max_in_flight = max(client.max_in_flight, client.in_flight)
+            await asyncio.sleep(0.01)
+            client.in_flight -= 1
+            if path == "/estimate":
+                return {"echo": body}
+            depositor = body["sources"][0]["depositor"]
+            return {"balances": [{"domain": 6, "balance": str(len(depositor))}]}
+
+        monkeypatch.setattr(client, "_post", fake_post)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_estimate_many_preserves_order(self, client):
+        transfers = [(0, 6, amount) for amount in range(8)]
+
+        results = await client.estimate_many(transfers, concurrency=3)
+
+        assert [r["echo"]["value"] for r in results] == [str(a) for a in range(8)]
+        assert client.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_balances_many_keys_by_depositor(self, client):
+        balances = await client.balances_many("USDC", ["0xa", "0xbbb"], domains=[6])
+
+        assert set(balances) == {"0xa", "0xbbb"}
+        assert balances["0xbbb"][0].balance == 5
+        assert balances["0xa"][0].chain_name == "Base"
+        assert client.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    async def test_fan_out_rejects_non_positive_concurrency(self, client, concurrency):
+        with pytest.raises(ValueError, match="concurrency"):
+            await client.estimate_many([(0, 6, 1)], concurrency=concurrency)
+        with pytest.raises(ValueError, match="concurrency"):
+            await client.balances_many("USDC", ["0xa"], concurrency=concurrency)
+        assert client.max_in_flight == 0
+
+
+class TestBurnIntentSerialization:
+    """Gateway API payload shapes."""
+
+    def test_signed_intent_to_api_dict(self):
+        spec = TransferSpec(source_domain=0, destination_domain=6, value=1_500_000, salt="0x01")
+        intent = BurnIntent(spec=spec, max_fee=2_000)
+        signed = SignedBurnIntent(burn_intent=intent, signature="0xsig")
+
+        payload = signed.to_api_dict()
+
+        assert payload["signature"] == "0xsig"
+        burn = payload["burnIntent"]
+        assert burn["maxFee"] == "2000"
+        assert burn["maxBlockHeight"] == str(2**64 - 1)
+        assert burn["spec"]["sourceDomain"] == 0
+        assert burn["spec"]["destinationDomain"] == 6
+        assert burn["spec"]["value"] == "1500000"
+        assert burn["spec"]["hookData"] == "0x"
+        assert not hasattr(spec, "__dict__")
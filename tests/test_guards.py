@@ -5,6 +5,8 @@ Tests all guard types: BudgetGuard, SingleTxGuard, RecipientGuard,
 RateLimitGuard, ConfirmGuard, and GuardChain.
 """
 
+import re
+from datetime import datetime
 from decimal import Decimal
 
 import pytest
@@ -129,6 +131,39 @@ class TestBudgetGuard:
         assert result.allowed is False
         assert "total" in result.reason.lower()
 
+    def test_limits_normalized_to_decimal(self):
+        guard = BudgetGuard(daily_limit=20, total_limit="50.5", storage=InMemoryStorage())
+        assert guard._daily_limit == Decimal("20")
+        assert isinstance(guard._daily_limit, Decimal)
+        assert guard._total_limit == Decimal("50.5")
+        assert guard._hourly_limit is None
+
+    @pytest.mark.asyncio
+    async def test_reserve_reads_counters_once_per_limit(self, payment_context):
+        storage = InMemoryStorage()
+        guard = BudgetGuard(daily_limit=Decimal("25.00"), storage=storage)
+
+        reads = 0
+        original_get = storage.get
+
+        async def counting_get(collection, key):
+            nonlocal reads
+            reads += 1
+            return await original_get(collection, key)
+
+        storage.get = counting_get
+        token = await guard.reserve(payment_context)
+        assert reads == 1
+        await guard.commit(token)
+
+        # 10 committed + 20 requested > 25 is rejected and rolled back
+        ctx = PaymentContext(wallet_id="wallet-123", recipient="0x123", amount=Decimal("20.00"))
+        with pytest.raises(ValueError, match="Daily"):
+            await guard.reserve(ctx)
+        key = guard._get_period_keys("wallet-123", datetime.now())["daily"]
+        reserved = await storage.get("guard_state", f"{key}:reserved")
+        assert Decimal(str(reserved)) == Decimal("0")
+
 
 class TestSingleTxGuard:
     """Tests for SingleTxGuard."""
@@ -223,6 +258,63 @@ class TestRecipientGuard:
         result = await guard.check(ctx)
         assert result.allowed is True
 
+    @pytest.mark.asyncio
+    async def test_patterns_and_domains_survive_guard_manager(self):
+        from omniclaw.guards.manager import GuardManager
+
+        manager = GuardManager(InMemoryStorage())
+        await manager.add_guard(
+            "w1",
+            RecipientGuard(
+                mode="whitelist",
+                patterns=[r"api\.example\.com.*", r"api\.example\.com.*"],
+                domains=["Paid.Example.ORG"],
+            ),
+        )
+        chain = await manager.get_wallet_guards("w1")
+        guard = chain.get("recipient")
+        assert len(guard._patterns) == 1
+
+        for recipient in ("api.example.com/paid", "https://paid.example.org/x"):
+            ctx = PaymentContext(wallet_id="w1", recipient=recipient, amount=Decimal("5.00"))
+            assert (await chain.check(ctx)).allowed is True
+
+    @pytest.mark.asyncio
+    async def test_fused_and_unfusable_patterns_match_like_separate_ones(self):
+        recipients = ["api.example.com/paid", "0xABAB", "https://shop.example.net", "0xdead"]
+        pattern_sets = [
+            [r"^api\.example\.com", r"^0x(?:ab)+$", r"shop\."],  # fused
+            [r"^api\.example\.com", r"^0x(ab)\1$", r"shop\."],  # capture group: not fused
+            [r"(?i)^API\.", r"^0xabab$", r"shop\."],  # inline global flag: not fused
+            [r"^0x dead $", r"(?x)^0x abab$"],  # (?x) must not apply to the other pattern
+        ]
+        for patterns in pattern_sets:
+            guard = RecipientGuard(mode="blacklist", patterns=patterns)
+            for recipient in recipients:
+                ctx = PaymentContext(wallet_id="w1", recipient=recipient, amount=Decimal("1"))
+                expected = any(re.search(p, recipient, re.IGNORECASE) for p in patterns)
+                assert (await guard.check(ctx)).allowed is not expected, (patterns, recipient)
+
+    def test_patterns_with_inline_global_flags_are_not_fused(self):
+        from omniclaw.guards.recipient import _compile_alternation
+
+        assert _compile_alternation((r"^api\.", r"shop\.")) is not None
+        assert _compile_alternation((r"^api\.", r"(?s)shop.")) is None
+        assert _compile_alternation((r"(?x) ^api \.", r"shop\.")) is None
+
+    @pytest.mark.asyncio
+    async def test_added_domains_and_patterns_take_effect(self):
+        guard = RecipientGuard(mode="whitelist", domains=["a.example"])
+        ctx = PaymentContext(wallet_id="w1", recipient="https://B.example/x", amount=Decimal("1"))
+        assert (await guard.check(ctx)).allowed is False
+
+        guard.add_domain("b.example")
+        assert (await guard.check(ctx)).allowed is True
+
+        guard.clear()
+        guard.add_pattern(r"/x$")
+        assert (await guard.check(ctx)).allowed is True
+
 
 class TestRateLimitGuard:
     """Tests for RateLimitGuard."""
@@ -373,11 +465,46 @@ class TestGuardChain:
         assert result.allowed is False
         assert "BudgetGuard" in result.guard_name or "budget" in result.guard_name.lower()
 
+    @pytest.mark.asyncio
+    async def test_check_parallel_all_pass(self, payment_context):
+        chain = GuardChain(
+            [
+                SingleTxGuard(max_amount=Decimal("100.00"), name="single"),
+                BudgetGuard(daily_limit=Decimal("100.00"), storage=InMemoryStorage(), name="budget"),
+            ]
+        )
+        result = await chain.check_parallel(payment_context)
+        assert result.allowed is True
+        assert result.metadata["passed_guards"] == ["single", "budget"]
+
+    @pytest.mark.asyncio
+    async def test_check_parallel_blocks(self, payment_context):
+        chain = GuardChain(
+            [
+                BudgetGuard(daily_limit=Decimal("100.00"), storage=InMemoryStorage()),
+                SingleTxGuard(max_amount=Decimal("5.00")),  # Will fail
+            ]
+        )
+        result = await chain.check_parallel(payment_context)
+        assert result.allowed is False
+        assert "single" in result.guard_name.lower()
+
     def test_add_guard(self, payment_context):
         chain = GuardChain()
         chain.add(SingleTxGuard(max_amount=Decimal("50.00")))
         assert len(chain) == 1
 
+    def test_names_follow_chain_changes(self):
+        chain = GuardChain([SingleTxGuard(max_amount=Decimal("50.00"), name="a")])
+        assert chain.names == ("a",)
+        assert chain.names is chain.names
+
+        chain.add(SingleTxGuard(max_amount=Decimal("50.00"), name="b"))
+        assert chain.names == ("a", "b")
+
+        chain.remove("a")
+        assert chain.names == ("b",)
+
     def test_remove_guard(self, payment_context):
         guard = SingleTxGuard(max_amount=Decimal("50.00"), name="test_guard")
         chain = GuardChain([guard])
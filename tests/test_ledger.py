@@ -56,6 +56,29 @@ class TestLedgerEntry:
         assert "id" in d
 
 
+    def test_from_context_shares_metadata(self):
+        from omniclaw.guards.base import PaymentContext
+
+        meta = {"idempotency_key": "k1"}
+        context = PaymentContext(
+            wallet_id="w1",
+            wallet_set_id="set-1",
+            recipient="0x123",
+            amount=Decimal("10.00"),
+            purpose="API payment",
+            metadata=meta,
+        )
+        entry = LedgerEntry.from_context(context)
+
+        assert entry.wallet_id == "w1"
+        assert entry.wallet_set_id == "set-1"
+        assert entry.recipient == "0x123"
+        assert entry.amount == Decimal("10.00")
+        assert entry.purpose == "API payment"
+        assert entry.metadata is meta
+        assert entry.status == LedgerEntryStatus.PENDING
+
+
 class TestLedgerEntryStatus:
     """Tests for LedgerEntryStatus enum."""
 
@@ -127,6 +150,27 @@ class TestLedger:
         assert retrieved.status == LedgerEntryStatus.COMPLETED
         assert retrieved.tx_hash == "0xtxhash123"
 
+    @pytest.mark.asyncio
+    async def test_record_and_finalize_unrecorded_entry(self, ledger):
+        entry = LedgerEntry(
+            wallet_id="w1",
+            recipient="0xabc",
+            amount=Decimal("25.00"),
+            metadata={"purpose_code": "p1"},
+        )
+
+        await ledger.record_and_finalize(
+            entry,
+            LedgerEntryStatus.COMPLETED,
+            tx_hash="0xtxhash123",
+            metadata_updates={"transaction_id": "tx-1"},
+        )
+
+        retrieved = await ledger.get(entry.id)
+        assert retrieved.status == LedgerEntryStatus.COMPLETED
+        assert retrieved.tx_hash == "0xtxhash123"
+        assert retrieved.metadata == {"purpose_code": "p1", "transaction_id": "tx-1"}
+
     @pytest.mark.asyncio
     async def test_query_by_wallet(self, ledger):
         # Add entries for different wallets
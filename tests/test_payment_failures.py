@@ -168,3 +168,295 @@ async def test_batch_pay_partial_failure(client_mocked):
     assert result.success_count == 2
     assert result.failed_count == 1
     assert len(result.results) == 3
+
+
+@pytest.mark.asyncio
+async def test_teardown_updates_ledger_when_release_fails(client_mocked):
+    """A failing guard release must not prevent the ledger status update."""
+    from omniclaw.ledger import LedgerEntry, LedgerEntryStatus
+
+    guards_chain = MagicMock()
+    guards_chain.release = AsyncMock(side_effect=RuntimeError("storage down"))
+    entry = LedgerEntry(wallet_id="w1", recipient="r1", amount=Decimal("1.00"))
+
+    await client_mocked._teardown(
+        guards_chain,
+        [("budget", "token-1")],
+        entry,
+        LedgerEntryStatus.FAILED,
+        metadata_updates={"error": "boom"},
+    )
+
+    guards_chain.release.assert_awaited_once_with([("budget", "token-1")])
+    stored = await client_mocked.ledger.get(entry.id)
+    assert stored.status == LedgerEntryStatus.FAILED
+    assert stored.metadata["error"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_queue_background_reserves_before_returning(client_mocked):
+    """QUEUE_BACKGROUND creates the intent and reservation before returning."""
+    from omniclaw.core.types import PaymentStrategy
+    from omniclaw.ledger import LedgerEntryStatus
+
+    client_mocked._circuit_breakers["circle_api"].is_available = AsyncMock(return_value=False)
+
+    async with client_mocked:
+        result = await client_mocked.pay(
+            wallet_id="wallet-123",
+            recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
+            amount=Decimal("100.00"),
+            strategy=PaymentStrategy.QUEUE_BACKGROUND,
+        )
+        assert result.success is True
+        assert result.status == PaymentStatus.PENDING
+        assert result.metadata["queued"] is True
+
+        # Visible to concurrent payments without waiting for the worker
+        intent = await client_mocked.get_payment_intent(result.metadata["intent_id"])
+        assert intent is not None
+        assert intent.amount == Decimal("100.00")
+        reserved = await client_mocked._reservation.get_reserved_total("wallet-123")
+        assert reserved == Decimal("100.00")
+
+    entries = await client_mocked.ledger.query(wallet_id="wallet-123")
+    assert entries[0].status == LedgerEntryStatus.PENDING
+    assert entries[0].metadata["intent_id"] == intent.id
+
+
+@pytest.mark.asyncio
+async def test_queue_background_fails_when_intent_cannot_be_created(client_mocked):
+    """A failure to persist the intent fails the payment instead of being logged."""
+    from omniclaw.core.types import PaymentStrategy
+
+    client_mocked._circuit_breakers["circle_api"].is_available = AsyncMock(return_value=False)
+    client_mocked._intent_service.create = AsyncMock(side_effect=RuntimeError("storage down"))
+
+    result = await client_mocked.pay(
+        wallet_id="wallet-123",
+        recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
+        amount=Decimal("100.00"),
+        strategy=PaymentStrategy.QUEUE_BACKGROUND,
+    )
+
+    assert result.success is False
+    assert "storage down" in result.error
+    assert await client_mocked._reservation.get_reserved_total("wallet-123") == Decimal("0")
+
+
+@pytest.mark.asyncio
+async def test_batch_pay_limits_concurrency_per_method(client_mocked):
+    """Each payment method gets its own concurrency slots in batch_pay."""
+    import asyncio
+
+    from omniclaw.core.types import PaymentMethod, PaymentRequest
+
+    target = client_mocked._router
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def mock_router_pay(*args, **kwargs):
+        recipient = kwargs["recipient"]
+        in_flight[recipient] = in_flight.get(recipient, 0) + 1
+        peak[recipient] = max(peak.get(recipient, 0), in_flight[recipient])
+        await asyncio.sleep(0.01)
+        in_flight[recipient] -= 1
+        return PaymentResult(
+            success=True,
+            transaction_id="tx",
+            blockchain_tx=None,
+            amount=kwargs["amount"],
+            recipient=recipient,
+            method=PaymentMethod.TRANSFER,
+            status=PaymentStatus.COMPLETED,
+        )
+
+    target.pay = AsyncMock(side_effect=mock_router_pay)
+    target.detect_method = MagicMock(
+        side_effect=lambda recipient, **kw: (
+            PaymentMethod.X402 if recipient.startswith("https://") else PaymentMethod.TRANSFER
+        )
+    )
+
+    evm = "0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0"
+    url = "https://api.example.com/paid"
+    requests = [
+        PaymentRequest(wallet_id="w1", recipient=r, amount=Decimal("1.00"))
+        for r in [evm] * 4 + [url] * 4
+    ]
+
+    result = await client_mocked.batch_pay(requests, concurrency=2)
+
+    assert result.success_count == 8
+    assert peak == {evm: 2, url: 2}
+
+
+@pytest.mark.asyncio
+async def test_batch_pay_iter_yields_in_completion_order(client_mocked):
+    """batch_pay_iter yields fast payments before slow ones; raises become FAILED."""
+    import asyncio
+
+    from omniclaw.core.types import PaymentMethod, PaymentRequest
+
+    async def mock_router_pay(*args, **kwargs):
+        amount = kwargs["amount"]
+        if amount == Decimal("3.00"):
+            raise RuntimeError("adapter exploded")
+        await asyncio.sleep(0.05 if amount == Decimal("1.00") else 0)
+        return PaymentResult(
+            success=True,
+            transaction_id=f"tx-{amount}",
+            blockchain_tx=None,
+            amount=amount,
+            recipient=kwargs["recipient"],
+            method=PaymentMethod.TRANSFER,
+            status=PaymentStatus.COMPLETED,
+        )
+
+    client_mocked._router.pay = AsyncMock(side_effect=mock_router_pay)
+    requests = [
+        PaymentRequest(wallet_id="w1", recipient="r1", amount=Decimal(amount))
+        for amount in ("1.00", "2.00", "3.00")
+    ]
+
+    results = [r async for r in client_mocked.batch_pay_iter(requests)]
+
+    assert results[-1].amount == Decimal("1.00")
+    failed = [r for r in results if not r.success]
+    assert len(failed) == 1 and "adapter exploded" in failed[0].error
+
+    batch = await client_mocked.batch_pay(requests)
+    assert [r.amount for r in batch.results] == [r.amount for r in requests]
+
+
+@pytest.mark.asyncio
+async def test_unguarded_payment_writes_ledger_once(client_mocked):
+    """With skip_guards the ledger entry is persisted once, already finalized."""
+    from omniclaw.core.types import TransactionInfo, TransactionState
+    from omniclaw.ledger import LedgerEntryStatus
+
+    client_mocked._wallet_service.transfer.return_value = TransferResult(
+        success=True,
+        transaction=TransactionInfo(id="tx-1", state=TransactionState.COMPLETE),
+        tx_hash="0xhash",
+    )
+    client_mocked._storage.save = AsyncMock(wraps=client_mocked._storage.save)
+
+    result = await client_mocked.pay(
+        wallet_id="wallet-123",
+        recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
+        amount=Decimal("10.00"),
+        skip_guards=True,
+    )
+
+    assert result.success is True
+    client_mocked.ledger.record.assert_not_awaited()
+    ledger_saves = [
+        c for c in client_mocked._storage.save.await_args_list if c.args[0] == "ledger_entries"
+    ]
+    assert len(ledger_saves) == 1
+    assert ledger_saves[0].args[2]["status"] == LedgerEntryStatus.COMPLETED.value
+    assert ledger_saves[0].args[2]["metadata"]["transaction_id"] == "tx-1"
+
+
+@pytest.mark.asyncio
+async def test_pay_simple_routes_without_ledger_or_guards(client_mocked):
+    """pay_simple() goes straight to the router and records nothing."""
+    from omniclaw.core.types import TransactionInfo, TransactionState
+
+    client_mocked._wallet_service.transfer.return_value = TransferResult(
+        success=True,
+        transaction=TransactionInfo(id="tx-1", state=TransactionState.COMPLETE),
+        tx_hash="0xhash",
+    )
+    client_mocked._storage.save = AsyncMock(wraps=client_mocked._storage.save)
+
+    result = await client_mocked.pay_simple(
+        "wallet-123", "0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0", "10.00"
+    )
+
+    assert result.success is True
+    assert result.amount == Decimal("10.00")
+    client_mocked._storage.save.assert_not_awaited()
+    assert client_mocked._wallet_service.transfer.call_args.kwargs["idempotency_key"]
+
+
+@pytest.mark.asyncio
+async def test_pay_normalizes_network_and_fee_level(client_mocked):
+    """String destination chains and fee levels reach the router as enums."""
+    from omniclaw.core.exceptions import ValidationError
+    from omniclaw.core.types import FeeLevel, PaymentMethod, PaymentStrategy
+
+    client_mocked._router.pay = AsyncMock(
+        return_value=PaymentResult(
+            success=True,
+            transaction_id="tx-1",
+            blockchain_tx=None,
+            amount=Decimal("1.00"),
+            recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
+            method=PaymentMethod.CROSSCHAIN,
+            status=PaymentStatus.PENDING,
+        )
+    )
+
+    await client_mocked.pay(
+        wallet_id="wallet-123",
+        recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
+        amount=Decimal("1.00"),
+        destination_chain="base-sepolia",
+        fee_level="high",
+        skip_guards=True,
+        strategy=PaymentStrategy.FAIL_FAST,
+    )
+
+    kwargs = client_mocked._router.pay.call_args.kwargs
+    assert kwargs["destination_chain"] is Network.BASE_SEPOLIA
+    assert kwargs["fee_level"] is FeeLevel.HIGH
+
+    with pytest.raises(ValidationError, match="Unknown network"):
+        await client_mocked.pay(
+            wallet_id="wallet-123",
+            recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
+            amount=Decimal("1.00"),
+            destination_chain="not-a-chain",
+        )
+
+
+@pytest.mark.asyncio
+async def test_batch_pay_iter_early_exit_lets_started_payments_finish(client_mocked):
+    """Stopping batch_pay_iter early drops results but never aborts a started payment."""
+    import asyncio
+
+    from omniclaw.core.types import PaymentMethod, PaymentRequest
+
+    finished: list[Decimal] = []
+
+    async def mock_router_pay(*args, **kwargs):
+        amount = kwargs["amount"]
+        await asyncio.sleep(0 if amount == Decimal("1.00") else 0.02)
+        finished.append(amount)
+        return PaymentResult(
+            success=True,
+            transaction_id=f"tx-{amount}",
+            blockchain_tx=None,
+            amount=amount,
+            recipient=kwargs["recipient"],
+            method=PaymentMethod.TRANSFER,
+            status=PaymentStatus.COMPLETED,
+        )
+
+    client_mocked._router.pay = AsyncMock(side_effect=mock_router_pay)
+    requests = [
+        PaymentRequest(wallet_id="w1", recipient="r1", amount=Decimal(amount))
+        for amount in ("1.00", "2.00", "3.00", "4.00")
+    ]
+
+    results = client_mocked.batch_pay_iter(requests, concurrency=2)
+    first = await anext(results)
+    await results.aclose()
+
+    assert first.amount == Decimal("1.00")
+    await asyncio.sleep(0.05)
+    # 2.00 and 3.00 had started and completed; 4.00 was still queued and never sent
+    assert finished == [Decimal("1.00"), Decimal("2.00"), Decimal("3.00")]
+    assert client_mocked._router.pay.await_count == 3
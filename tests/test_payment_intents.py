@@ -169,3 +169,320 @@ async def test_cancel_intent(client):
         await client.intent.confirm(intent.id)
     
     assert "Cannot be confirmed" in str(exc.value) or "cannot be confirmed" in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_reserve_cas_detects_version_conflict(client):
+    """A reservation made after the version was read causes a CAS conflict."""
+    reservation = client._reservation
+    version = await reservation.get_version("wallet-1")
+
+    await reservation.reserve("wallet-1", Decimal("10.0"), "intent-a")
+
+    assert await reservation.reserve_cas(
+        "wallet-1", Decimal("20.0"), "intent-b", expected_version=version
+    ) is False
+    assert await reservation.get_reserved_total("wallet-1") == Decimal("10.0")
+
+    version = await reservation.get_version("wallet-1")
+    assert await reservation.reserve_cas(
+        "wallet-1", Decimal("20.0"), "intent-b", expected_version=version
+    ) is True
+    assert await reservation.get_reserved_total("wallet-1") == Decimal("30.0")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_intents_do_not_overcommit(client):
+    """Concurrent authorizations without a lock still cannot over-reserve."""
+    import asyncio
+
+    from omniclaw.core.types import SimulationResult
+
+    client._wallet_service.get_usdc_balance_amount = lambda wid: Decimal("100.0")
+    client._router.simulate = AsyncMock(
+        return_value=SimulationResult(would_succeed=True, route=PaymentMethod.TRANSFER)
+    )
+
+    results = await asyncio.gather(
+        client.create_payment_intent(wallet_id="wallet-1", recipient="0xabc", amount="60.0"),
+        client.create_payment_intent(wallet_id="wallet-1", recipient="0xabc", amount="60.0"),
+        return_exceptions=True,
+    )
+
+    created = [r for r in results if not isinstance(r, Exception)]
+    assert len(created) == 1
+    assert isinstance([r for r in results if isinstance(r, Exception)][0], PaymentError)
+    assert await client._reservation.get_reserved_total("wallet-1") == Decimal("60.0")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("intent_delay", [0.0, 0.005, 0.015])
+async def test_concurrent_pay_and_intent_do_not_overcommit(client, intent_delay):
+    """A pay() debit and a lock-free authorization never commit the same funds."""
+    import asyncio
+
+    from omniclaw.core.types import PaymentStatus, SimulationResult
+
+    balance = {"wallet-1": Decimal("100.0")}
+    client._wallet_service.get_usdc_balance_amount = lambda wid: balance[wid]
+
+    async def simulate(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return SimulationResult(would_succeed=True, route=PaymentMethod.TRANSFER)
+
+    async def router_pay(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        balance[kwargs["wallet_id"]] -= kwargs["amount"]
+        return PaymentResult(
+            success=True,
+            transaction_id="tx-1",
+            blockchain_tx=None,
+            amount=kwargs["amount"],
+            recipient=kwargs["recipient"],
+            method=PaymentMethod.TRANSFER,
+            status=PaymentStatus.COMPLETED,
+        )
+
+    client._router.simulate = AsyncMock(side_effect=simulate)
+    client._router.pay = AsyncMock(side_effect=router_pay)
+
+    async def authorize():
+        await asyncio.sleep(intent_delay)
+        return await client.create_payment_intent(
+            wallet_id="wallet-1", recipient="0xabc", amount="60.0"
+        )
+
+    await asyncio.gather(
+        client.pay(wallet_id="wallet-1", recipient="0xabc", amount="60.0", check_trust=False),
+        authorize(),
+        return_exceptions=True,
+    )
+
+    reserved = await client._reservation.get_reserved_total("wallet-1")
+    spent = Decimal("100.0") - balance["wallet-1"]
+    assert spent + reserved == Decimal("60.0")
+    assert await client._reservation.get_version("wallet-1") % 2 == 0
+
+
+@pytest.mark.asyncio
+async def test_create_intent_idempotent_replay(client):
+    """Replaying a keyed create returns the original intent without re-simulating."""
+    from omniclaw.core.exceptions import IdempotencyError
+    from omniclaw.core.types import SimulationResult
+
+    client._wallet_service.get_usdc_balance_amount = lambda wid: Decimal("200.0")
+    client._router.simulate = AsyncMock(
+        return_value=SimulationResult(would_succeed=True, route=PaymentMethod.TRANSFER)
+    )
+
+    first = await client.create_payment_intent(
+        wallet_id="wallet-1", recipient="0xabc", amount="50.0", idempotency_key="key-1"
+    )
+    replay = await client.create_payment_intent(
+        wallet_id="wallet-1", recipient="0xabc", amount="50.0", idempotency_key="key-1"
+    )
+
+    assert replay.id == first.id
+    assert client._router.simulate.await_count == 1
+    assert await client._reservation.get_reserved_total("wallet-1") == Decimal("50.0")
+
+    with pytest.raises(IdempotencyError):
+        await client.create_payment_intent(
+            wallet_id="wallet-1", recipient="0xabc", amount="75.0", idempotency_key="key-1"
+        )
+    with pytest.raises(IdempotencyError):
+        await client.create_payment_intent(
+            wallet_id="wallet-1",
+            recipient="0xabc",
+            amount="50.0",
+            expires_in=60,
+            idempotency_key="key-1",
+        )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_confirm_executes_once(client):
+    """Of two concurrent confirms of one intent, only one reaches pay()."""
+    import asyncio
+
+    from omniclaw.core.types import PaymentStatus, SimulationResult
+
+    client._wallet_service.get_usdc_balance_amount = lambda wid: Decimal("200.0")
+    client._router.simulate = AsyncMock(
+        return_value=SimulationResult(would_succeed=True, route=PaymentMethod.TRANSFER)
+    )
+    client._router.pay = AsyncMock(
+        return_value=PaymentResult(
+            success=True,
+            transaction_id="tx-1",
+            blockchain_tx=None,
+            amount=Decimal("50.0"),
+            recipient="0xabc",
+            method=PaymentMethod.TRANSFER,
+            status=PaymentStatus.COMPLETED,
+        )
+    )
+
+    intent = await client.create_payment_intent(
+        wallet_id="wallet-1", recipient="0xabc", amount="50.0"
+    )
+    results = await asyncio.gather(
+        client.confirm_payment_intent(intent.id),
+        client.confirm_payment_intent(intent.id),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(r, ValidationError) for r in results) == 1
+    assert client._router.pay.await_count == 1
+    stored = await client.get_payment_intent(intent.id)
+    assert stored.status == PaymentIntentStatus.SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_create_intent_failed_key_can_be_retried(client):
+    """A failed keyed request frees its key for a retry."""
+    from omniclaw.core.types import SimulationResult
+
+    client._wallet_service.get_usdc_balance_amount = lambda wid: Decimal("10.0")
+    client._router.simulate = AsyncMock(
+        return_value=SimulationResult(would_succeed=True, route=PaymentMethod.TRANSFER)
+    )
+
+    with pytest.raises(PaymentError):
+        await client.create_payment_intent(
+            wallet_id="wallet-1", recipient="0xabc", amount="50.0", idempotency_key="key-2"
+        )
+
+    client._wallet_service.get_usdc_balance_amount = lambda wid: Decimal("100.0")
+    intent = await client.create_payment_intent(
+        wallet_id="wallet-1", recipient="0xabc", amount="50.0", idempotency_key="key-2"
+    )
+    assert intent.amount == Decimal("50.0")
+
+
+@pytest.mark.asyncio
+async def test_idempotency_claim_expires_sooner_than_completed_record(monkeypatch):
+    """A stale in-flight claim frees its key quickly; completion keeps it for the TTL."""
+    from omniclaw.intents import idempotency
+    from omniclaw.intents.idempotency import IdempotencyService, IdempotencyStatus
+    from omniclaw.storage import InMemoryStorage
+
+    now = [1_000.0]
+    monkeypatch.setattr(idempotency.time, "time", lambda: now[0])
+    service = IdempotencyService(InMemoryStorage(), ttl=3600, claim_ttl=60)
+
+    assert await service.claim("k", "h") is None
+    pending = await service.claim("k", "h")
+    assert pending is not None and pending.status is IdempotencyStatus.PENDING
+
+    # The claimant died without completing: the key is released after claim_ttl
+    now[0] += 61
+    assert await service.claim("k", "h") is None
+
+    await service.complete("k", {"intent_id": "i-1"})
+    now[0] += 600
+    record = await service.claim("k", "h")
+    assert record is not None and record.status is IdempotencyStatus.COMPLETED
+    assert record.expires_at == 1_061.0 + 3600
+
+    # Expired records are never returned as hits
+    now[0] += 3600
+    assert await service.claim("k", "h") is None
+
+
+@pytest.mark.asyncio
+async def test_transition_checks_expected_status(client):
+    """transition() writes the new status only from the expected one."""
+    service = client._intent_service
+    intent = await service.create(wallet_id="wallet-1", recipient="0xabc", amount=Decimal("5.0"))
+
+    await service.transition(
+        intent, PaymentIntentStatus.REQUIRES_CONFIRMATION, PaymentIntentStatus.PROCESSING
+    )
+    assert (await service.get(intent.id)).status == PaymentIntentStatus.PROCESSING
+
+    with pytest.raises(ValidationError):
+        await service.transition(
+            intent, PaymentIntentStatus.REQUIRES_CONFIRMATION, PaymentIntentStatus.PROCESSING
+        )
+
+
+@pytest.mark.asyncio
+async def test_transition_compares_stored_status(client):
+    """A stale in-memory copy cannot overwrite a status another caller already moved."""
+    import asyncio
+
+    service = client._intent_service
+    created = await service.create(wallet_id="wallet-1", recipient="0xabc", amount=Decimal("5.0"))
+    first, second = await service.get(created.id), await service.get(created.id)
+
+    results = await asyncio.gather(
+        *(
+            service.transition(
+                copy, PaymentIntentStatus.REQUIRES_CONFIRMATION, PaymentIntentStatus.PROCESSING
+            )
+            for copy in (first, second)
+        ),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(r, ValidationError) for r in results) == 1
+    assert (await service.get(created.id)).status == PaymentIntentStatus.PROCESSING
+
+
+@pytest.mark.asyncio
+async def test_expired_intent_is_canceled_on_confirm(client):
+    """An intent past its deadline is canceled instead of confirmed."""
+    from datetime import datetime, timedelta, timezone
+
+    service = client._intent_service
+    intent = await service.create(
+        wallet_id="wallet-1", recipient="0xabc", amount=Decimal("5.0"), expires_in=60
+    )
+    assert intent.expires_at.tzinfo is not None
+
+    intent.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    await service._save(intent)
+
+    with pytest.raises(ValidationError, match="expired"):
+        await client.confirm_payment_intent(intent.id)
+    assert (await service.get(intent.id)).status == PaymentIntentStatus.CANCELED
+
+
+def test_naive_intent_timestamps_load_as_utc():
+    """Intents stored before timestamps were timezone-aware still load."""
+    from datetime import timezone
+
+    from omniclaw.core.types import PaymentIntent
+
+    intent = PaymentIntent.from_dict(
+        {
+            "id": "intent-1",
+            "wallet_id": "wallet-1",
+            "recipient": "0xabc",
+            "amount": "5.0",
+            "currency": "USDC",
+            "status": "requires_confirmation",
+            "created_at": "2025-01-01T00:00:00",
+            "expires_at": "2025-01-01T01:00:00",
+        }
+    )
+    assert intent.created_at.tzinfo is timezone.utc
+    assert intent.expires_at.tzinfo is timezone.utc
+
+
+@pytest.mark.asyncio
+async def test_failed_intent_write_releases_reservation(client):
+    """If the intent write fails, the concurrently made reservation is rolled back."""
+    from omniclaw.core.types import SimulationResult
+
+    client._wallet_service.get_usdc_balance_amount = lambda wid: Decimal("100.0")
+    client._router.simulate = AsyncMock(
+        return_value=SimulationResult(would_succeed=True, route=PaymentMethod.TRANSFER)
+    )
+    client._intent_service.create = AsyncMock(side_effect=RuntimeError("storage down"))
+
+    with pytest.raises(RuntimeError):
+        await client.create_payment_intent(wallet_id="wallet-1", recipient="0xabc", amount="10.0")
+
+    assert await client._reservation.get_reserved_total("wallet-1") == Decimal("0")
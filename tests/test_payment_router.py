@@ -299,6 +299,26 @@ class TestPaymentRouterDetection:
         assert payment_router.can_handle("0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0") is True
         assert payment_router.can_handle("https://api.example.com") is False
 
+    def test_detection_cached_until_adapters_change(
+        self,
+        payment_router: PaymentRouter,
+        mock_config: Config,
+        mock_wallet_service: MagicMock,
+    ) -> None:
+        """Repeat lookups skip supports(); registering an adapter resets the cache."""
+        from omniclaw.protocols.x402 import X402Adapter
+
+        url = "https://api.example.com"
+        adapter = payment_router.get_adapters()[0]
+        adapter.supports = MagicMock(wraps=adapter.supports)
+
+        assert payment_router.detect_method(url) is None
+        assert payment_router.detect_method(url) is None
+        assert adapter.supports.call_count == 1
+
+        payment_router.register_adapter(X402Adapter(mock_config, mock_wallet_service))
+        assert payment_router.detect_method(url) == PaymentMethod.X402
+
 
 @pytest.mark.asyncio
 class TestPaymentRouterPay:
@@ -361,6 +381,49 @@ class TestPaymentRouterPay:
         assert "BudgetGuard" in result.guards_passed
         assert "RateLimitGuard" in result.guards_passed
 
+    async def test_pay_preselected_method_skips_detection(
+        self,
+        payment_router: PaymentRouter,
+        mock_wallet_service: MagicMock,
+    ) -> None:
+        """A preselected method picks its adapter without probing supports()."""
+        mock_wallet_service.transfer.return_value = TransferResult(
+            success=True,
+            transaction=TransactionInfo(id="tx-123", state=TransactionState.COMPLETE),
+        )
+        adapter = payment_router.get_adapters()[0]
+        adapter.supports = MagicMock(wraps=adapter.supports)
+
+        result = await payment_router.pay(
+            wallet_id="wallet-123",
+            recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
+            amount="10.00",
+            preselected_method=PaymentMethod.TRANSFER,
+        )
+
+        assert result.method == PaymentMethod.TRANSFER
+        adapter.supports.assert_not_called()
+
+    async def test_pay_unregistered_preselected_method_falls_back(
+        self,
+        payment_router: PaymentRouter,
+        mock_wallet_service: MagicMock,
+    ) -> None:
+        """A preselected method without a registered adapter falls back to detection."""
+        mock_wallet_service.transfer.return_value = TransferResult(
+            success=True,
+            transaction=TransactionInfo(id="tx-123", state=TransactionState.COMPLETE),
+        )
+
+        result = await payment_router.pay(
+            wallet_id="wallet-123",
+            recipient="0x742d35Cc6634C0532925a3b844Bc9e7595f5e4a0",
+            amount="10.00",
+            preselected_method=PaymentMethod.X402,
+        )
+
+        assert result.method == PaymentMethod.TRANSFER
+
 
 @pytest.mark.asyncio
 class TestPaymentRouterSimulate:
@@ -114,3 +114,39 @@ async def test_simulation_guards_passed(client):
 
     assert res_fail.would_succeed is False
     assert "Would be blocked by guard" in res_fail.reason
+
+
+@pytest.mark.asyncio
+async def test_pay_reuses_simulated_trust_verdict(client):
+    """A pay() right after an approved simulate() does not re-run the Trust Gate."""
+    from omniclaw.core.types import PaymentResult, PaymentStatus, SimulationResult
+    from omniclaw.identity.types import TrustCheckResult, TrustVerdict
+
+    client._wallet_service.get_usdc_balance_amount = lambda wid: Decimal("100.0")
+    client._router.simulate = AsyncMock(
+        return_value=SimulationResult(would_succeed=True, route=PaymentMethod.TRANSFER)
+    )
+    client._router.pay = AsyncMock(
+        return_value=PaymentResult(
+            success=True,
+            transaction_id="tx-1",
+            blockchain_tx="0x1",
+            amount=Decimal("10.0"),
+            recipient="0xabc",
+            method=PaymentMethod.TRANSFER,
+            status=PaymentStatus.COMPLETED,
+        )
+    )
+    client._trust_gate.evaluate = AsyncMock(
+        return_value=TrustCheckResult(identity_found=False, verdict=TrustVerdict.APPROVED)
+    )
+
+    await client.simulate(wallet_id="wallet-1", recipient="0xabc", amount=Decimal("10.0"))
+    result = await client.pay(wallet_id="wallet-1", recipient="0xabc", amount=Decimal("10.0"))
+
+    assert result.success is True
+    assert client._trust_gate.evaluate.await_count == 1
+
+    # The cached verdict is single-use
+    await client.pay(wallet_id="wallet-1", recipient="0xabc", amount=Decimal("10.0"))
+    assert client._trust_gate.evaluate.await_count == 2
@@ -557,6 +557,18 @@ class TestERC8004Helpers:
         result = build_agent_registry_string("ETH")
         assert result == "eip155:1:0x8004A169FB4a3325136EB29fA0ceB6D2e539a432"
 
+    def test_network_enum_and_string_keys_agree(self):
+        from omniclaw.core.erc8004 import (
+            build_agent_registry_string,
+            get_chain_id,
+            get_identity_registry,
+        )
+        from omniclaw.core.types import Network
+        assert get_identity_registry(Network.ETH_SEPOLIA) == get_identity_registry("eth-sepolia")
+        assert get_chain_id(Network.BASE_SEPOLIA) == get_chain_id("base-sepolia") == 84532
+        assert build_agent_registry_string(Network.ETH) == build_agent_registry_string("eth")
+        assert build_agent_registry_string(Network.BASE) is None  # no identity registry
+
     def test_unsupported_network(self):
         from omniclaw.core.erc8004 import is_erc8004_supported
         assert is_erc8004_supported("ETH") is True
@@ -578,6 +590,78 @@ class TestERC8004Helpers:
         assert "readFeedback" in func_names
         assert "getClients" in func_names
 
+    def test_registry_addresses_are_checksummed(self):
+        keccak = pytest.importorskip("Crypto.Hash.keccak")
+        from omniclaw.core.erc8004 import (
+            IDENTITY_REGISTRY_ADDRESSES,
+            REPUTATION_REGISTRY_ADDRESSES,
+        )
+        addresses = [*IDENTITY_REGISTRY_ADDRESSES.values(), *REPUTATION_REGISTRY_ADDRESSES.values()]
+        for address in addresses:
+            body = address[2:].lower()
+            digest = keccak.new(digest_bits=256, data=body.encode()).hexdigest()
+            expected = "".join(
+                c.upper() if c.isalpha() and int(digest[i], 16) >= 8 else c
+                for i, c in enumerate(body)
+            )
+            assert address == "0x" + expected
+
+    def test_abis_are_read_only(self):
+        from omniclaw.core.erc8004 import IDENTITY_REGISTRY, IDENTITY_REGISTRY_ABI
+        assert isinstance(IDENTITY_REGISTRY_ABI, tuple)
+        entry = IDENTITY_REGISTRY.by_name("register", 2)
+        assert entry in IDENTITY_REGISTRY_ABI
+        assert isinstance(entry["inputs"][1]["components"], tuple)
+        with pytest.raises(TypeError):
+            entry["name"] = "other"
+
+    def test_register_overloads_share_descriptors(self):
+        from omniclaw.core.erc8004 import IDENTITY_REGISTRY
+        with_uri = IDENTITY_REGISTRY.by_name("register", 1)
+        with_metadata = IDENTITY_REGISTRY.by_name("register", 2)
+        assert with_uri["inputs"][0] is with_metadata["inputs"][0]
+        assert with_uri["outputs"][0] is IDENTITY_REGISTRY.by_name("register", 0)["outputs"][0]
+
+    def test_unnamed_outputs_are_shared(self):
+        from omniclaw.core.erc8004 import IDENTITY_REGISTRY, VALIDATION_REGISTRY
+        assert (
+            IDENTITY_REGISTRY.by_name("ownerOf", 1)["outputs"][0]
+            is IDENTITY_REGISTRY.by_name("getAgentWallet", 1)["outputs"][0]
+        )
+        assert (
+            VALIDATION_REGISTRY.by_name("getAgentValidations", 1)["outputs"][0]
+            is VALIDATION_REGISTRY.by_name("getValidatorRequests", 1)["outputs"][0]
+        )
+
+    def test_abi_dispatch_tables(self):
+        from omniclaw.core.erc8004 import (
+            IDENTITY_REGISTRY,
+            IDENTITY_REGISTRY_ABI,
+            REPUTATION_REGISTRY,
+            VALIDATION_REGISTRY,
+            AbiRegistry,
+        )
+        assert not IDENTITY_REGISTRY.by_name("register", 0)["inputs"]
+        assert IDENTITY_REGISTRY.signature("register", 2) == "register(string,(string,bytes)[])"
+        assert IDENTITY_REGISTRY.selector("register", 2) == "8ea42286"
+        assert VALIDATION_REGISTRY.selector("getSummary", 3) == "1b7cabd6"
+        assert REPUTATION_REGISTRY.selector("getSummary", 4) == "81bbba58"
+        # every function in every ABI has a known selector
+        for registry in (IDENTITY_REGISTRY, REPUTATION_REGISTRY, VALIDATION_REGISTRY):
+            assert len(registry.selectors) == len(registry.entries)
+
+        fresh = AbiRegistry(IDENTITY_REGISTRY_ABI)
+        assert "_by_name" not in vars(fresh)
+        fresh.selector("ownerOf", 1)
+        assert "_by_name" in vars(fresh)
+
+    def test_function_selectors_match_keccak(self):
+        keccak = pytest.importorskip("Crypto.Hash.keccak")
+        from omniclaw.core.erc8004 import FUNCTION_SELECTORS
+        for signature, selector in FUNCTION_SELECTORS.items():
+            digest = keccak.new(digest_bits=256, data=signature.encode()).hexdigest()
+            assert digest[:8] == selector, signature
+
     def test_get_validation_registry(self):
         """get_validation_registry returns None (not deployed yet)."""
         from omniclaw.core.erc8004 import get_validation_registry
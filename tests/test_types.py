@@ -1,5 +1,6 @@
 """Unit tests for types module."""
 
+import uuid
 from datetime import datetime
 from decimal import Decimal
 
@@ -21,6 +22,8 @@ from omniclaw.core.types import (
     WalletInfo,
     WalletSetInfo,
     WalletState,
+    as_decimal,
+    uuid4_str,
 )
 
 
@@ -44,6 +47,11 @@ class TestNetworkEnum:
         assert Network.from_string("sol-devnet") == Network.SOL_DEVNET
         assert Network.from_string("eth-sepolia") == Network.ETH_SEPOLIA
 
+    def test_from_string_accepts_members(self) -> None:
+        """Test from_string returns Network members unchanged."""
+        assert Network.from_string(Network.BASE) is Network.BASE
+        assert Network.from_string("arc_testnet") is Network.ARC_TESTNET
+
     def test_from_string_unknown_raises(self) -> None:
         """Test from_string raises for unknown network."""
         with pytest.raises(ValueError, match="Unknown network"):
@@ -126,6 +134,19 @@ class TestTokenInfo:
         assert token.token_address is None
         assert token.standard is None
 
+    def test_is_usdc(self) -> None:
+        """USDC is recognized by mainnet or testnet symbol, case-insensitively."""
+
+        def token(symbol: str) -> TokenInfo:
+            return TokenInfo(
+                id="t", blockchain="ETH", symbol=symbol, name="", decimals=6, is_native=False
+            )
+
+        assert token("USDC").is_usdc is True
+        assert token("usdc-testnet").is_usdc is True
+        assert token("EURC").is_usdc is False
+        assert token("USDC") == token("USDC")
+
 
 class TestBalance:
     """Tests for Balance dataclass."""
@@ -353,3 +374,31 @@ class TestSimulationResult:
         assert result.would_succeed is False
         assert "BudgetGuard" in result.guards_that_would_fail
         assert result.reason == "Budget exceeded: 95/100 daily"
+
+
+class TestAsDecimal:
+    """Tests for the amount normalizer."""
+
+    def test_decimal_passes_through(self) -> None:
+        amount = Decimal("10.50")
+        assert as_decimal(amount) is amount
+
+    @pytest.mark.parametrize("value", ["10.50", 10.5])
+    def test_other_types_are_parsed(self, value) -> None:
+        assert as_decimal(value) == Decimal("10.50")
+
+    def test_int(self) -> None:
+        assert as_decimal(3) == Decimal("3")
+
+
+class TestUuid4Str:
+    """Tests for generated idempotency keys."""
+
+    def test_generated_keys_are_uuid4(self) -> None:
+        keys = {uuid4_str() for _ in range(100)}
+        assert len(keys) == 100
+        for key in keys:
+            parsed = uuid.UUID(key)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == key
@@ -1,16 +1,27 @@
 """Unit tests for WalletService."""
 
+import base64
+from datetime import datetime, timezone
 from decimal import Decimal
+from enum import Enum
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
+from omniclaw.core import circle_client as circle_client_module
+from omniclaw.core.circle_client import CircleClient
 from omniclaw.core.config import Config
-from omniclaw.core.exceptions import InsufficientBalanceError, WalletError
+from omniclaw.core.exceptions import (
+    ConfigurationError,
+    InsufficientBalanceError,
+    WalletError,
+)
 from omniclaw.core.types import (
     AccountType,
     Balance,
     CustodyType,
+    FeeLevel,
     Network,
     TokenInfo,
     TransactionInfo,
@@ -551,3 +562,331 @@ class TestTransferResult:
         )
 
         assert result.is_pending is False
+
+
+class TestSharedApiClient:
+    """Tests for SDK client sharing across CircleClient instances."""
+
+    def test_same_credentials_share_one_sdk_client(
+        self, mock_config: Config, monkeypatch
+    ) -> None:
+        init = MagicMock(side_effect=lambda **_: MagicMock())
+        monkeypatch.setattr(
+            circle_client_module.utils, "init_developer_controlled_wallets_client", init
+        )
+        monkeypatch.setattr(circle_client_module, "_API_CLIENTS", {})
+        monkeypatch.setattr(circle_client_module, "_API_CLIENT_REFS", {})
+
+        first = CircleClient(mock_config)
+        second = CircleClient(mock_config)
+        other = CircleClient(
+            Config(
+                circle_api_key="other_key",
+                entity_secret="test_secret",
+                network=Network.ARC_TESTNET,
+            )
+        )
+
+        assert first._client is second._client
+        assert other._client is not first._client
+        assert init.call_count == 2
+
+    def test_close_all_closes_and_forgets_clients(
+        self, mock_config: Config, monkeypatch
+    ) -> None:
+        init = MagicMock(side_effect=lambda **_: MagicMock())
+        monkeypatch.setattr(
+            circle_client_module.utils, "init_developer_controlled_wallets_client", init
+        )
+        monkeypatch.setattr(circle_client_module, "_API_CLIENTS", {})
+        monkeypatch.setattr(circle_client_module, "_API_CLIENT_REFS", {})
+
+        api_client = CircleClient(mock_config)._client
+        CircleClient.close_all()
+
+        api_client.close.assert_called_once()
+        assert CircleClient(mock_config)._client is not api_client
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_shared_client_after_last_user(
+        self, mock_config: Config, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(
+            circle_client_module.utils,
+            "init_developer_controlled_wallets_client",
+            MagicMock(side_effect=lambda **_: MagicMock()),
+        )
+        monkeypatch.setattr(circle_client_module, "_API_CLIENTS", {})
+        monkeypatch.setattr(circle_client_module, "_API_CLIENT_REFS", {})
+
+        first = CircleClient(mock_config)
+        second = CircleClient(mock_config)
+        api_client = first._client
+
+        await first.aclose()
+        await first.aclose()
+        api_client.close.assert_not_called()
+
+        await second.aclose()
+        api_client.close.assert_called_once()
+        assert CircleClient(mock_config)._client is not api_client
+
+    def test_ciphertext_is_fresh_per_call_and_decrypts_to_secret(self, monkeypatch) -> None:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = (
+            private_key.public_key()
+            .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.PKCS1)
+            .decode()
+        )
+        monkeypatch.setattr(
+            circle_client_module.utils,
+            "init_developer_controlled_wallets_client",
+            MagicMock(side_effect=lambda **_: MagicMock()),
+        )
+        monkeypatch.setattr(circle_client_module.utils, "get_public_key", lambda: pem)
+        monkeypatch.setattr(circle_client_module, "_API_CLIENTS", {})
+        monkeypatch.setattr(circle_client_module, "_API_CLIENT_REFS", {})
+        secret = "ab" * 32
+        client = CircleClient(
+            Config(circle_api_key="key", entity_secret=secret, network=Network.ARC_TESTNET)
+        )
+
+        first = client._get_ciphertext()
+        second = client._get_ciphertext()
+
+        assert first != second
+        for ciphertext in (first, second):
+            plain = private_key.decrypt(
+                base64.b64decode(ciphertext), circle_client_module._OAEP_SHA256
+            )
+            assert plain == bytes.fromhex(secret)
+
+    def test_ciphertext_rejects_short_entity_secret(self, monkeypatch) -> None:
+        monkeypatch.setattr(
+            circle_client_module.utils,
+            "init_developer_controlled_wallets_client",
+            MagicMock(side_effect=lambda **_: MagicMock()),
+        )
+        monkeypatch.setattr(circle_client_module, "_API_CLIENTS", {})
+        monkeypatch.setattr(circle_client_module, "_API_CLIENT_REFS", {})
+        client = CircleClient(
+            Config(circle_api_key="key", entity_secret="abcd", network=Network.ARC_TESTNET)
+        )
+
+        with pytest.raises(ConfigurationError):
+            client._get_ciphertext()
+
+    @pytest.mark.asyncio
+    async def test_aget_transaction_runs_sdk_call_off_the_event_loop(
+        self, mock_config: Config, monkeypatch
+    ) -> None:
+        import threading
+
+        monkeypatch.setattr(
+            circle_client_module.utils,
+            "init_developer_controlled_wallets_client",
+            MagicMock(side_effect=lambda **_: MagicMock()),
+        )
+        monkeypatch.setattr(circle_client_module, "_API_CLIENTS", {})
+        monkeypatch.setattr(circle_client_module, "_API_CLIENT_REFS", {})
+        client = CircleClient(mock_config)
+        tx = TransactionInfo(id="tx-1", state=TransactionState.COMPLETE)
+        threads = []
+
+        def get_transaction(transaction_id):
+            threads.append(threading.current_thread())
+            return tx
+
+        monkeypatch.setattr(client, "get_transaction", get_transaction)
+
+        assert await client.aget_transaction("tx-1") is tx
+        assert threads[0] is not threading.current_thread()
+
+
+SDK_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class SdkBlockchain(str, Enum):
+    """Stand-in for the SDK's Blockchain enum."""
+
+    ARC_TESTNET = "ARC-TESTNET"
+
+
+class SdkEnum(str, Enum):
+    """Stand-in for the SDK's state, custody and fee-level enums."""
+
+    DEVELOPER = "DEVELOPER"
+    LIVE = "LIVE"
+    SENT = "SENT"
+    COMPLETE = "COMPLETE"
+    MEDIUM = "MEDIUM"
+    ERC20 = "ERC20"
+
+
+class TestCircleClientResponseCache:
+    """Tests for CircleClient's in-process response caches."""
+
+    @pytest.fixture
+    def client(self, mock_config: Config, monkeypatch) -> CircleClient:
+        monkeypatch.setattr(
+            circle_client_module.utils,
+            "init_developer_controlled_wallets_client",
+            MagicMock(side_effect=lambda **_: MagicMock()),
+        )
+        monkeypatch.setattr(circle_client_module, "_API_CLIENTS", {})
+        monkeypatch.setattr(circle_client_module, "_API_CLIENT_REFS", {})
+        client = CircleClient(mock_config)
+        client._wallets_api = MagicMock()
+        client._transactions_api = MagicMock()
+        return client
+
+    def test_get_wallet_is_cached_until_invalidated(self, client: CircleClient) -> None:
+        response = client._wallets_api.get_wallet.return_value
+        response.data.wallet.actual_instance = SimpleNamespace(
+            id="wallet-123",
+            address="0xabc",
+            blockchain=SdkBlockchain.ARC_TESTNET,
+            create_date=SDK_DATE,
+            update_date=SDK_DATE,
+            custody_type=SdkEnum.DEVELOPER,
+            state=SdkEnum.LIVE,
+            wallet_set_id="ws-123",
+            account_type="EOA",
+            name=None,
+        )
+
+        first = client.get_wallet("wallet-123")
+        assert first.state == WalletState.LIVE
+        assert first.blockchain == "ARC-TESTNET"
+        assert first.create_date == SDK_DATE
+        first.name = "mutated"
+        cached = client.get_wallet("wallet-123")
+        assert cached is not first
+        assert cached.name is None
+        assert cached.address == first.address
+        client._wallets_api.get_wallet.assert_called_once()
+
+        client.invalidate("wallet-123")
+        client.get_wallet("wallet-123")
+        assert client._wallets_api.get_wallet.call_count == 2
+
+    def test_get_transaction_caches_only_terminal_states(self, client: CircleClient) -> None:
+        def sdk_transaction(state: str) -> SimpleNamespace:
+            return SimpleNamespace(
+                id="tx-1",
+                state=SdkEnum(state),
+                blockchain=SdkBlockchain.ARC_TESTNET,
+                tx_hash=None,
+                wallet_id="wallet-123",
+                source_address=None,
+                destination_address="0xdef",
+                token_id=None,
+                amounts=["1.5"],
+                fee_level=SdkEnum.MEDIUM,
+                create_date=SDK_DATE,
+                update_date=SDK_DATE,
+                error_reason=None,
+            )
+
+        response = client._transactions_api.get_transaction.return_value
+        response.data.transaction = sdk_transaction("SENT")
+        assert client.get_transaction("tx-1").state == TransactionState.SENT
+        response.data.transaction = sdk_transaction("COMPLETE")
+        tx = client.get_transaction("tx-1")
+        tx.amounts.append("2")
+        assert client.get_transaction("tx-1") == client.get_transaction("tx-1")
+        assert client.get_transaction("tx-1").amounts == ["1.5"]
+        tx.amounts.pop()
+
+        assert tx.state == TransactionState.COMPLETE
+        assert tx.blockchain == "ARC-TESTNET"
+        assert tx.amounts == ["1.5"]
+        assert tx.fee_level == FeeLevel.MEDIUM
+        assert client._transactions_api.get_transaction.call_count == 2
+
+    def test_get_wallet_balances_reads_sdk_models(self, client: CircleClient) -> None:
+        response = client._wallets_api.list_wallet_balance.return_value
+        token = SimpleNamespace(
+            id="usdc-token-id",
+            blockchain=SdkBlockchain.ARC_TESTNET,
+            is_native=False,
+            symbol="USDC",
+            name="USD Coin",
+            decimals=6,
+            token_address="0x3600",
+            standard=SdkEnum.ERC20,
+        )
+        response.data.token_balances = [SimpleNamespace(amount="12.34", token=token)]
+
+        balance = client.get_usdc_balance("wallet-123")
+
+        assert balance is not None
+        assert balance.amount == Decimal("12.34")
+        assert balance.token.id == "usdc-token-id"
+        assert balance.token.blockchain == "ARC-TESTNET"
+        assert balance.token.standard == "ERC20"
+
+    @pytest.mark.asyncio
+    async def test_get_wallet_balances_batch_limits_concurrency(
+        self, client: CircleClient, monkeypatch
+    ) -> None:
+        import threading
+        import time
+
+        lock = threading.Lock()
+        active = peak = 0
+
+        def get_wallet_balances(wallet_id: str) -> list[Balance]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return [MagicMock(name=wallet_id)]
+
+        monkeypatch.setattr(client, "get_wallet_balances", get_wallet_balances)
+        wallet_ids = [f"wallet-{i}" for i in range(8)]
+
+        result = await client.get_wallet_balances_batch(wallet_ids, concurrency=3)
+
+        assert list(result) == wallet_ids
+        assert 1 < peak <= 3
+
+    def test_list_wallets_sends_blockchain_as_string(self, client: CircleClient) -> None:
+        client._wallets_api.get_wallets.return_value.data.wallets = []
+
+        client.list_wallets(blockchain=Network.ETH_SEPOLIA)
+        client.list_wallets(blockchain="BASE-SEPOLIA")
+
+        calls = client._wallets_api.get_wallets.call_args_list
+        assert calls[0].kwargs["blockchain"] == "ETH-SEPOLIA"
+        assert type(calls[0].kwargs["blockchain"]) is str
+        assert calls[1].kwargs["blockchain"] == "BASE-SEPOLIA"
+
+    def test_api_instances_are_created_on_first_use(
+        self, mock_config: Config, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(
+            circle_client_module.utils,
+            "init_developer_controlled_wallets_client",
+            MagicMock(side_effect=lambda **_: MagicMock()),
+        )
+        monkeypatch.setattr(circle_client_module, "_API_CLIENTS", {})
+        monkeypatch.setattr(circle_client_module, "_API_CLIENT_REFS", {})
+        transactions_api = MagicMock()
+        monkeypatch.setattr(
+            circle_client_module.developer_controlled_wallets,
+            "TransactionsApi",
+            transactions_api,
+        )
+
+        client = CircleClient(mock_config)
+        transactions_api.assert_not_called()
+
+        assert client._transactions_api is client._transactions_api
+        transactions_api.assert_called_once_with(client._client)